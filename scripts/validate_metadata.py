@@ -5,20 +5,23 @@ Usage:
 """
 import json
 import sys
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools import schema_registry  # noqa: E402
+
+SCHEMA_NAME = 'out_audio.metadata.schema.json'
+
 
 def load_schema():
-    p = Path(__file__).resolve().parents[1] / 'schema' / 'out_audio.metadata.schema.json'
-    return json.loads(p.read_text(encoding='utf-8'))
+    return schema_registry.load_schema(SCHEMA_NAME)
 
 
 def validate_file(path):
-    schema = load_schema()
     data = json.loads(Path(path).read_text(encoding='utf-8'))
     try:
-        validate(instance=data, schema=schema)
+        schema_registry.validate(data, SCHEMA_NAME)
         print(f'VALID: {path}')
         return 0
     except ValidationError as e:
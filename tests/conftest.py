@@ -2,6 +2,8 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
+
 
 def pytest_configure(config):
     """Ensure the repository root is on sys.path so tests can import `tools`.
@@ -12,4 +14,17 @@ def pytest_configure(config):
     repo_root = Path(__file__).resolve().parents[1]
     repo_root_str = str(repo_root)
     if repo_root_str not in sys.path:
-        sys.path.insert(0, repo_root_str)
\ No newline at end of file
+        sys.path.insert(0, repo_root_str)
+
+@pytest.fixture(autouse=True)
+def isolated_cache_dir(tmp_path, monkeypatch):
+    """Keep on-disk lookup caches (see tools/disk_cache.py) out of the user's home."""
+    monkeypatch.setenv("RAILWEB_CACHE_DIR", str(tmp_path / "cache"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_status_db(tmp_path, monkeypatch):
+    """Keep the orchestrator run-status DB (runs/.runs_status.db) out of the repo."""
+    from tools.orchestrate import status_db
+
+    monkeypatch.setattr(status_db, "DB_PATH", tmp_path / "runs_status.db")
@@ -0,0 +1,81 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tools import adapter_client
+from tools.adapter_client import AdapterClient
+
+
+def start_server(statuses):
+    """Serve the given status codes in order (then 200s); record client ports."""
+    seen = {'ports': [], 'calls': 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_POST(self):
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            seen['ports'].append(self.client_address[1])
+            status = statuses[seen['calls']] if seen['calls'] < len(statuses) else 200
+            seen['calls'] += 1
+            body = json.dumps({'text': 'ok'}).encode()
+            self.send_response(status)
+            if status == 429:
+                self.send_header('Retry-After', '0')
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f'http://127.0.0.1:{server.server_port}/api/llm/summarizeRun', seen
+
+
+def test_client_reuses_connection():
+    server, url, seen = start_server([])
+    client = AdapterClient()
+    try:
+        for _ in range(5):
+            assert client.post(url, json={}, timeout=5).json() == {'text': 'ok'}
+    finally:
+        client.close()
+        server.shutdown()
+    assert len(set(seen['ports'])) == 1
+
+
+def test_client_retries_429_and_5xx():
+    server, url, seen = start_server([429, 503])
+    client = AdapterClient(retries=3, backoff_factor=0)
+    try:
+        resp = client.post(url, json={}, timeout=5)
+    finally:
+        client.close()
+        server.shutdown()
+    assert resp.status_code == 200
+    assert seen['calls'] == 3
+
+
+def test_non_idempotent_client_retries_only_429():
+    server, url, seen = start_server([429, 502, 200])
+    client = AdapterClient(retries=3, backoff_factor=0, idempotent=False)
+    try:
+        resp = client.post(url, json={}, timeout=5)
+    finally:
+        client.close()
+        server.shutdown()
+    assert resp.status_code == 502
+    assert seen['calls'] == 2
+
+
+def test_shared_client_is_singleton(monkeypatch):
+    adapter_client.reset_client()
+    monkeypatch.setenv('RAILWEB_ADAPTER_POOL_SIZE', '3')
+    try:
+        assert adapter_client.get_client() is adapter_client.get_client()
+        assert adapter_client.get_client(idempotent=False) is not adapter_client.get_client()
+    finally:
+        adapter_client.reset_client()
@@ -0,0 +1,117 @@
+import json
+
+import pytest
+
+from tools import artifact_to_jsonld as a2j
+
+
+def test_context_is_loaded_once(monkeypatch):
+    a2j.load_context()
+    calls = []
+    real = json.loads
+    monkeypatch.setattr(a2j.json, 'loads', lambda *args, **kw: calls.append(1) or real(*args, **kw))
+    for _ in range(3):
+        node = a2j.to_jsonld({'title': 'T', 'description': 'd'}, '')
+    assert calls == []
+    assert node['@context']['rw'] == 'https://railweb.local/vocab/'
+    node['@context']['rw'] = 'mutated'
+    assert a2j.load_context()['rw'] == 'https://railweb.local/vocab/'
+
+
+def test_context_references(tmp_path, monkeypatch):
+    assert a2j.context_reference('inline', tmp_path) is None
+    assert a2j.context_reference('url', tmp_path, 'https://example.org/ctx.jsonld') == 'https://example.org/ctx.jsonld'
+    monkeypatch.delenv('RAILWEB_JSONLD_CONTEXT_URL', raising=False)
+    with pytest.raises(ValueError):
+        a2j.context_reference('url', tmp_path)
+    with pytest.raises(ValueError):
+        a2j.context_reference('bogus', tmp_path)
+
+    rel = a2j.context_reference('relative', tmp_path)
+    assert (tmp_path / rel).resolve() == a2j.CONTEXT_PATH
+
+    out = tmp_path / 'export'
+    assert a2j.context_reference('shared', out) == 'context.jsonld'
+    shared = json.loads((out / 'context.jsonld').read_text())
+    assert shared['@context'] == a2j.load_context()
+    node = a2j.to_jsonld({'title': 'T'}, 'body', context='context.jsonld')
+    assert node['@context'] == 'context.jsonld' and node['description'] == 'body'
+
+
+def test_main_shared_context(tmp_path, capsys):
+    art = tmp_path / 'a.md'
+    art.write_text('---\ntitle: A\n---\nbody\n', encoding='utf8')
+    a2j.main([str(art), '--context', 'shared'])
+    node = json.loads(capsys.readouterr().out)
+    assert node['@context'] == 'context.jsonld'
+    assert (tmp_path / 'context.jsonld').exists()
+
+
+def test_shared_context_never_rewrites_source(monkeypatch):
+    source = a2j.CONTEXT_PATH.read_bytes()
+    stamp = a2j.CONTEXT_PATH.stat().st_mtime_ns
+    writes = []
+    monkeypatch.setattr(type(a2j.CONTEXT_PATH), 'write_text', lambda self, *a, **kw: writes.append(self))
+    assert a2j.context_reference('shared', a2j.CONTEXT_PATH.parent) == 'context.jsonld'
+    assert writes == []
+    assert a2j.CONTEXT_PATH.read_bytes() == source
+    assert a2j.CONTEXT_PATH.stat().st_mtime_ns == stamp
+
+
+def _corpus(root):
+    root.mkdir()
+    for i in range(5):
+        (root / f'a{i}.md').write_text(f'---\ntitle: Note {i}\ndate: 2024-01-0{i + 1}\n---\nbody {i}\n', encoding='utf8')
+    (root / 'sub').mkdir()
+    (root / 'sub' / 'b.md').write_text('---\ntitle: Nested\n---\n', encoding='utf8')
+    (root / 'plain.md').write_text('# no front matter\n', encoding='utf8')
+    return root
+
+
+def test_export_ndjson_parallel_matches_serial(tmp_path):
+    root = _corpus(tmp_path / 'intake')
+    serial, parallel = tmp_path / 'serial.ndjson', tmp_path / 'parallel.ndjson'
+    stats = a2j.export_ndjson(root, serial, jobs=1, context='context.jsonld')
+    assert stats == {'written': 6, 'skipped': 1, 'failed': 0, 'resumed': 0}
+    a2j.export_ndjson(root, parallel, jobs=2, context='context.jsonld')
+    assert serial.read_bytes() == parallel.read_bytes()
+    lines = serial.read_text(encoding='utf8').splitlines()
+    nodes = [json.loads(line) for line in lines]
+    assert [n['title'] for n in nodes] == ['Note 0', 'Note 1', 'Note 2', 'Note 3', 'Note 4', 'Nested']
+    assert nodes[0]['@context'] == 'context.jsonld' and nodes[0]['description'] == 'body 0'
+    assert ': ' not in lines[0]
+
+
+def test_export_ndjson_resume_truncates_partial_tail(tmp_path):
+    root = _corpus(tmp_path / 'intake')
+    full = tmp_path / 'full.ndjson'
+    a2j.export_ndjson(root, full)
+    expected = full.read_bytes()
+
+    out = tmp_path / 'out.ndjson'
+    first_line = expected.split(b'\n', 1)[0] + b'\n'
+    # a crashed export: one checkpointed node, then half a line
+    out.write_bytes(first_line + b'{"@id": "partial')
+    a2j._save_manifest(out, {'offset': len(first_line), 'done': ['a0.md']})
+
+    stats = a2j.export_ndjson(root, out, resume=True)
+    assert stats['resumed'] == 1 and stats['written'] == 5
+    assert out.read_bytes() == expected
+    assert len(json.loads(a2j.manifest_path(out).read_text())['done']) == 7
+
+
+@pytest.mark.parametrize('damage', ['missing', 'shorter'])
+def test_export_ndjson_resume_restarts_when_output_lost(tmp_path, damage):
+    root = _corpus(tmp_path / 'intake')
+    out = tmp_path / 'out.ndjson'
+    a2j.export_ndjson(root, out)
+    expected = out.read_bytes()
+    if damage == 'missing':
+        out.unlink()
+    else:
+        out.write_bytes(expected[:10])
+
+    stats = a2j.export_ndjson(root, out, resume=True)
+    assert stats['resumed'] == 0 and stats['written'] == 6
+    assert out.read_bytes() == expected
+    assert b'\x00' not in out.read_bytes()
@@ -0,0 +1,65 @@
+import json
+import subprocess
+import threading
+
+from tools.orchestrate import debate_runner
+
+
+def test_run_debate_inproc_captures_output_and_history(monkeypatch):
+    def fake(out=None, adapter_url=None):
+        print('Round 1', file=out)
+        print('agent: hello', file=out)
+        return [['agent: hello']]
+
+    monkeypatch.setattr(debate_runner, 'run_real_debate', fake)
+    result = debate_runner.run_debate(mode='inproc')
+    assert result['mode'] == 'inproc' and result['ok'] is True
+    assert result['output'] == 'Round 1\nagent: hello\n'
+    assert result['history'] == [['agent: hello']]
+    assert result['duration_s'] >= 0
+
+
+def test_run_debate_inproc_reports_exceptions(monkeypatch):
+    def boom(out=None, adapter_url=None):
+        raise RuntimeError('adapter exploded')
+
+    monkeypatch.setattr(debate_runner, 'run_real_debate', boom)
+    result = debate_runner.run_debate(mode='inproc')
+    assert result['ok'] is False
+    assert 'RuntimeError: adapter exploded' in result['output']
+
+
+def test_run_debate_inproc_timeout(monkeypatch):
+    release = threading.Event()
+    monkeypatch.setattr(debate_runner, 'run_real_debate', lambda out=None: release.wait(5))
+    try:
+        result = debate_runner.run_debate(timeout=0.05, mode='inproc')
+    finally:
+        release.set()
+    assert result['ok'] is False
+    assert 'timed out' in result['output']
+
+
+def test_run_debate_subprocess_mode_from_env(monkeypatch):
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append((cmd, kwargs))
+        return subprocess.CompletedProcess(cmd, 0, stdout='Round 1\n', stderr='')
+
+    monkeypatch.setenv('RAILWEB_RUNNER_MODE', 'subprocess')
+    monkeypatch.setattr(debate_runner.subprocess, 'run', fake_run)
+    result = debate_runner.run_debate()
+    assert result['mode'] == 'subprocess' and result['ok'] is True
+    assert result['output'] == 'Round 1\n' and result['history'] is None
+    cmd, kwargs = calls[0]
+    assert cmd[1:] == ['-m', 'tools.debate.run_real_debate']
+    assert kwargs['cwd'] == debate_runner.REPO
+
+
+def test_write_results(tmp_path):
+    result = {'mode': 'inproc', 'ok': True, 'output': 'Round 1\n', 'history': [['a']], 'duration_s': 0.1}
+    path = debate_runner.write_results(tmp_path, result)
+    assert path.read_text() == 'Round 1\n'
+    data = json.loads((tmp_path / 'results.json').read_text())
+    assert data == {'mode': 'inproc', 'ok': True, 'duration_s': 0.1, 'history': [['a']]}
@@ -0,0 +1,101 @@
+"""Tests for the persistent lookup cache and its Wikidata call sites."""
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+from disk_cache import MISS, DiskCache, wikidata_cache
+
+
+def test_get_set_and_stats(tmp_path):
+    cache = DiskCache(tmp_path / 'c.sqlite')
+    assert cache.get('a') is MISS
+    cache.set('a', {'x': [1, 2]})
+    assert cache.get('a') == {'x': [1, 2]}
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_ttl_expiry_and_negative_entries(tmp_path):
+    cache = DiskCache(tmp_path / 'c.sqlite', ttl=60, negative_ttl=0.05)
+    cache.set_miss('nothing')
+    cache.set('q', 'Q1')
+    assert cache.get('nothing') is None
+    assert cache.stats()['negative_hits'] == 1
+    time.sleep(0.1)
+    assert cache.get('nothing') is MISS
+    assert cache.get('q') == 'Q1'
+
+
+def test_lru_eviction(tmp_path):
+    cache = DiskCache(tmp_path / 'c.sqlite', max_entries=2)
+    cache.set('a', 1)
+    time.sleep(0.01)
+    cache.set('b', 2)
+    time.sleep(0.01)
+    cache.get('a')  # 'b' is now least recently used
+    time.sleep(0.01)
+    cache.set('c', 3)
+    assert len(cache) == 2
+    assert cache.get('b') is MISS
+    assert cache.get('a') == 1
+    assert cache.stats()['evictions'] == 1
+
+
+def test_persists_across_instances(tmp_path):
+    DiskCache(tmp_path / 'c.sqlite').set('k', 'v')
+    assert DiskCache(tmp_path / 'c.sqlite').get('k') == 'v'
+
+
+def test_wikidata_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setenv('RAILWEB_WIKIDATA_CACHE', 'off')
+    assert wikidata_cache() is None
+
+
+class _FakeResponse:
+    def __init__(self, payload):
+        self._payload = payload
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        return self._payload
+
+
+def test_search_is_served_from_cache(monkeypatch):
+    import qid_discovery
+
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        calls.append(params['search'])
+        if params['search'] == 'Nowhere Junction':
+            return _FakeResponse({'search': []})
+        return _FakeResponse({'search': [{'id': 'Q1234'}]})
+
+    monkeypatch.setattr(qid_discovery.requests, 'get', fake_get)
+    for _ in range(3):
+        assert qid_discovery.search_wikidata_for_entity('Camden Station') == 'Q1234'
+        assert qid_discovery.search_wikidata_for_entity('Nowhere Junction') is None
+    assert calls == ['Camden Station', 'Nowhere Junction']
+
+
+def test_enrich_with_wikidata_is_served_from_cache(monkeypatch):
+    import enrich_adapter
+
+    calls = []
+
+    def fake_fetch(qid):
+        calls.append(qid)
+        return {'label': 'Douglas Adams', 'birth': '1952-03-11', 'death': '2001-05-11'}
+
+    monkeypatch.setattr(enrich_adapter, 'VAULT_AVAILABLE', True)
+    monkeypatch.setattr(enrich_adapter, 'fetch_label_birth_death', fake_fetch)
+    monkeypatch.setattr(enrich_adapter, 'fetch_entity', lambda qid: {'claims': {'P31': []}})
+    first = enrich_adapter.enrich_with_wikidata('Q42')
+    second = enrich_adapter.enrich_with_wikidata('Q42')
+    assert first == second
+    assert second['label'] == 'Douglas Adams'
+    assert calls == ['Q42']
@@ -1,8 +1,11 @@
 from pathlib import Path
 import json
 import subprocess
+import sys
 import tempfile
 
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
 
 def test_enrich_adapter_no_qids(tmp_path):
     """Test adapter with artifact that has no wikidata_qids."""
@@ -66,4 +69,103 @@ Author of The Hitchhiker's Guide to the Galaxy.''')
     assert data['title'] == 'Douglas Adams'
     assert 'wikidata_enrichment' in data
     assert 'Q42' in data['wikidata_enrichment']
-    assert data['sameAs'] == 'https://www.wikidata.org/wiki/Q42'
\ No newline at end of file
+    assert data['sameAs'] == 'https://www.wikidata.org/wiki/Q42'
+
+
+class _FakeEntitiesResponse:
+    def __init__(self, ids):
+        self._ids = ids
+
+    def raise_for_status(self):
+        return None
+
+    def json(self):
+        entities = {}
+        for qid in self._ids:
+            if qid == 'Q999999999':
+                entities[qid] = {'id': qid, 'missing': ''}
+                continue
+            entities[qid] = {
+                'id': qid,
+                'labels': {'en': {'language': 'en', 'value': f'Label {qid}'}},
+                'claims': {'P569': [{'mainsnak': {'datavalue': {'value': {'time': '+1952-03-11T00:00:00Z'}}}}]},
+            }
+        return {'entities': entities}
+
+
+def test_batch_enrichment_groups_qids_into_chunks(monkeypatch):
+    import enrich_adapter
+
+    calls = []
+
+    def fake_get(url, params=None, timeout=None):
+        ids = params['ids'].split('|')
+        assert params['action'] == 'wbgetentities'
+        calls.append(ids)
+        return _FakeEntitiesResponse(ids)
+
+    monkeypatch.setattr(enrich_adapter, 'VAULT_AVAILABLE', True)
+    monkeypatch.setattr(enrich_adapter.requests, 'get', fake_get)
+    qids = [f'Q{i}' for i in range(1, 121)] + ['Q999999999']
+    result = enrich_adapter.enrich_with_wikidata_batch(qids)
+
+    assert sorted(len(c) for c in calls) == [21, 50, 50]
+    assert list(result) == qids
+    assert result['Q7']['label'] == 'Label Q7'
+    assert result['Q7']['birth_date'] == '1952-03-11'
+    assert result['Q7']['wikidata_url'] == 'https://www.wikidata.org/wiki/Q7'
+    assert 'P569' in result['Q7']['properties']
+    assert 'error' in result['Q999999999']
+
+    # second pass is served from the on-disk cache except the missing entity
+    calls.clear()
+    enrich_adapter.enrich_with_wikidata_batch(qids)
+    assert calls == [['Q999999999']]
+
+
+def test_batch_enrichment_falls_back_per_qid_on_error(monkeypatch):
+    import enrich_adapter
+
+    def failing_get(url, params=None, timeout=None):
+        raise ConnectionError('offline')
+
+    monkeypatch.setattr(enrich_adapter, 'VAULT_AVAILABLE', True)
+    monkeypatch.setattr(enrich_adapter.requests, 'get', failing_get)
+    monkeypatch.setattr(enrich_adapter, 'enrich_with_wikidata', lambda qid: {'qid': qid, 'label': 'single'})
+    result = enrich_adapter.enrich_with_wikidata_batch(['Q1', 'Q2'])
+    assert result == {'Q1': {'qid': 'Q1', 'label': 'single'}, 'Q2': {'qid': 'Q2', 'label': 'single'}}
+
+
+def test_batch_enrichment_offline_uses_stubs_without_network(monkeypatch):
+    import enrich_adapter
+
+    calls = []
+
+    def no_network(*args, **kwargs):
+        calls.append(args)
+        raise ConnectionError('network call in stub mode')
+
+    monkeypatch.setattr(enrich_adapter, 'VAULT_AVAILABLE', False)
+    monkeypatch.setattr(enrich_adapter.requests, 'get', no_network)
+    monkeypatch.setattr(enrich_adapter, 'fetch_label_birth_death', lambda qid: {'label': f'STUB-{qid}'})
+    monkeypatch.setattr(enrich_adapter, 'fetch_entity', lambda qid: {'id': qid})
+    result = enrich_adapter.enrich_with_wikidata_batch(['Q1', 'Q2', 'Q1'])
+    assert list(result) == ['Q1', 'Q2']
+    assert result['Q1']['label'] == 'STUB-Q1'
+    assert calls == []
+
+
+def test_batch_and_single_enrichment_do_not_share_cache_entries(monkeypatch):
+    import enrich_adapter
+    from disk_cache import MISS, wikidata_cache
+
+    monkeypatch.setattr(enrich_adapter, 'VAULT_AVAILABLE', True)
+    monkeypatch.setattr(enrich_adapter.requests, 'get',
+                        lambda url, params=None, timeout=None: _FakeEntitiesResponse(params['ids'].split('|')))
+    batch = enrich_adapter.enrich_with_wikidata_batch(['Q7'])['Q7']
+    assert wikidata_cache().get('entity:Q7') is MISS
+
+    # a single-path entry of the other shape is not picked up by the batch path
+    wikidata_cache().set('entity:Q8', {'qid': 'Q8', 'label': 'single shape'})
+    assert enrich_adapter.enrich_with_wikidata_batch(['Q8'])['Q8']['label'] == 'Label Q8'
+    assert batch['birth_date'] == '1952-03-11'
@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from tools import front_matter
+from tools.artifact_to_jsonld import load_front_matter, to_jsonld
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    front_matter.clear_cache()
+    yield
+    front_matter.clear_cache()
+
+
+def write(path, text):
+    path.write_text(text, encoding='utf8')
+    return path
+
+
+def test_reads_header_and_lazy_body(tmp_path):
+    p = write(tmp_path / 'a.md', '---\ntitle: A\ntags: [x]\n---\n\n# Body\n\nText with --- inside\n')
+    doc = front_matter.read_front_matter(p)
+    assert doc.data == {'title': 'A', 'tags': ['x']}
+    assert doc._body is None
+    assert doc.body == '# Body\n\nText with --- inside'
+
+
+def test_matches_legacy_split(tmp_path):
+    text = '---\r\ntitle: Windows\r\ndescription: d\r\n---\r\nbody line\r\n'
+    p = tmp_path / 'w.md'
+    p.write_bytes(text.encode('utf8'))
+    parts = text.split('---', 2)
+    doc = front_matter.read_front_matter(p)
+    assert doc.data == {'title': 'Windows', 'description': 'd'}
+    assert doc.body == parts[2].strip()
+
+
+def test_no_front_matter(tmp_path):
+    assert front_matter.read_front_matter(write(tmp_path / 'b.md', '# just markdown\n')) is None
+    assert front_matter.read_front_matter(write(tmp_path / 'c.md', '---\nunterminated: true\n')) is None
+    fm, body = load_front_matter(write(tmp_path / 'd.yml', 'title: Plain\n'))
+    assert fm == {'title': 'Plain'} and body == ''
+
+
+def test_cache_hits_and_invalidation(tmp_path):
+    p = write(tmp_path / 'a.md', '---\ntitle: A\n---\nbody\n')
+    first = front_matter.read_front_matter(p)
+    first.data['title'] = 'mutated'
+    second = front_matter.read_front_matter(p)
+    assert second.data == {'title': 'A'}
+    assert front_matter.cache_info()['hits'] == 1
+
+    write(p, '---\ntitle: Changed title\n---\nbody\n')
+    st = p.stat()
+    os.utime(p, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert front_matter.read_front_matter(p).data == {'title': 'Changed title'}
+    assert front_matter.cache_info()['misses'] == 2
+
+
+def test_to_jsonld_reads_body_only_without_description(tmp_path):
+    calls = []
+
+    def body():
+        calls.append(1)
+        return 'from body'
+
+    assert to_jsonld({'title': 'T', 'description': 'd'}, body)['description'] == 'd'
+    assert calls == []
+    assert to_jsonld({'title': 'T'}, body)['description'] == 'from body'
@@ -7,23 +7,6 @@ from types import SimpleNamespace
 REPO_ROOT = Path(__file__).resolve().parents[1]
 
 
-def make_local_tmp(test_name: str) -> Path:
-    tmp = REPO_ROOT / '.pytest_local_tmp' / test_name
-    if tmp.exists():
-        # clear previous runs
-        for p in tmp.iterdir():
-            if p.is_file():
-                p.unlink()
-            else:
-                # rmtree for dirs
-                import shutil
-
-                shutil.rmtree(p)
-    else:
-        tmp.mkdir(parents=True, exist_ok=True)
-    return tmp
-
-
 def make_resp(text: str):
     class R:
         def __init__(self, text):
@@ -39,8 +22,9 @@ def make_resp(text: str):
 
 
 def test_extracts_json_from_noisy_response(tmp_path, monkeypatch):
-    # create a fake debate_summary.md in a repo-local tmp dir
-    ds_dir = make_local_tmp('test_extracts_json_from_noisy_response')
+    # create a fake debate_summary.md in a tmp dir
+    ds_dir = tmp_path / 'debate'
+    ds_dir.mkdir()
     ds = ds_dir / 'debate_summary.md'
     ds.write_text('mock debate summary')
 
@@ -50,7 +34,7 @@ def test_extracts_json_from_noisy_response(tmp_path, monkeypatch):
     def fake_post(url, json, timeout):
         return make_resp(messy)
 
-    monkeypatch.setattr('requests.post', fake_post)
+    monkeypatch.setattr('tools.adapter_client.post', fake_post)
 
     # run the script from tools/debate
     cwd = os.getcwd()
@@ -71,7 +55,8 @@ def test_extracts_json_from_noisy_response(tmp_path, monkeypatch):
 
 
 def test_retry_on_bad_response_then_success(tmp_path, monkeypatch):
-    ds_dir = make_local_tmp('test_retry_on_bad_response_then_success')
+    ds_dir = tmp_path / 'debate'
+    ds_dir.mkdir()
     ds = ds_dir / 'debate_summary.md'
     ds.write_text('mock debate summary')
 
@@ -87,7 +72,7 @@ def test_retry_on_bad_response_then_success(tmp_path, monkeypatch):
             return make_resp(first)
         return make_resp(second)
 
-    monkeypatch.setattr('requests.post', fake_post)
+    monkeypatch.setattr('tools.adapter_client.post', fake_post)
 
     cwd = os.getcwd()
     try:
@@ -106,7 +91,8 @@ def test_retry_on_bad_response_then_success(tmp_path, monkeypatch):
 
 
 def test_validation_fails_on_bad_score(tmp_path, monkeypatch):
-    ds_dir = make_local_tmp('test_validation_fails_on_bad_score')
+    ds_dir = tmp_path / 'debate'
+    ds_dir.mkdir()
     ds = ds_dir / 'debate_summary.md'
     ds.write_text('mock debate summary')
 
@@ -116,7 +102,7 @@ def test_validation_fails_on_bad_score(tmp_path, monkeypatch):
     def fake_post(url, json, timeout):
         return make_resp(bad)
 
-    monkeypatch.setattr('requests.post', fake_post)
+    monkeypatch.setattr('tools.adapter_client.post', fake_post)
 
     cwd = os.getcwd()
     try:
@@ -132,3 +118,43 @@ def test_validation_fails_on_bad_score(tmp_path, monkeypatch):
         assert not (ds_dir / 'debate_insights.json').exists()
     finally:
         os.chdir(cwd)
+
+
+def test_extract_json_skips_stray_braces_and_braces_in_strings():
+    from tools.debate.generate_debate_insights import extract_first_json, extract_json_objects
+    text = 'Use {placeholder} here, and a stray { brace.\n```\n{"summary": "a } b", "score": 0.7, "actions": []}\n```\nThen {"x": {"y": 1}}'
+    first = extract_first_json(text)
+    assert json.loads(first)['summary'] == 'a } b'
+    assert extract_json_objects(text) == [first, '{"x": {"y": 1}}']
+    assert extract_first_json('no json here') is None
+    assert extract_first_json('{"unterminated": ') is None
+
+
+def test_extract_json_is_linear_on_large_noisy_input():
+    import time
+    from tools.debate.generate_debate_insights import extract_first_json
+    text = '{ stray ' + 'prose with "quotes" and words ' * 20000 + '{"score": 1}'
+    start = time.perf_counter()
+    assert extract_first_json(text) == '{"score": 1}'
+    assert time.perf_counter() - start < 1.0
+
+
+def test_invalid_answer_is_not_replayed_from_cache(monkeypatch):
+    from tools.debate import generate_debate_insights as mod
+
+    answers = iter(['{"summary": "Bad", "score": 1.5, "actions": []}',
+                    '{"summary": "Good", "score": 0.8, "actions": ["Do A"]}'])
+    calls = []
+
+    def fake_post(url, json, timeout):
+        calls.append(url)
+        return make_resp(next(answers))
+
+    monkeypatch.setattr('tools.adapter_client.post', fake_post)
+    first = mod.parse_insights_from_adapter_response(mod.call_adapter('summary', 'prompt'))
+    assert first['score'] == 1.5
+    second = mod.parse_insights_from_adapter_response(mod.call_adapter('summary', 'prompt'))
+    assert second['summary'] == 'Good'
+    # the valid answer is now cached
+    assert mod.call_adapter('summary', 'prompt') == {'text': '{"summary": "Good", "score": 0.8, "actions": ["Do A"]}'}
+    assert len(calls) == 2
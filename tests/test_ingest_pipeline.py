@@ -14,3 +14,92 @@ def test_ingest_dry_run_no_files(tmp_path):
 def test_discover_intake_folder_exists():
     # The repo should have an 'intake' folder per project layout
     assert os.path.isdir(os.path.join(os.getcwd(), "intake"))
+
+
+INTAKE_YAML = """id: {id}
+title: {title}
+source:
+  name: NEM
+  url: https://example.org
+  version: "2025"
+items:
+  - type: requirement
+    value: something
+"""
+
+
+def _write_intake(root, name, title):
+    d = root / "intake"
+    d.mkdir(exist_ok=True)
+    p = d / f"{name}.yml"
+    p.write_text(INTAKE_YAML.format(id=name, title=title))
+    return p
+
+
+def _audit(out_dir):
+    import json
+
+    audits = sorted(out_dir.glob("audit-*.json"))
+    return json.loads(audits[-1].read_text())
+
+
+def test_incremental_skips_unchanged_files(tmp_path):
+    from tools import ingest_pipeline
+
+    out = tmp_path / "out"
+    _write_intake(tmp_path, "a", "A")
+    b = _write_intake(tmp_path, "b", "B")
+    argv = ["--path", str(tmp_path), "--out", str(out), "--incremental"]
+    assert ingest_pipeline.main(argv) == 0
+    assert all("unchanged" not in e for e in _audit(out)["files"])
+    assert (out / ingest_pipeline.MANIFEST_NAME).exists()
+
+    for f in out.glob("audit-*.json"):
+        f.unlink()
+    b.write_text(INTAKE_YAML.format(id="b", title="B2"))
+    assert ingest_pipeline.main(argv) == 0
+    entries = {os.path.basename(e["path"]): e for e in _audit(out)["files"]}
+    assert entries["a.yml"].get("unchanged") is True
+    assert "unchanged" not in entries["b.yml"]
+    assert entries["b.yml"]["summary"]["title"] == "B2"
+
+
+def test_incremental_reprocesses_all_files_when_schema_changes(tmp_path):
+    import json
+
+    from tools import ingest_pipeline, schema_registry
+
+    out = tmp_path / "out"
+    _write_intake(tmp_path, "a", "A")
+    _write_intake(tmp_path, "b", "B")
+    schema_path = tmp_path / "intake.schema.json"
+    schema = schema_registry.load_schema("intake.schema.json")
+    schema_path.write_text(json.dumps(schema))
+    argv = ["--path", str(tmp_path), "--out", str(out), "--incremental", "--schema", str(schema_path)]
+    assert ingest_pipeline.main(argv) == 0
+    assert ingest_pipeline.main(argv) == 0
+    assert all(e.get("unchanged") for e in _audit(out)["files"])
+
+    # an edited schema invalidates every entry
+    schema["description"] = "tightened"
+    schema_path.write_text(json.dumps(schema))
+    assert ingest_pipeline.main(argv) == 0
+    assert all("unchanged" not in e for e in _audit(out)["files"])
+
+    # so does validating against a different schema file
+    assert ingest_pipeline.main(argv[:-1] + ["intake.schema.json"]) == 0
+    assert all("unchanged" not in e for e in _audit(out)["files"])
+    assert ingest_pipeline.main(argv[:-1] + ["intake.schema.json"]) == 0
+    assert all(e.get("unchanged") for e in _audit(out)["files"])
+
+
+def test_parallel_validation_matches_serial(tmp_path):
+    from tools import ingest_pipeline
+
+    files = [str(_write_intake(tmp_path, f"f{i}", f"T{i}")) for i in range(5)]
+    (tmp_path / "intake" / "bad.yml").write_text("title: missing fields\n")
+    files.append(str(tmp_path / "intake" / "bad.yml"))
+    schema = ingest_pipeline.load_json_schema("intake.schema.json")
+    serial = ingest_pipeline.validate_many(files, schema, jobs=1)
+    parallel = ingest_pipeline.validate_many(files, schema, jobs=2)
+    assert [ok for ok, _ in parallel] == [ok for ok, _ in serial] == [True] * 5 + [False]
@@ -0,0 +1,152 @@
+import json
+
+from tools import ingest_to_neo4j
+
+
+class FakeTx:
+    def __init__(self, db):
+        self.db = db
+
+    def run(self, query, **params):
+        self.db.queries.append((query, params))
+        for row in params.get('rows', []):
+            self.db.artifacts[row['id']] = row
+
+
+class FakeSession:
+    def __init__(self, db):
+        self.db = db
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query, **params):
+        self.db.schema.append(query)
+
+    def write_transaction(self, fn, *args):
+        self.db.transactions += 1
+        return fn(FakeTx(self.db), *args)
+
+
+class FakeDriver:
+    """Local stand-in for a neo4j driver that records what would be sent."""
+
+    def __init__(self):
+        self.queries = []
+        self.schema = []
+        self.artifacts = {}
+        self.transactions = 0
+        self.sessions = 0
+
+    def session(self):
+        self.sessions += 1
+        return FakeSession(self)
+
+
+def make_node(i):
+    return {'@id': f'urn:railweb:note:n{i}', '@type': 'rw:Note', 'title': f'N{i}',
+            'tags': ['a'], 'provenance': {'source': 'human'}}
+
+
+def test_bulk_ingest_batches_rows_over_one_session():
+    db = FakeDriver()
+    stats = ingest_to_neo4j.bulk_ingest(db, (make_node(i) for i in range(25)), batch_size=10)
+    assert stats['rows'] == 25
+    assert stats['batches'] == 3
+    assert db.sessions == 1
+    assert db.transactions == 3
+    assert all('UNWIND $rows AS row' in q for q, _ in db.queries)
+    assert [len(p['rows']) for _, p in db.queries] == [10, 10, 5]
+    assert any('REQUIRE n.id IS UNIQUE' in q for q in db.schema)
+    assert json.loads(db.artifacts['urn:railweb:note:n3']['provenance']) == {'source': 'human'}
+
+
+def test_single_and_bulk_ingest_store_the_same_properties():
+    node = make_node(1)
+    node['provenance'] = {'source': 'human', 'model': {'name': 'm', 'version': 2}}
+    bulk, single = FakeDriver(), FakeDriver()
+    ingest_to_neo4j.bulk_ingest(bulk, [node], batch_size=10)
+    ingest_to_neo4j.upsert_node(FakeTx(single), node)
+    (query, params), = single.queries
+    assert '$provenance' in query
+    assert params == bulk.artifacts[node['@id']]
+    assert isinstance(params['provenance'], str)
+
+
+def test_iter_nodes_reads_directory_and_jsonl(tmp_path):
+    d = tmp_path / 'exports'
+    d.mkdir()
+    for i in range(3):
+        (d / f'n{i}.jsonld').write_text(json.dumps(make_node(i), indent=2))
+    assert [n['title'] for n in ingest_to_neo4j.iter_nodes(str(d))] == ['N0', 'N1', 'N2']
+
+    jsonl = tmp_path / 'nodes.jsonl'
+    jsonl.write_text('\n'.join(json.dumps(make_node(i)) for i in range(4)) + '\n')
+    assert len(list(ingest_to_neo4j.iter_nodes(str(jsonl)))) == 4
+
+
+def test_iter_nodes_reads_gzip_sidecars(tmp_path):
+    from tools import json_io
+
+    d = tmp_path / 'exports'
+    d.mkdir()
+    json_io.write_json(d / 'n0.jsonld', make_node(0))
+    json_io.write_json(d / 'n1.jsonld', make_node(1), compact=True, compress=True)
+    assert [n['title'] for n in ingest_to_neo4j.iter_nodes(str(d))] == ['N0', 'N1']
+    assert next(ingest_to_neo4j.iter_nodes(str(d / 'n1.jsonld.gz')))['title'] == 'N1'
+
+
+def test_switching_sidecar_format_leaves_one_file(tmp_path):
+    import os
+
+    from tools import json_io
+
+    d = tmp_path / 'exports'
+    d.mkdir()
+    json_io.write_json(d / 'n0.jsonld', make_node(0))
+    json_io.write_json(d / 'n0.jsonld', make_node(0), compress=True)
+    assert sorted(p.name for p in d.iterdir()) == ['n0.jsonld.gz']
+    json_io.write_json(d / 'n0.jsonld', make_node(0))
+    assert sorted(p.name for p in d.iterdir()) == ['n0.jsonld']
+
+    # a stale variant left by an older writer is ignored in favour of the newer file
+    stale = d / 'n0.jsonld.gz'
+    json_io.write_json(d / 'n1.jsonld', make_node(1), compress=True)
+    os.replace(d / 'n1.jsonld.gz', stale)
+    os.utime(stale, ns=(0, 0))
+    assert [n['title'] for n in ingest_to_neo4j.iter_nodes(str(d))] == ['N0']
+
+
+def enriched_node():
+    node = make_node(1)
+    node['enrichment_data'] = {
+        'Q42': {'qid': 'Q42', 'label': 'Douglas Adams', 'wikidata_url': 'https://www.wikidata.org/wiki/Q42'},
+        'RW_ABCD1234': {'id': 'RW_ABCD1234', 'label': 'Test Railroad', 'type': 'organization', 'is_synthetic': True},
+    }
+    node['sameAs'] = ['https://www.wikidata.org/wiki/Q42', 'https://www.wikidata.org/wiki/Q5']
+    node['synthetic_entities'] = {'RW_ABCD1234': {'name': 'Test Railroad', 'type': 'organization'}}
+    return node
+
+
+def test_entity_rows_merge_all_sources():
+    rows = {r['id']: r for r in ingest_to_neo4j.entity_rows(enriched_node())}
+    assert set(rows) == {'Q42', 'RW_ABCD1234', 'Q5'}
+    assert rows['Q42']['label'] == 'Douglas Adams'
+    assert rows['Q5']['wikidata_url'] == 'https://www.wikidata.org/wiki/Q5'
+    assert rows['RW_ABCD1234']['is_synthetic'] is True
+    assert rows['RW_ABCD1234']['type'] == 'organization'
+    assert all(r['artifact_id'] == 'urn:railweb:note:n1' for r in rows.values())
+
+
+def test_bulk_ingest_with_entities_writes_reference_batches():
+    db = FakeDriver()
+    nodes = [enriched_node(), make_node(2)]
+    stats = ingest_to_neo4j.bulk_ingest(db, nodes, batch_size=2, with_entities=True)
+    assert stats['references'] == 3
+    ref_queries = [p for q, p in db.queries if 'REFERENCES' in q]
+    assert len(ref_queries) == 2  # 3 entity rows in batches of 2
+    assert all('MERGE (a)-[:REFERENCES]->(e)' in q for q, _ in db.queries if 'REFERENCES' in q)
+    assert any('(e:Entity) REQUIRE e.id IS UNIQUE' in q for q in db.schema)
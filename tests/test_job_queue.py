@@ -0,0 +1,85 @@
+import threading
+import time
+
+from tools.orchestrate.job_queue import JobQueue
+
+
+def test_job_queue_runs_jobs_and_reports_metrics():
+    done = []
+    jobs = JobQueue(done.append, workers=2, max_queue=4)
+    for i in range(4):
+        assert jobs.submit(i)
+    assert jobs.drain(timeout=5)
+    assert sorted(done) == [0, 1, 2, 3]
+    m = jobs.metrics()
+    assert m['submitted'] == 4 and m['completed'] == 4 and m['failed'] == 0
+    assert m['queue_depth'] == 0 and m['in_flight'] == 0
+    assert m['run_latency']['count'] == 4
+    assert m['wait_latency']['count'] == 4
+
+
+def test_job_queue_rejects_when_full_and_after_drain():
+    release = threading.Event()
+    started = threading.Event()
+
+    def handler(_):
+        started.set()
+        release.wait(5)
+
+    jobs = JobQueue(handler, workers=1, max_queue=1)
+    assert jobs.submit('a')
+    assert started.wait(5)  # 'a' is running, the queue slot is free again
+    assert jobs.submit('b')
+    assert jobs.full()
+    assert not jobs.submit('c')
+    assert jobs.retry_after() >= 1
+    release.set()
+    assert jobs.drain(timeout=5)
+    assert not jobs.submit('d')
+    m = jobs.metrics()
+    assert m['completed'] == 2 and m['rejected'] == 2
+
+
+def test_job_queue_counts_failures_and_keeps_working():
+    def handler(x):
+        if x == 'bad':
+            raise RuntimeError('boom')
+
+    jobs = JobQueue(handler, workers=1, max_queue=2)
+    jobs.submit('bad')
+    jobs.submit('ok')
+    assert jobs.drain(timeout=5)
+    m = jobs.metrics()
+    assert m['failed'] == 1 and m['completed'] == 1
+
+
+def test_job_queue_drain_times_out_with_running_job():
+    release = threading.Event()
+    jobs = JobQueue(lambda _: release.wait(5), workers=1, max_queue=1)
+    jobs.submit('slow')
+    time.sleep(0.05)
+    assert jobs.drain(timeout=0.1) is False
+    release.set()
+
+
+def test_job_queue_drain_waits_for_dequeued_job_not_yet_started():
+    done = []
+    jobs = JobQueue(done.append, workers=1, max_queue=4)
+    real_get = jobs._queue.get
+    dequeued = threading.Event()
+
+    def slow_get(*args, **kwargs):
+        item = real_get(*args, **kwargs)
+        if isinstance(item, tuple):
+            # the window between get() and the job starting
+            dequeued.set()
+            time.sleep(0.3)
+        return item
+
+    jobs._queue.get = slow_get
+    assert jobs.submit('x')
+    assert dequeued.wait(5)
+    # the dequeued job is not finished, so a short drain must not report idle
+    assert jobs.drain(timeout=0.1) is False
+    assert jobs.drain(timeout=5)
+    assert done == ['x']
@@ -0,0 +1,55 @@
+import datetime
+import json
+
+import pytest
+
+from tools import json_io
+
+NODE = {
+    '@id': 'urn:railweb:note:x',
+    'title': 'Zoë',
+    'provenance': {'timestamp': datetime.datetime(2024, 1, 2, 3, 4, 5), 'date': datetime.date(2024, 1, 2)},
+    'enrichment_data': {'Q42': {'properties': {'P31': [{'value': 'Q5', 'rank': 'normal'}]}, 'big': 2 ** 70 + 1}},
+    1: 'int key',
+}
+
+
+@pytest.fixture(params=[True, False], ids=['orjson', 'stdlib'])
+def backend(request, monkeypatch):
+    if request.param and not json_io.HAS_ORJSON:
+        pytest.skip('orjson not installed')
+    monkeypatch.setattr(json_io, 'HAS_ORJSON', request.param)
+    return request.param
+
+
+def expected():
+    # what the sidecar writer used to produce: datetimes as ISO strings, str() for the rest
+    return json.loads(json.dumps(NODE, default=lambda o: o.isoformat() if hasattr(o, 'isoformat') else str(o)))
+
+
+def test_dumps_matches_stdlib_semantics(backend):
+    pretty = json_io.dumps(NODE)
+    compact = json_io.dumps(NODE, compact=True)
+    assert json.loads(pretty) == json.loads(compact) == expected()
+    assert b'\n  "@id"' in pretty
+    assert b'\n' not in compact and b'": ' not in compact
+    assert 'Zoë'.encode('utf8') in compact
+
+
+def test_write_and_read_json(tmp_path, backend):
+    plain = json_io.write_json(tmp_path / 'a.jsonld', NODE, compact=True)
+    packed = json_io.write_json(tmp_path / 'b.jsonld', NODE, compress=True)
+    assert plain.name == 'a.jsonld' and packed.name == 'b.jsonld.gz'
+    assert json_io.read_json(plain) == json_io.read_json(packed) == expected()
+    assert json_io.read_json(plain)['enrichment_data']['Q42']['big'] == 2 ** 70 + 1
+
+
+@pytest.mark.parametrize('text', [
+    '{"big": 1180591620717411303425, "small": -1180591620717411303425}',
+    '{"id": "Q1180591620717411303425", "n": 1}',
+    '{"x": NaN, "y": Infinity}',
+])
+def test_loads_matches_stdlib(backend, text):
+    result = json_io.loads(text.encode('utf8'))
+    assert json.dumps(result) == json.dumps(json.loads(text))
+    assert json.dumps(json_io.loads(text)) == json.dumps(json.loads(text))
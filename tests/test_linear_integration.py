@@ -23,7 +23,7 @@ def test_create_issue_success(monkeypatch):
         def json(self):
             return {'data': {'issueCreate': {'issue': {'id': 'ISSUE-123'}}}}
 
-    with patch('requests.post', return_value=DummyResp()):
+    with patch('tools.adapter_client.post', return_value=DummyResp()):
         issue = create_issue_for_run('run-x', {'provenance': {'source': {'id': 's'}}})
         assert issue == 'ISSUE-123'
 
@@ -38,21 +38,24 @@ def test_create_issue_with_assignee_and_labels(monkeypatch):
         def json(self):
             return {'data': {'issueCreate': {'issue': {'id': 'ISSUE-456'}}}}
 
-    # capture the payload passed to requests.post to assert variables
+    # capture the payload passed to adapter_client.post to assert variables
     captured = {}
 
-    def fake_post(url, headers=None, data=None, timeout=None):
+    def fake_post(url, headers=None, data=None, timeout=None, idempotent=True):
         captured['url'] = url
+        captured['idempotent'] = idempotent
         captured['headers'] = headers
         captured['data'] = data
         return DummyResp()
 
-    with patch('requests.post', side_effect=fake_post):
+    with patch('tools.adapter_client.post', side_effect=fake_post):
         issue = create_issue_for_run('run-y', {'assignee': 'USER-1', 'labels': ['L1', 'L2']})
         assert issue == 'ISSUE-456'
         # ensure variables included assigneeId and labelIds
         assert 'assigneeId' in json.loads(captured['data'])['variables']['input']
         assert 'labelIds' in json.loads(captured['data'])['variables']['input']
+        # the mutation must not be retried on gateway errors
+        assert captured['idempotent'] is False
 
 
 def test_github_fallback(monkeypatch):
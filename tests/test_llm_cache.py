@@ -0,0 +1,90 @@
+import json
+import time
+
+import pytest
+
+from tools import disk_cache, llm_cache
+
+
+def counting_call(value):
+    def call():
+        call.count += 1
+        return value
+    call.count = 0
+    return call
+
+
+def test_hit_skips_call_and_counts():
+    call = counting_call({'text': 'answer'})
+    before = llm_cache.stats()
+    assert llm_cache.cached_call('m', 'prompt', call, intent='x') == {'text': 'answer'}
+    assert llm_cache.cached_call('m', 'prompt', call, intent='x') == {'text': 'answer'}
+    assert call.count == 1
+    assert llm_cache.stats_since(before) == {'mode': 'on', 'hits': 1, 'misses': 1}
+
+
+def test_key_covers_model_prompt_and_params():
+    call = counting_call('r')
+    llm_cache.cached_call('m', 'prompt', call, intent='x')
+    llm_cache.cached_call('m', 'prompt', call, intent='y')
+    llm_cache.cached_call('m2', 'prompt', call, intent='x')
+    llm_cache.cached_call('m', 'prompt 2', call, intent='x')
+    assert call.count == 4
+
+
+def test_replay_mode_never_calls_model(monkeypatch):
+    llm_cache.cached_call('m', 'seen', counting_call('cached'))
+    monkeypatch.setenv('RAILWEB_LLM_CACHE', 'replay')
+    call = counting_call('fresh')
+    assert llm_cache.cached_call('m', 'seen', call) == 'cached'
+    with pytest.raises(llm_cache.LLMCacheMiss):
+        llm_cache.cached_call('m', 'unseen', call)
+    assert call.count == 0
+
+
+def test_off_mode_and_failures_are_not_cached(monkeypatch):
+    def failing():
+        raise RuntimeError('boom')
+    with pytest.raises(RuntimeError):
+        llm_cache.cached_call('m', 'p', failing)
+    call = counting_call('ok')
+    assert llm_cache.cached_call('m', 'p', call) == 'ok'
+    monkeypatch.setenv('RAILWEB_LLM_CACHE', 'off')
+    llm_cache.cached_call('m', 'p', call)
+    assert call.count == 2
+
+
+def test_rejected_response_is_not_replayed():
+    answers = iter(['not json', '{"ok": true}'])
+
+    def call():
+        call.count += 1
+        return next(answers)
+    call.count = 0
+
+    def valid(text):
+        return json.loads(text)['ok']
+
+    assert llm_cache.cached_call('m', 'p', call, validate=valid) == 'not json'
+    assert llm_cache.cached_call('m', 'p', call, validate=valid) == '{"ok": true}'
+    assert llm_cache.cached_call('m', 'p', call, validate=valid) == '{"ok": true}'
+    assert call.count == 2
+
+
+def test_cached_entry_failing_validation_is_refetched():
+    llm_cache.cached_call('m', 'p', counting_call('old'))
+    call = counting_call('new')
+    assert llm_cache.cached_call('m', 'p', call, validate=lambda v: v == 'new') == 'new'
+    assert call.count == 1
+
+
+def test_entries_expire_after_ttl(monkeypatch, tmp_path):
+    monkeypatch.setenv('RAILWEB_LLM_CACHE_TTL', '60')
+    monkeypatch.setenv('RAILWEB_CACHE_DIR', str(tmp_path / 'ttl'))
+    assert llm_cache.get_cache().ttl == 60
+    call = counting_call('x')
+    llm_cache.cached_call('m', 'p', call)
+    now = time.time()
+    monkeypatch.setattr(disk_cache.time, 'time', lambda: now + 61)
+    llm_cache.cached_call('m', 'p', call)
+    assert call.count == 2
@@ -0,0 +1,110 @@
+import time
+
+from tools.minimal_expert_debate import MinimalDebateOrchestrator
+
+
+class SlowExpert:
+    def __init__(self, name, delay, confidence=0.9):
+        self.name = name
+        self.delay = delay
+        self.confidence = confidence
+
+    def analyze(self, artifact, context=None):
+        time.sleep(self.delay)
+        return {"expert": self.name, "analysis": "ok", "confidence": self.confidence}
+
+    def debate_respond(self, debate_context, expert_positions):
+        time.sleep(self.delay)
+        return {"expert": self.name, "response": "agree", "agreements": ["a"], "disagreements": [],
+                "confidence": self.confidence}
+
+
+def make_orchestrator(delays, expert_timeout=5.0):
+    orch = MinimalDebateOrchestrator(expert_timeout=expert_timeout)
+    orch.experts = {f"E{i}": SlowExpert(f"E{i}", d) for i, d in enumerate(delays)}
+    return orch
+
+
+def test_round_runs_experts_concurrently_in_expert_order():
+    orch = make_orchestrator([0.3, 0.1, 0.2, 0.3])
+    start = time.monotonic()
+    result = orch.run_debate({"title": "T"}, max_rounds=2)
+    elapsed = time.monotonic() - start
+    # two rounds of the slowest expert, not the sum of all four
+    assert elapsed < 1.5
+    for rnd in result["rounds"]:
+        assert list(rnd["responses"]) == ["E0", "E1", "E2", "E3"]
+    assert result["consensus"]["expert_count"] == 4
+
+
+def test_slow_expert_times_out_without_blocking_round():
+    orch = make_orchestrator([0.05, 2.0], expert_timeout=0.3)
+    start = time.monotonic()
+    result = orch.run_debate({"title": "T"}, max_rounds=1)
+    assert time.monotonic() - start < 1.5
+    responses = result["rounds"][0]["responses"]
+    assert responses["E0"]["analysis"] == "ok"
+    assert responses["E1"]["status"] == "timeout"
+
+
+def test_rerun_on_unchanged_artifact_is_served_from_llm_cache(tmp_path, monkeypatch):
+    from tools.minimal_expert_debate import ExpertAgent
+
+    calls = []
+
+    class Resp:
+        def raise_for_status(self):
+            return None
+
+        def json(self):
+            return {"text": '{"analysis": "cached", "agreements": ["a"], "disagreements": [], "confidence": 0.9}'}
+
+    def fake_post(url, json=None, timeout=None):
+        calls.append(url)
+        return Resp()
+
+    monkeypatch.setattr("tools.adapter_client.post", fake_post)
+    persona = tmp_path / "persona.md"
+    persona.write_text("Requirements Engineer persona", encoding="utf-8")
+
+    results = []
+    for _ in range(2):
+        orch = MinimalDebateOrchestrator()
+        orch.experts = {"Requirements Engineer": ExpertAgent("Requirements Engineer", str(persona))}
+        results.append(orch.run_debate({"title": "T", "content": "same"}, max_rounds=2))
+    assert len(calls) == 2
+    assert results[0]["llm_cache"]["misses"] == 2
+    assert results[1]["llm_cache"] == {"mode": "on", "hits": 2, "misses": 0}
+
+
+class ScriptedExpert(SlowExpert):
+    """Debate responses cycle through ``scripts``; the last one repeats."""
+
+    def __init__(self, name, scripts):
+        super().__init__(name, 0)
+        self.scripts = scripts
+        self.calls = 0
+
+    def debate_respond(self, debate_context, expert_positions):
+        script = self.scripts[min(self.calls, len(self.scripts) - 1)]
+        self.calls += 1
+        return {"expert": self.name, "response": "r", "agreements": script, "disagreements": ["d"],
+                "confidence": 0.6}
+
+
+def test_stable_experts_are_skipped_and_debate_stops_when_converged():
+    orch = MinimalDebateOrchestrator()
+    steady = ScriptedExpert("Steady", [["a"]])
+    moving = ScriptedExpert("Moving", [["x"], ["y"], ["y"]])
+    orch.experts = {"Steady": steady, "Moving": moving}
+    result = orch.run_debate({"title": "T"}, max_rounds=8)
+
+    # round 2 sets a baseline, Steady is stable from round 3, Moving from round 4
+    assert [r["round"] for r in result["rounds"]] == [1, 2, 3, 4]
+    assert result["rounds"][3]["skipped"] == ["Steady"]
+    assert steady.calls == 2 and moving.calls == 3
+    assert list(result["rounds"][3]["responses"]) == ["Steady", "Moving"]
+
+    no_early_exit = MinimalDebateOrchestrator(convergence=False)
+    no_early_exit.experts = {"Steady": ScriptedExpert("Steady", [["a"]]), "Moving": ScriptedExpert("Moving", [["x"], ["y"]])}
+    assert len(no_early_exit.run_debate({"title": "T"}, max_rounds=5)["rounds"]) == 5
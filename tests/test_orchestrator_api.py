@@ -18,6 +18,13 @@ def test_create_run_api_happy_path(tmp_path, monkeypatch):
     tmp_runs.mkdir()
     monkeypatch.setattr(create_run_api, 'RUNS', tmp_runs)
 
+    # runs execute the debate in-process now; keep it off the network
+    def fake_debate(out=None, adapter_url=None):
+        print('Round 1', file=out)
+        return [['mock-agent: ok']]
+
+    monkeypatch.setattr(create_run_api.debate_runner, 'run_real_debate', fake_debate)
+
     # set auth token
     monkeypatch.setenv('RAILWEB_API_TOKEN', 'test-token')
 
@@ -44,6 +51,8 @@ def test_create_run_api_happy_path(tmp_path, monkeypatch):
         time.sleep(0.1)
 
     assert (run_dir / 'results.txt').exists()
+    assert 'Round 1' in (run_dir / 'results.txt').read_text()
+    assert json.loads((run_dir / 'results.json').read_text())['history'] == [['mock-agent: ok']]
 
 
 def test_create_run_api_validation_and_auth_errors(tmp_path, monkeypatch):
@@ -68,3 +77,85 @@ def test_create_run_api_validation_and_auth_errors(tmp_path, monkeypatch):
     resp = client.post('/internal/create_run', json={'meta': bad_meta}, headers={'Authorization': 'Bearer test-token'})
     # server uses jsonschema; if missing, returns 500; otherwise 400 for validation
     assert resp.status_code in (400, 500)
+
+
+def _queue_env(tmp_path, monkeypatch, handler, workers=1, max_queue=1):
+    from tools.orchestrate import create_run_api, status_db
+    from tools.orchestrate.job_queue import JobQueue
+
+    tmp_runs = tmp_path / 'runs'
+    tmp_runs.mkdir()
+    monkeypatch.setattr(create_run_api, 'RUNS', tmp_runs)
+    monkeypatch.setattr(status_db, 'DB_PATH', tmp_path / 'status.db')
+    monkeypatch.setenv('RAILWEB_API_TOKEN', 'test-token')
+    jobs = JobQueue(handler, workers=workers, max_queue=max_queue)
+    monkeypatch.setattr(create_run_api, 'JOBS', jobs)
+    return create_run_api, status_db, jobs, tmp_runs
+
+
+def test_create_run_api_backpressure_returns_429(tmp_path, monkeypatch):
+    import threading
+
+    release = threading.Event()
+    started = threading.Event()
+
+    def handler(dest):
+        started.set()
+        release.wait(5)
+
+    api, status_db, jobs, tmp_runs = _queue_env(tmp_path, monkeypatch, handler)
+    client = api.app.test_client()
+    headers = {'Authorization': 'Bearer test-token'}
+
+    assert client.post('/internal/create_run', json={'run_id': 'r1'}, headers=headers).status_code == 202
+    assert started.wait(5)
+    assert client.post('/internal/create_run', json={'run_id': 'r2'}, headers=headers).status_code == 202
+    assert status_db.get_status('r2')['status'] == 'queued'
+
+    resp = client.post('/internal/create_run', json={'run_id': 'r3'}, headers=headers)
+    assert resp.status_code == 429
+    assert int(resp.headers['Retry-After']) >= 1
+    assert not (tmp_runs / 'r3').exists()
+
+    metrics = client.get('/internal/metrics').get_json()['queue']
+    assert metrics['queue_depth'] == 1 and metrics['in_flight'] == 1 and metrics['rejected'] == 0
+
+    release.set()
+    assert jobs.drain(timeout=5)
+    resp = client.post('/internal/create_run', json={'run_id': 'r4'}, headers=headers)
+    assert resp.status_code == 503
+
+
+def test_recover_queued_runs_requeues_persisted_runs(tmp_path, monkeypatch):
+    seen = []
+    api, status_db, jobs, tmp_runs = _queue_env(tmp_path, monkeypatch, seen.append, max_queue=4)
+    for run_id, status in (('a', 'queued'), ('b', 'running'), ('c', 'completed')):
+        (tmp_runs / run_id).mkdir()
+        status_db.set_status(run_id, status, None)
+    status_db.set_status('gone', 'queued', None)
+
+    assert sorted(api.recover_queued_runs()) == ['a', 'b']
+    assert jobs.drain(timeout=5)
+    assert sorted(p.name for p in seen) == ['a', 'b']
+    assert status_db.get_status('gone')['status'] == 'error'
+
+
+def test_failed_debate_marks_run_error_without_issue(tmp_path, monkeypatch):
+    from tools.orchestrate import create_run, linear_integration
+
+    api, status_db, jobs, tmp_runs = _queue_env(tmp_path, monkeypatch, lambda dest: None)
+    failed = {'mode': 'inproc', 'ok': False, 'output': 'Traceback: adapter down\n', 'history': None, 'duration_s': 0.1}
+    monkeypatch.setattr(api.debate_runner, 'run_debate', lambda timeout=None: dict(failed))
+    issues = []
+    monkeypatch.setattr(linear_integration, 'create_issue_for_run', lambda *a: issues.append(a) or 'ISSUE-1')
+
+    dest = tmp_runs / 'r1'
+    dest.mkdir()
+    api._run_runner_and_write(dest)
+    assert status_db.get_status('r1')['status'] == 'error'
+    assert 'adapter down' in (dest / 'results.txt').read_text()
+    assert issues == [] and not (dest / 'external_issue_id.txt').exists()
+
+    monkeypatch.setattr(create_run, 'RUNS', tmp_runs)
+    monkeypatch.setattr(create_run.debate_runner, 'run_debate', lambda: dict(failed))
+    assert create_run.create_run('r2') == 1
@@ -1,3 +1,5 @@
+import pytest
+
 from tools.parse_kerml import parse_requirements
 
 
@@ -8,3 +10,92 @@ def test_parse_requirements_basic():
     assert len(out) == 1
     assert out[0]['id'] == 'REQ-1'
     assert out[0]['text'].startswith('Short requirement')
+
+
+NESTED = '''requirement REQ TYPE id="REQ-1" {
+text = "Braces } inside { strings";
+detail { text = "nested block"; }
+source = "spec.doc";
+}
+requirement REQ TYPE id="REQ-2" {
+text = "Second";
+}'''
+
+
+def test_parse_requirements_nested_blocks_and_braces_in_strings():
+    out = parse_requirements(NESTED)
+    assert [r['id'] for r in out] == ['REQ-1', 'REQ-2']
+    assert out[0]['text'] == 'Braces } inside { strings'
+    assert out[0]['source'] == 'spec.doc'
+
+
+def test_iter_requirements_independent_of_chunk_size():
+    from tools.parse_kerml import iter_requirements
+    expected = parse_requirements(NESTED)
+    for size in (1, 5, 17, 64):
+        chunks = (NESTED[i:i + size] for i in range(0, len(NESTED), size))
+        assert list(iter_requirements(chunks)) == expected
+
+
+def test_convert_file_streams_same_json_as_dumps(tmp_path):
+    import csv
+    import json
+    from tools.parse_kerml import convert_file
+    src = tmp_path / 'requirements_abc123.kerml'
+    src.write_text(NESTED, encoding='utf-8')
+    json_path, csv_path, count = convert_file(src, tmp_path / 'out', chunk_size=7)
+    assert count == 2
+    expected = json.dumps(parse_requirements(NESTED), indent=2, ensure_ascii=False)
+    assert json_path.read_text(encoding='utf-8') == expected
+    rows = list(csv.reader(csv_path.open(encoding='utf-8')))
+    assert rows[0] == ['req_id', 'short_text', 'source'] and rows[1][0] == 'REQ-1'
+
+    jsonl_path, _, _ = convert_file(src, tmp_path / 'out', fmt='jsonl')
+    lines = jsonl_path.read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['id'] for line in lines] == ['REQ-1', 'REQ-2']
+
+
+def test_convert_batch_skips_unchanged_and_merges_traces(tmp_path):
+    import csv
+    from tools.parse_kerml import convert_batch, discover_kerml
+    src = tmp_path / 'kerml'
+    src.mkdir()
+    (src / 'a.kerml').write_text(NESTED, encoding='utf-8')
+    (src / 'b.kerml').write_text('requirement REQ T id="REQ-9" { text = "Other"; }', encoding='utf-8')
+    out = tmp_path / 'out'
+
+    first = convert_batch(discover_kerml(str(src)), out, jobs=2)
+    assert len(first['converted']) == 2 and first['requirements'] == 3
+    rows = list(csv.reader(first['trace'].open(encoding='utf-8')))
+    assert rows[0] == ['req_id', 'short_text', 'source', 'kerml_file']
+    assert [r[0] for r in rows[1:]] == ['REQ-1', 'REQ-2', 'REQ-9']
+
+    (src / 'b.kerml').write_text('requirement REQ T id="REQ-10" { text = "Changed"; }', encoding='utf-8')
+    second = convert_batch(discover_kerml(str(src / '*.kerml')), out)
+    assert [p.name for p in second['converted']] == ['b.kerml']
+    assert [p.name for p in second['skipped']] == ['a.kerml']
+    rows = list(csv.reader(second['trace'].open(encoding='utf-8')))
+    assert [r[0] for r in rows[1:]] == ['REQ-1', 'REQ-2', 'REQ-10']
+
+
+def test_interrupted_convert_leaves_no_partial_outputs(tmp_path, monkeypatch):
+    from tools import parse_kerml
+    src = tmp_path / 'kerml'
+    src.mkdir()
+    (src / 'a.kerml').write_text(NESTED, encoding='utf-8')
+    out = tmp_path / 'out'
+
+    def crash(fh, entries):
+        next(entries)
+        fh.write('[\n')
+        raise KeyboardInterrupt
+
+    write_json_array = parse_kerml.write_json_array
+    monkeypatch.setattr(parse_kerml, 'write_json_array', crash)
+    with pytest.raises(KeyboardInterrupt):
+        parse_kerml.convert_batch(parse_kerml.discover_kerml(str(src)), out)
+    assert list(out.iterdir()) == []
+
+    monkeypatch.setattr(parse_kerml, 'write_json_array', write_json_array)
+    result = parse_kerml.convert_batch(parse_kerml.discover_kerml(str(src)), out)
+    assert [p.name for p in result['converted']] == ['a.kerml'] and result['requirements'] == 2
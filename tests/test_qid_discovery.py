@@ -15,7 +15,10 @@ try:
         smart_entity_extraction,
         enrich_synthetic_entity,
         discover_or_create_identifier,
-        enhance_artifact_with_smart_discovery
+        discover_identifiers_concurrently,
+        extract_entities_from_chunks,
+        enhance_artifact_with_smart_discovery,
+        RateLimiter,
     )
 except ImportError:
     # Skip tests if module not available
@@ -66,6 +69,25 @@ def test_entity_extraction():
         assert john_smith["type"] == "person"  # Two words -> person heuristic
 
 
+def test_entity_extraction_compound_spans_and_types():
+    """Names inside a compound phrase are folded into it; the same words elsewhere are kept."""
+    text = "The Baltimore and Ohio Railroad ran to Ohio Railroad yards. Camden Station opened."
+    entities = smart_entity_extraction(text)
+    assert entities[0] == {"name": "Baltimore and Ohio Railroad", "type": "organization"}
+    names = [e["name"] for e in entities]
+    assert "Ohio Railroad" in names  # second, standalone mention
+    assert {"name": "Camden Station", "type": "facility"} in entities
+    assert "The" not in names
+
+
+def test_entity_extraction_streaming_matches_whole_text():
+    text = "The Reading and Lehigh Valley Railroad crossed the Susquehanna River Bridge.\n" * 50
+    expected = smart_entity_extraction(text)
+    for size in (1, 3, 17, 4096):
+        chunks = [text[i:i + size] for i in range(0, len(text), size)]
+        assert extract_entities_from_chunks(chunks) == expected
+
+
 def test_synthetic_entity_enrichment():
     """Test enrichment data for synthetic entities."""
     synthetic_id = "RW_12345678"
@@ -191,5 +213,37 @@ Test content with mixed identifiers.
             sidecar_path_obj.unlink(missing_ok=True)
 
 
+def test_concurrent_discovery_keeps_input_order(monkeypatch):
+    """Lookups run in parallel but results line up with the input entities."""
+    import time
+    import qid_discovery
+
+    def slow_search(name, entity_type=None, rate_limiter=None):
+        time.sleep(0.05)
+        return None if name == "Entity 7" else f"Q{name.split()[-1]}"
+
+    monkeypatch.setattr(qid_discovery, "search_wikidata_for_entity", slow_search)
+    entities = [{"name": f"Entity {i}", "type": "unknown"} for i in range(20)]
+
+    start = time.monotonic()
+    results = discover_identifiers_concurrently(entities, max_workers=10, requests_per_second=1000)
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.5  # 20 x 50ms serially would take >= 1s
+    assert results[3] == ("Q3", False)
+    assert results[7][1] is True and results[7][0].startswith("RW_")
+    assert [r[0] for r in results if not r[1]] == [f"Q{i}" for i in range(20) if i != 7]
+
+
+def test_rate_limiter_spaces_calls():
+    import time
+
+    limiter = RateLimiter(100)
+    start = time.monotonic()
+    for _ in range(6):
+        limiter.acquire()
+    assert time.monotonic() - start >= 0.045
+
+
 if __name__ == '__main__':
     pytest.main([__file__])
\ No newline at end of file
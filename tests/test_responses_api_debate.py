@@ -29,3 +29,135 @@ def test_parse_response_normalises_required_fields():
     assert analysis["key_concerns"] == ["security"]
     assert analysis["recommendations"] == ["test more"]
     assert isinstance(analysis["confidence"], float)
+
+
+def make_analysis(round_number, concerns=50):
+    return {
+        "analysis": "x" * 5000,
+        "key_concerns": ["shared concern"] + [f"concern {round_number}-{i} " + "y" * 80 for i in range(concerns)],
+        "recommendations": ["shared recommendation"],
+    }
+
+
+def test_context_builder_dedupes_repeated_items_across_rounds():
+    from tools.responses_api_expert_debate import DebateContextBuilder
+
+    builder = DebateContextBuilder()
+    first = builder.add("A", {"key_concerns": ["Latency", "Cost"], "recommendations": ["Cache"]})
+    second = builder.add("A", {"key_concerns": ["latency ", "Security"], "recommendations": ["cache"]})
+    third = builder.add("A", {"key_concerns": ["Cost"], "recommendations": []})
+    assert "Latency" in first and "Cache" in first
+    assert second == "Concerns: Security"
+    assert third == "No new concerns or recommendations."
+
+
+def test_prompt_is_capped_and_summaries_computed_once(monkeypatch):
+    from tools import responses_api_expert_debate as mod
+
+    calls = []
+    original = mod.summarise_analysis
+    monkeypatch.setattr(mod, "summarise_analysis", lambda a: calls.append(1) or original(a))
+
+    experts = [mod.ResponsesAPIExpert(f"Expert {i}", "a reviewer", None, "m", max_prompt_chars=6000) for i in range(6)]
+    builder = mod.DebateContextBuilder()
+    sizes = []
+    for round_number in range(1, 6):
+        for expert in experts:
+            prompt = expert.build_prompt("Design a system.", round_number, builder)
+            sizes.append(len(prompt))
+            if round_number > 1:
+                assert "Context from previous rounds" in prompt
+                assert prompt.endswith("commentary.")
+        for expert in experts:
+            builder.add(expert.expert_name, make_analysis(round_number))
+    assert max(sizes) <= 6000
+    # position and delta are summarised when added, never while rendering
+    assert len(calls) == 2 * 5 * len(experts)
+
+
+def test_context_keeps_standing_concerns_in_later_rounds():
+    from tools.responses_api_expert_debate import DebateContextBuilder
+
+    builder = DebateContextBuilder()
+    for round_number in range(1, 6):
+        builder.add("A", {"key_concerns": ["Latency", "latency", "Cost"], "recommendations": ["Cache"]})
+    builder.add("B", {"key_concerns": [f"c{i}" for i in range(20)], "recommendations": []})
+    context = builder.render(4000)
+    assert "Position (round 5): Concerns: Latency; Cost | Recommendations: Cache" in context
+    assert "Round 5 changes: No new concerns or recommendations." in context
+    assert "Round 3 changes" not in context
+    # nothing silently truncated: all 20 items of B are still there
+    assert "c19" in context
+    assert len(builder.render(200)) <= 200
+
+
+def test_prompt_keeps_instructions_when_problem_exceeds_cap():
+    from tools.responses_api_expert_debate import DebateContextBuilder, ResponsesAPIExpert
+
+    builder = DebateContextBuilder()
+    builder.add("Other", make_analysis(1))
+    expert = ResponsesAPIExpert("E", "a reviewer", None, "m", max_prompt_chars=1000)
+    problem = "requirement " * 500
+    first = expert.build_prompt(problem, 1, builder)
+    later = expert.build_prompt(problem, 2, builder)
+    assert problem.strip() in first and problem.strip() in later
+    assert later.endswith("Do not include markdown code fences or commentary.")
+
+
+def test_analyze_problem_records_prompt_bytes():
+    from types import SimpleNamespace
+    from tools.responses_api_expert_debate import ResponsesAPIExpert
+
+    class Client:
+        responses = SimpleNamespace(create=lambda model, input: SimpleNamespace(output_text='{"analysis": "ok"}'))
+
+    expert = ResponsesAPIExpert("E", "a reviewer", Client(), "m")
+    history = {"Other": [make_analysis(1)]}
+    result = expert.analyze_problem("Problem", 2, history)
+    assert result["analysis"] == "ok"
+    assert 0 < expert.last_prompt_bytes <= expert.max_prompt_chars
+
+
+def test_run_debate_rounds_stops_once_positions_converge():
+    from types import SimpleNamespace
+    from tools.responses_api_expert_debate import ResponsesAPIExpert, run_debate_rounds
+
+    calls = []
+
+    def client_for(name, answers):
+        def create(model, input):
+            calls.append(name)
+            text = answers[min(len([c for c in calls if c == name]), len(answers)) - 1]
+            return SimpleNamespace(output_text=text)
+        return SimpleNamespace(responses=SimpleNamespace(create=create))
+
+    steady = json.dumps({"analysis": "a", "recommendations": ["r1"], "confidence": 0.8})
+    moving = [json.dumps({"analysis": "b", "recommendations": [f"r{i}"], "confidence": 0.5}) for i in range(3)]
+    experts = [
+        ResponsesAPIExpert("Steady", "a steady reviewer", client_for("Steady", [steady]), "m"),
+        ResponsesAPIExpert("Moving", "a moving reviewer", client_for("Moving", moving + [moving[-1]] * 3), "m"),
+    ]
+    debate = run_debate_rounds(experts, "Problem", max_rounds=6)
+    rounds = debate["rounds"]
+    # Steady is stable after round 2 and skipped; Moving settles in round 4
+    assert rounds[2]["skipped"] == ["Steady"]
+    assert len(rounds) == 4
+    assert calls.count("Steady") == 2 and calls.count("Moving") == 4
+    assert rounds[-1]["analyses"]["Steady"]["recommendations"] == ["r1"]
+
+
+def test_run_debate_rounds_does_not_converge_on_unparsed_answers():
+    from types import SimpleNamespace
+    from tools.responses_api_expert_debate import ResponsesAPIExpert, run_debate_rounds
+
+    counter = {"n": 0}
+
+    def create(model, input):
+        counter["n"] += 1
+        return SimpleNamespace(output_text=f"plain prose answer number {counter['n']}")
+
+    client = SimpleNamespace(responses=SimpleNamespace(create=create))
+    experts = [ResponsesAPIExpert("Prose", "a prose-only reviewer", client, "m")]
+    debate = run_debate_rounds(experts, "Problem", max_rounds=4)
+    assert len(debate["rounds"]) == 4
+    assert all(not r.get("skipped") for r in debate["rounds"])
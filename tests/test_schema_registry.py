@@ -0,0 +1,81 @@
+import json
+import os
+
+import pytest
+from jsonschema import ValidationError, validate as js_validate
+
+from tools import schema_registry
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry():
+    schema_registry.clear_cache()
+    yield
+    schema_registry.clear_cache()
+
+
+def test_validator_built_once_for_many_instances():
+    good = {"id": "x", "title": "t", "source": {"name": "n", "url": "u", "version": "1"},
+            "items": [{"type": "note", "value": 1}]}
+    for _ in range(50):
+        schema_registry.validate(good, "intake.schema.json")
+    schema = schema_registry.load_schema("intake.schema.json")
+    schema_registry.validate(good, schema)
+    info = schema_registry.cache_info()
+    assert info["builds"] == 1
+    assert info["hits"] >= 50
+
+
+def test_errors_match_jsonschema_validate():
+    bad = {"title": "missing id and source"}
+    schema = schema_registry.load_schema("intake.schema.json")
+    with pytest.raises(ValidationError) as ours:
+        schema_registry.validate(bad, "intake.schema.json")
+    with pytest.raises(ValidationError) as theirs:
+        js_validate(instance=bad, schema=schema)
+    assert str(ours.value) == str(theirs.value)
+
+
+def test_schema_reloaded_when_file_changes(tmp_path):
+    path = tmp_path / "s.json"
+    path.write_text(json.dumps({"type": "object", "required": ["a"]}))
+    schema_registry.validate({"a": 1}, path)
+    path.write_text(json.dumps({"type": "object", "required": ["b"]}))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    with pytest.raises(ValidationError):
+        schema_registry.validate({"a": 1}, path)
+    assert schema_registry.cache_info()["builds"] == 2
+
+
+def test_inline_schema_is_cached_by_content():
+    schema = {"type": "object"}
+    v1 = schema_registry.get_validator(schema)
+    v2 = schema_registry.get_validator(schema)
+    assert v1 is v2
+    assert schema_registry.get_validator({"type": "object"}) is v1
+
+    # a mutated (or different) schema never reuses the old validator
+    schema["required"] = ["a"]
+    with pytest.raises(ValidationError):
+        schema_registry.validate({}, schema)
+
+
+def test_inline_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(schema_registry, "INLINE_MAX_ENTRIES", 3)
+    first = {"type": "object", "title": "0"}
+    schema_registry.get_validator(first)
+    for i in range(1, 5):
+        schema_registry.get_validator({"type": "object", "title": str(i)})
+    assert schema_registry.cache_info()["inline"] == 3
+    builds = schema_registry.cache_info()["builds"]
+    schema_registry.get_validator(first)
+    assert schema_registry.cache_info()["builds"] == builds + 1
+
+
+def test_schema_names_resolve_under_schema_dir_regardless_of_cwd(tmp_path, monkeypatch):
+    (tmp_path / "intake.schema.json").write_text(json.dumps({"type": "string"}))
+    monkeypatch.chdir(tmp_path)
+    assert schema_registry.resolve_schema_path("intake.schema.json") == schema_registry.SCHEMA_DIR / "intake.schema.json"
+    (tmp_path / "local.json").write_text(json.dumps({"type": "string"}))
+    assert schema_registry.resolve_schema_path("local.json") == tmp_path.resolve() / "local.json"
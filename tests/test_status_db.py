@@ -0,0 +1,81 @@
+import sqlite3
+import threading
+
+import pytest
+
+from tools.orchestrate import status_db
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(status_db, 'DB_PATH', tmp_path / 'status.db')
+    yield status_db
+    status_db.close()
+
+
+def test_status_roundtrip_and_connection_reuse(db):
+    db.set_status('r1', 'queued')
+    conn = db._get_conn()
+    db.set_status('r1', 'completed', 'runs/r1/results.txt')
+    assert db._get_conn() is conn
+    info = db.get_status('r1')
+    assert info['status'] == 'completed' and info['results_path'] == 'runs/r1/results.txt'
+    assert db.get_status('missing') is None
+
+
+def test_schema_is_migrated_once_with_wal_and_indexes(db):
+    db.set_status('r1', 'queued')
+    conn = sqlite3.connect(db.DB_PATH)
+    try:
+        assert conn.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+        assert conn.execute('PRAGMA user_version').fetchone()[0] == len(db.MIGRATIONS)
+        indexes = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert {'runs_status_updated', 'runs_updated'} <= indexes
+        plan = conn.execute("EXPLAIN QUERY PLAN SELECT run_id FROM runs WHERE status = ? ORDER BY updated_at",
+                            ('queued',)).fetchall()
+        assert 'runs_status_updated' in ' '.join(str(r) for r in plan)
+    finally:
+        conn.close()
+
+
+def test_existing_unversioned_db_is_upgraded(tmp_path, monkeypatch):
+    path = tmp_path / 'old.db'
+    conn = sqlite3.connect(path)
+    conn.execute('CREATE TABLE runs (run_id TEXT PRIMARY KEY, status TEXT, results_path TEXT, updated_at INTEGER)')
+    conn.execute("INSERT INTO runs VALUES ('old', 'completed', NULL, 1)")
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(status_db, 'DB_PATH', path)
+    try:
+        assert status_db.get_status('old')['status'] == 'completed'
+        assert [r['run_id'] for r in status_db.list_runs('completed')] == ['old']
+    finally:
+        status_db.close()
+
+
+def test_set_status_many_and_list_runs(db):
+    db.set_status_many([('a', 'queued', None), ('b', 'running', None), ('c', 'queued', None)])
+    assert [r['run_id'] for r in db.list_runs('queued')] == ['a', 'c']
+    assert [r['run_id'] for r in db.list_runs()] == ['a', 'b', 'c']
+    assert len(db.list_runs(limit=2)) == 2
+
+
+def test_concurrent_writers(db):
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(200):
+                db.set_status(f'w{n}-{i}', 'running')
+        except Exception as e:  # pragma: no cover - surfaced below
+            errors.append(e)
+        finally:
+            db.close()
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert errors == []
+    assert len(db.list_runs('running')) == 800
@@ -0,0 +1,37 @@
+import datetime
+
+import yaml
+
+from tools import yaml_io
+
+
+def test_loader_matches_safe_load():
+    text = 'title: T\ndate: 2024-01-02\ntags: [a, b]\nnested:\n  n: 1\n  ok: true\n'
+    assert yaml_io.safe_load(text) == yaml.safe_load(text)
+    assert yaml_io.safe_load(text)['date'] == datetime.date(2024, 1, 2)
+
+
+def test_uses_libyaml_when_available():
+    if yaml.__with_libyaml__:
+        assert yaml_io.HAS_LIBYAML and yaml_io.Loader is yaml.CSafeLoader
+    else:
+        assert yaml_io.Loader is yaml.SafeLoader
+
+
+def test_safe_load_rejects_python_tags():
+    try:
+        yaml_io.safe_load('!!python/object/apply:os.system ["echo hi"]')
+    except yaml_io.YAMLError:
+        pass
+    else:
+        raise AssertionError('unsafe tag was accepted')
+
+
+def test_dump_roundtrip_and_load_file(tmp_path):
+    data = {'b': 1, 'a': ['x', 'ü']}
+    text = yaml_io.safe_dump(data, sort_keys=False, allow_unicode=True)
+    assert text.startswith('b: 1')
+    path = tmp_path / 'd.yaml'
+    path.write_text(text, encoding='utf-8')
+    assert yaml_io.load_file(path) == data
+    assert list(yaml_io.safe_load_all('a: 1\n---\nb: 2\n')) == [{'a': 1}, {'b': 2}]
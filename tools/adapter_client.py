@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Shared pooled HTTP client for the LLM adapter and other JSON APIs.
+
+Calling ``requests.post`` directly opens a new TCP connection for every
+request. Debate agents, the insights generator and the Linear integration go
+through this module instead. It keeps one ``requests.Session`` per process,
+with:
+
+- keep-alive connection pooling (``RAILWEB_ADAPTER_POOL_SIZE``, default 10
+  connections per host)
+- retries with exponential backoff on 429 and 5xx responses, honouring
+  ``Retry-After`` (``RAILWEB_ADAPTER_RETRIES``, default 3)
+
+Calls that must not run twice (e.g. Linear's ``issueCreate`` mutation) pass
+``idempotent=False``: they go through a second session that retries only
+failed connections and 429s, where the server did not act on the request. A
+502/504 may come from a proxy after the request went through, so it is not
+retried there.
+
+The underlying urllib3 pool is thread-safe, and the session does not rely on
+cookies, so one client can be shared by concurrent debate agents.
+
+Usage:
+    from tools import adapter_client
+    resp = adapter_client.post(url, json=payload, timeout=30)
+"""
+import os
+import threading
+from typing import Dict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# statuses after which a non-idempotent request is known not to have been processed
+SAFE_RETRY_STATUSES = (429,)
+
+
+class AdapterClient:
+    """A pooled, retrying ``requests.Session`` wrapper."""
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, retries: int = DEFAULT_RETRIES,
+                 backoff_factor: float = DEFAULT_BACKOFF, idempotent: bool = True):
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=0,  # a timed-out LLM call is not retried; it may still be running
+            other=None if idempotent else 0,
+            status=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES if idempotent else SAFE_RETRY_STATUSES,
+            allowed_methods=None,  # adapter calls are POSTs
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.session.post(url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.session.get(url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+# keyed by ``idempotent``
+_CLIENTS: Dict[bool, AdapterClient] = {}
+_LOCK = threading.Lock()
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def get_client(idempotent: bool = True) -> AdapterClient:
+    """Return the process-wide client, creating it on first use."""
+    with _LOCK:
+        client = _CLIENTS.get(idempotent)
+        if client is None:
+            client = _CLIENTS[idempotent] = AdapterClient(
+                pool_size=_env_int('RAILWEB_ADAPTER_POOL_SIZE', DEFAULT_POOL_SIZE),
+                retries=_env_int('RAILWEB_ADAPTER_RETRIES', DEFAULT_RETRIES),
+                idempotent=idempotent,
+            )
+        return client
+
+
+def reset_client() -> None:
+    """Close the shared clients; the next call builds new ones (e.g. after changing env)."""
+    with _LOCK:
+        for client in _CLIENTS.values():
+            client.close()
+        _CLIENTS.clear()
+
+
+def post(url: str, idempotent: bool = True, **kwargs) -> requests.Response:
+    """POST through the shared client; pass ``idempotent=False`` for requests that must not repeat."""
+    return get_client(idempotent).post(url, **kwargs)
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    return get_client().get(url, **kwargs)
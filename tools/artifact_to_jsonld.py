@@ -1,36 +1,130 @@
 #!/usr/bin/env python3
 """Convert an intake artifact (Markdown with YAML front-matter) to JSON-LD.
 
-Usage: tools/artifact_to_jsonld.py path/to/artifact.md > artifact.jsonld
+Usage: tools/artifact_to_jsonld.py path/to/artifact.md [--context MODE] > artifact.jsonld
+       tools/artifact_to_jsonld.py --batch intake/ --out nodes.ndjson [--jobs N] [--resume]
+
+The ``@context`` (intake/context.jsonld) is parsed once per process. By
+default it is inlined into every node; ``--context`` selects a by-reference
+form instead:
+
+- ``inline``: embed the full context (default)
+- ``url``: reference ``--context-url`` (or ``RAILWEB_JSONLD_CONTEXT_URL``)
+- ``relative``: reference intake/context.jsonld by a path relative to the output
+- ``shared``: write one ``context.jsonld`` into the output directory and reference it
+  (in intake/ itself the source file is referenced, never rewritten)
+
+``--batch`` walks a directory for Markdown artifacts with front-matter,
+converts them across a process pool and streams compact NDJSON (one node per
+line, in path order) to ``--out`` or stdout; ``tools/ingest_to_neo4j.py
+--bulk`` reads that file directly. Progress is recorded in
+``<out>.manifest.json`` (completed files and the byte offset after them), so
+``--resume`` truncates any partial tail and continues where a previous export
+stopped; if the output is missing or shorter than that offset it starts over.
 """
-import sys
+import argparse
 import json
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools import yaml_io  # noqa: E402
+from tools.front_matter import FrontMatter, read_front_matter  # noqa: E402
 
 CONTEXT_PATH = Path(__file__).resolve().parents[1] / 'intake' / 'context.jsonld'
+CONTEXT_MODES = ('inline', 'url', 'relative', 'shared')
+SHARED_CONTEXT_NAME = 'context.jsonld'
 
+_CONTEXT_CACHE = {}
+_SHARED_WRITTEN = set()
+_CONTEXT_LOCK = threading.Lock()
 
-def load_front_matter(path: Path):
-    text = path.read_text(encoding='utf8')
-    if text.startswith('---'):
-        parts = text.split('---', 2)
-        if len(parts) >= 3:
-            fm = yaml.safe_load(parts[1])
-            body = parts[2].strip()
-            return fm, body
+
+def load_context(path: Path = CONTEXT_PATH):
+    """Return the parsed ``@context`` value, cached per process until the file changes.
+
+    The returned dict is shared; copy it before mutating.
+    """
+    path = Path(path)
+    mtime = path.stat().st_mtime_ns
+    with _CONTEXT_LOCK:
+        cached = _CONTEXT_CACHE.get(path)
+        if cached is None or cached[0] != mtime:
+            cached = (mtime, json.loads(path.read_text(encoding='utf8'))['@context'])
+            _CONTEXT_CACHE[path] = cached
+        return cached[1]
+
+
+def write_shared_context(out_dir: Path) -> str:
+    """Write the context once into ``out_dir`` and return the reference to use in its sidecars.
+
+    In the intake directory itself the reference points at the source
+    ``CONTEXT_PATH``, which is never rewritten.
+    """
+    target = (Path(out_dir) / SHARED_CONTEXT_NAME).resolve()
+    if target == CONTEXT_PATH.resolve():
+        return SHARED_CONTEXT_NAME
+    with _CONTEXT_LOCK:
+        if target in _SHARED_WRITTEN:
+            return SHARED_CONTEXT_NAME
+    text = json.dumps({'@context': load_context()}, indent=2)
+    if not target.exists() or target.read_text(encoding='utf8') != text:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(text, encoding='utf8')
+    with _CONTEXT_LOCK:
+        _SHARED_WRITTEN.add(target)
+    return SHARED_CONTEXT_NAME
+
+
+def context_reference(mode: str, out_dir: Path = Path('.'), url: str | None = None):
+    """Value for ``to_jsonld(..., context=)`` for nodes written into ``out_dir``.
+
+    Returns None for ``inline`` (embed the context).
+    """
+    if mode == 'inline':
+        return None
+    if mode == 'url':
+        url = url or os.environ.get('RAILWEB_JSONLD_CONTEXT_URL')
+        if not url:
+            raise ValueError('context mode "url" needs a context URL (RAILWEB_JSONLD_CONTEXT_URL)')
+        return url
+    if mode == 'relative':
+        return Path(os.path.relpath(CONTEXT_PATH, Path(out_dir).resolve())).as_posix()
+    if mode == 'shared':
+        return write_shared_context(out_dir)
+    raise ValueError(f'unknown context mode: {mode} (expected one of {", ".join(CONTEXT_MODES)})')
+
+
+def load_artifact(path: Path) -> FrontMatter:
+    """Front-matter of an artifact, with its body read only when accessed."""
+    doc = read_front_matter(path)
+    if doc is not None:
+        return doc
     # fallback: try parse whole as yaml
     try:
-        obj = yaml.safe_load(text)
-        return obj, ''
+        obj = yaml_io.safe_load(Path(path).read_text(encoding='utf8'))
+        return FrontMatter(path, obj)
     except Exception:
         raise ValueError('No YAML front-matter found')
 
 
-def to_jsonld(fm: dict, body: str):
-    ctx = json.loads(CONTEXT_PATH.read_text(encoding='utf8'))
+def load_front_matter(path: Path):
+    doc = load_artifact(path)
+    return doc.data, doc.body
+
+
+def to_jsonld(fm: dict, body, context=None):
+    """Build the JSON-LD node; ``body`` may be a callable so it is only read without a description.
+
+    ``context`` is a reference (URL or path) to use instead of inlining the full ``@context``.
+    """
+    if not fm.get('description') and callable(body):
+        body = body()
     node = {
-        "@context": ctx['@context'],
+        "@context": context if context is not None else dict(load_context()),
         "@id": fm.get('id') or f"urn:railweb:{fm.get('type','artifact')}:{fm.get('title','').lower().replace(' ','-')}",
         "@type": f"rw:{fm.get('type','Artifact').capitalize()}",
         "title": fm.get('title'),
@@ -41,13 +135,139 @@ def to_jsonld(fm: dict, body: str):
     return node
 
 
-def main():
-    if len(sys.argv) < 2:
-        print('Usage: artifact_to_jsonld.py path/to/artifact.md', file=sys.stderr)
-        sys.exit(2)
-    p = Path(sys.argv[1])
-    fm, body = load_front_matter(p)
-    node = to_jsonld(fm, body)
+def discover_artifacts(root: Path):
+    """Markdown files under ``root``, sorted so export order is stable across runs."""
+    return sorted(Path(root).rglob('*.md'))
+
+
+def _export_line(job):
+    """Convert one artifact in a worker; returns ``(path, ndjson line or None, error or None)``."""
+    path, context = job
+    try:
+        doc = read_front_matter(path)
+        if doc is None or not isinstance(doc.data, dict):
+            return path, None, None
+        node = to_jsonld(doc.data, doc.read_body, context=context)
+        return path, json.dumps(node, separators=(',', ':'), ensure_ascii=False, default=str) + '\n', None
+    except Exception as e:
+        return path, None, f'{type(e).__name__}: {e}'
+
+
+def manifest_path(out: Path) -> Path:
+    return out.with_name(out.name + '.manifest.json')
+
+
+def _load_manifest(out: Path):
+    path = manifest_path(out)
+    if not path.exists():
+        return {'offset': 0, 'done': []}
+    return json.loads(path.read_text(encoding='utf8'))
+
+
+def _save_manifest(out: Path, manifest):
+    path = manifest_path(out)
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_text(json.dumps(manifest), encoding='utf8')
+    os.replace(tmp, path)
+
+
+def export_ndjson(root: Path, out=None, jobs: int = 1, context=None, resume: bool = False,
+                  checkpoint_every: int = 100):
+    """Stream every artifact under ``root`` as one compact JSON-LD node per line.
+
+    ``out`` is a file path or None for stdout (no manifest, no resume). Returns
+    counts of written, skipped (no front-matter), failed and already-done files.
+    """
+    root = Path(root)
+    files = discover_artifacts(root)
+    stats = {'written': 0, 'skipped': 0, 'failed': 0, 'resumed': 0}
+    manifest = {'offset': 0, 'done': []}
+    if out is not None:
+        out = Path(out)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        if resume:
+            manifest = _load_manifest(out)
+            size = out.stat().st_size if out.exists() else 0
+            if size < manifest['offset']:
+                # output deleted or truncated since the checkpoint: its lines are gone, start over
+                print(f'{out}: shorter than its manifest offset, exporting from scratch', file=sys.stderr)
+                manifest = {'offset': 0, 'done': []}
+        done = set(manifest['done'])
+        stats['resumed'] = len(done)
+        files = [f for f in files if f.relative_to(root).as_posix() not in done]
+        fh = out.open('r+b' if resume and out.exists() else 'wb')
+        # drop anything written after the last checkpoint (e.g. a partial line)
+        fh.seek(manifest['offset'])
+        fh.truncate()
+    else:
+        fh = sys.stdout.buffer
+    jobs_iter = ((f, context) for f in files)
+    pool = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 and len(files) > 1 else None
+    results = pool.map(_export_line, jobs_iter, chunksize=16) if pool else map(_export_line, jobs_iter)
+    since_checkpoint = 0
+    try:
+        for path, line, error in results:
+            if error is not None:
+                stats['failed'] += 1
+                print(f'{path}: {error}', file=sys.stderr)
+            elif line is None:
+                stats['skipped'] += 1
+            else:
+                fh.write(line.encode('utf8'))
+                stats['written'] += 1
+            if out is None:
+                continue
+            # failed files are retried by the next --resume
+            if error is None:
+                manifest['done'].append(path.relative_to(root).as_posix())
+            since_checkpoint += 1
+            if since_checkpoint >= checkpoint_every:
+                fh.flush()
+                manifest['offset'] = fh.tell()
+                _save_manifest(out, manifest)
+                since_checkpoint = 0
+    finally:
+        if pool:
+            pool.shutdown()
+        fh.flush()
+        if out is not None:
+            manifest['offset'] = fh.tell()
+            _save_manifest(out, manifest)
+            fh.close()
+    return stats
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description='Convert intake artifacts to JSON-LD')
+    p.add_argument('artifact', type=Path, nargs='?', help='single artifact (JSON-LD printed to stdout)')
+    p.add_argument('--batch', type=Path, metavar='DIR', help='export every Markdown artifact under DIR as NDJSON')
+    p.add_argument('--out', type=Path, help='NDJSON output file for --batch (default: stdout)')
+    p.add_argument('--jobs', type=int, default=1, help='worker processes for --batch')
+    p.add_argument('--resume', action='store_true', help='continue a previous --batch export into --out')
+    p.add_argument('--context', choices=CONTEXT_MODES, default='inline', help='how to emit @context')
+    p.add_argument('--context-url', help='context URL for --context url')
+    args = p.parse_args(argv)
+    if args.batch:
+        if args.resume and args.out is None:
+            p.error('--resume needs --out')
+        out_dir = args.out.parent if args.out else Path('.')
+        try:
+            context = context_reference(args.context, out_dir, args.context_url)
+        except ValueError as e:
+            p.error(str(e))
+        stats = export_ndjson(args.batch, args.out, args.jobs, context, args.resume)
+        print(f"Exported {stats['written']} nodes ({stats['skipped']} without front-matter, "
+              f"{stats['failed']} failed, {stats['resumed']} already done)", file=sys.stderr)
+        return
+    if args.artifact is None:
+        p.error('an artifact or --batch is required')
+    try:
+        # stdout is usually redirected next to the artifact; resolve references from there
+        context = context_reference(args.context, args.artifact.parent, args.context_url)
+    except ValueError as e:
+        p.error(str(e))
+    doc = load_artifact(args.artifact)
+    node = to_jsonld(doc.data, doc.read_body, context=context)
     print(json.dumps(node, indent=2))
 
 
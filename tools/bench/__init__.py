@@ -0,0 +1 @@
+# Micro-benchmarks for tools/ (run with `python -m tools.bench.<name>`)
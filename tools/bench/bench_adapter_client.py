@@ -0,0 +1,85 @@
+"""Benchmark per-call overhead of the pooled adapter client.
+
+Serves tools/debate/mock_adapter.py on a free local port and times N
+summarizeRun calls made with plain ``requests.post`` (new connection per
+call) and with ``tools.adapter_client`` (pooled keep-alive session).
+
+The werkzeug dev server always sends ``Connection: close``, so the Flask app
+is fronted by a small HTTP/1.1 keep-alive server here, like the Node adapter
+it stands in for.
+
+Usage: python -m tools.bench.bench_adapter_client [--calls 500]
+"""
+import argparse
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tools.adapter_client import AdapterClient  # noqa: E402
+from tools.debate import mock_adapter  # noqa: E402
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    app = mock_adapter.app.test_client()
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get('Content-Length', 0)))
+        resp = self.app.post(self.path, data=body, content_type=self.headers.get('Content-Type'))
+        data = resp.get_data()
+        self.send_response(resp.status_code)
+        self.send_header('Content-Type', resp.content_type)
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+def serve():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), KeepAliveHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def timed(post, url, calls):
+    payload = {'run_id': 'bench', 'artifacts': [], 'intent': 'bench'}
+    start = time.perf_counter()
+    for _ in range(calls):
+        resp = post(url, json=payload, timeout=10)
+        resp.raise_for_status()
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument('--calls', type=int, default=500)
+    args = p.parse_args(argv)
+
+    server = serve()
+    url = f'http://127.0.0.1:{server.server_port}/api/llm/summarizeRun'
+    client = AdapterClient()
+    try:
+        timed(client.post, url, 10)  # warm up
+        plain = timed(requests.post, url, args.calls)
+        pooled = timed(client.post, url, args.calls)
+    finally:
+        client.close()
+        server.shutdown()
+
+    print(f"{'client':<16}{'total s':>10}{'ms/call':>10}")
+    for name, seconds in (('requests.post', plain), ('adapter_client', pooled)):
+        print(f"{name:<16}{seconds:>10.3f}{seconds / args.calls * 1000:>10.3f}")
+    print(f"speedup: {plain / pooled:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark smart_entity_extraction scaling with document size.
+
+Runs the single-pass extractor and the previous regex + substring-dedup
+implementation over synthetic railroad prose of increasing size and prints
+time per size. The extractor should scale linearly (constant chars/sec).
+
+Usage: python -m tools.bench.bench_entity_extraction [--max-kb 2048]
+"""
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from qid_discovery import extract_entities_from_chunks, smart_entity_extraction  # noqa: E402
+
+PARAGRAPH = (
+    "The Baltimore and Ohio Railroad operated the Camden Station in 1890. "
+    "John Smith and Mary Jones worked for the Pennsylvania Railroad Company near Penn Station. "
+    "Trains of the Reading and Lehigh Valley crossed the Susquehanna River Bridge at Harrisburg. "
+)
+
+
+def synthetic_text(size: int, unique_every: int = 7) -> str:
+    parts = []
+    total = 0
+    i = 0
+    while total < size:
+        # sprinkle in distinct names so the number of candidate entities grows with size
+        extra = f"Engineer Number{chr(65 + i % 26)}{chr(97 + (i // 26) % 26)}{chr(97 + (i // 676) % 26)} arrived. " \
+            if i % unique_every == 0 else ""
+        parts.append(PARAGRAPH + extra)
+        total += len(parts[-1])
+        i += 1
+    return "".join(parts)[:size]
+
+
+def legacy_extraction(text):
+    """The previous implementation's matching and O(n*m) dedup, for comparison."""
+    compound_pattern = r'\b[A-Z][a-z]+(?:\s+(?:and|&|of|the)\s+[A-Z][a-z]+)+(?:\s+[A-Z][a-z]+)*\b'
+    compounds = re.findall(compound_pattern, text)
+    names = list(compounds)
+    for match in re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2}\b', text):
+        if any(match in compound for compound in compounds):
+            continue
+        names.append(match)
+    seen = set()
+    return [n for n in names if not (n.lower() in seen or seen.add(n.lower()))]
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    fn(*args)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser()
+    p.add_argument("--max-kb", type=int, default=2048)
+    p.add_argument("--legacy-max-kb", type=int, default=256, help="legacy run is quadratic; cap its size")
+    args = p.parse_args(argv)
+
+    print(f"{'size_kb':>8} {'single_pass_s':>14} {'MB/s':>7} {'streamed_s':>11} {'legacy_s':>9}")
+    kb = 16
+    while kb <= args.max_kb:
+        text = synthetic_text(kb * 1024)
+        t_single = timed(smart_entity_extraction, text)
+        chunks = [text[i:i + 65536] for i in range(0, len(text), 65536)]
+        t_stream = timed(extract_entities_from_chunks, chunks)
+        t_legacy = f"{timed(legacy_extraction, text):9.3f}" if kb <= args.legacy_max_kb else f"{'-':>9}"
+        print(f"{kb:8d} {t_single:14.3f} {len(text) / t_single / 1e6:7.2f} {t_stream:11.3f} {t_legacy}")
+        kb *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark JSON extraction from noisy LLM output.
+
+Builds synthetic responses of increasing size (prose, code fences, a stray
+``{`` early on and the insights object at the end) and times the single-pass
+``extract_first_json`` against the previous prefix-by-prefix ``json.loads``
+loop. The old approach is quadratic, so it is only run up to --legacy-max-kb.
+
+Usage: python -m tools.bench.bench_json_extraction [--max-kb 1024] [--legacy-max-kb 16]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tools.debate.generate_debate_insights import extract_first_json, extract_json_objects  # noqa: E402
+
+PROSE = (
+    "The experts weighed the scale converter requirements against the published NMRA standards, "
+    "noting that \"HO\" and \"N\" conversions need 0.1mm precision. "
+)
+INSIGHTS = {"summary": "Consensus reached on precision targets.", "score": 0.82,
+            "actions": ["Validate formulas", "Add mobile layout"]}
+
+
+def synthetic_response(size: int) -> str:
+    head = "Here is my analysis {see notes below}. Stray brace: { \n```\n"
+    body = (PROSE * (size // len(PROSE) + 1))[:size]
+    return head + body + "\n```\n" + json.dumps(INSIGHTS) + "\nThanks."
+
+
+def legacy_extract_first_json(s):
+    """The previous implementation: json.loads on every prefix from the first '{'."""
+    start = s.find('{')
+    if start == -1:
+        return None
+    for end in range(start + 1, len(s) + 1):
+        try:
+            json.loads(s[start:end])
+            return s[start:end]
+        except Exception:
+            continue
+    return None
+
+
+def timed(fn, text, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn(text)
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument('--max-kb', type=int, default=1024)
+    p.add_argument('--legacy-max-kb', type=int, default=16)
+    args = p.parse_args(argv)
+
+    print(f"{'size':>10}{'single-pass ms':>16}{'MB/s':>8}{'legacy ms':>16}")
+    kb = 1
+    while kb <= args.max_kb:
+        text = synthetic_response(kb * 1024)
+        seconds, found = timed(extract_first_json, text, 5)
+        assert json.loads(found) == INSIGHTS and extract_json_objects(text) == [found]
+        legacy = ''
+        if kb <= args.legacy_max_kb:
+            legacy_seconds, legacy_found = timed(legacy_extract_first_json, text, 1)
+            # the stray brace defeats the old scan entirely
+            legacy = f"{legacy_seconds * 1000:.1f}" + ('' if legacy_found else ' (none)')
+        print(f"{kb:>8}KB{seconds * 1000:>16.3f}{len(text) / seconds / 1e6:>8.1f}{legacy:>16}")
+        kb *= 4
+
+
+if __name__ == '__main__':
+    main()
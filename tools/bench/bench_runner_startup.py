@@ -0,0 +1,52 @@
+"""Benchmark per-run latency of the in-process and subprocess debate runners.
+
+Serves tools/debate/mock_adapter.py on a free local port, points the example
+debate at it (``RAILWEB_DEBATE_ADAPTER_URL``) and times N runs of
+``debate_runner.run_debate`` in each mode. Subprocess runs pay interpreter
+startup and module imports every time; in-process runs pay them once.
+
+Usage: python -m tools.bench.bench_runner_startup [--runs 10]
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tools.bench.bench_adapter_client import serve  # noqa: E402
+from tools.orchestrate import debate_runner  # noqa: E402
+
+
+def timed(mode, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = debate_runner.run_debate(mode=mode)
+        if not result['ok'] or 'SIMULATED SUMMARY' not in result['output']:
+            raise SystemExit(f'{mode} run failed:\n{result["output"]}')
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument('--runs', type=int, default=10)
+    args = p.parse_args(argv)
+
+    server = serve()
+    os.environ['RAILWEB_DEBATE_ADAPTER_URL'] = f'http://127.0.0.1:{server.server_port}'
+    try:
+        debate_runner.run_debate(mode='inproc')  # warm up
+        sub = timed('subprocess', args.runs)
+        inproc = timed('inproc', args.runs)
+    finally:
+        server.shutdown()
+
+    print(f"{'mode':<12}{'total s':>10}{'ms/run':>10}")
+    for name, seconds in (('subprocess', sub), ('inproc', inproc)):
+        print(f"{name:<12}{seconds:>10.3f}{seconds / args.runs * 1000:>10.1f}")
+    print(f"speedup: {sub / inproc:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
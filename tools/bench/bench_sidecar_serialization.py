@@ -0,0 +1,102 @@
+"""Benchmark enrichment sidecar serialization on claim-heavy entities.
+
+Builds a JSON-LD node whose ``enrichment_data`` holds raw Wikidata-style
+claims (nested snaks, qualifiers, references and datetimes) and times:
+
+- legacy: recursive datetime cleanup copy + ``json.dumps(indent=2, default=str)``
+- ``tools.json_io`` pretty, compact, and compact + gzip (orjson when installed)
+
+Usage: python -m tools.bench.bench_sidecar_serialization [--entities 20] [--claims 200] [--rounds 5]
+"""
+import argparse
+import datetime
+import gzip
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tools import json_io  # noqa: E402
+
+
+def make_claim(pid, i):
+    when = datetime.datetime(1900 + i % 120, 1 + i % 12, 1 + i % 28)
+    snak = {'snaktype': 'value', 'property': pid,
+            'datavalue': {'value': {'entity-type': 'item', 'numeric-id': 1000 + i, 'id': f'Q{1000 + i}'},
+                          'type': 'wikibase-entityid'}}
+    return {
+        'mainsnak': snak,
+        'type': 'statement',
+        'id': f'Q42${i:08d}-{pid}',
+        'rank': 'normal',
+        'qualifiers': {'P580': [{'snaktype': 'value', 'property': 'P580', 'datavalue': {'value': when}}]},
+        'references': [{'hash': f'{i:040x}', 'snaks': {'P248': [snak]}, 'retrieved': when.date()}],
+    }
+
+
+def make_node(entities, claims):
+    enrichment = {}
+    for e in range(entities):
+        props = {}
+        for i in range(claims):
+            pid = f'P{i % 40 + 1}'
+            props.setdefault(pid, []).append(make_claim(pid, e * claims + i))
+        enrichment[f'Q{e + 1}'] = {'qid': f'Q{e + 1}', 'label': f'Entity {e}', 'properties': props,
+                                   'fetched_at': datetime.datetime(2024, 5, 1, 12, 0, e % 60)}
+    return {'@id': 'urn:railweb:note:bench', '@type': 'rw:Note', 'title': 'Bench', 'enrichment_data': enrichment}
+
+
+def legacy(node):
+    def clean_for_json(obj):
+        if hasattr(obj, 'isoformat'):
+            return obj.isoformat()
+        elif isinstance(obj, dict):
+            return {k: clean_for_json(v) for k, v in obj.items()}
+        elif isinstance(obj, list):
+            return [clean_for_json(v) for v in obj]
+        return obj
+    return json.dumps(clean_for_json(node), indent=2, default=str).encode('utf8')
+
+
+def compact_gzip(node):
+    return gzip.compress(json_io.dumps(node, compact=True), compresslevel=json_io.GZIP_LEVEL)
+
+
+def timed(fn, node, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        data = fn(node)
+    return (time.perf_counter() - start) / rounds, len(data)
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument('--entities', type=int, default=20)
+    p.add_argument('--claims', type=int, default=200)
+    p.add_argument('--rounds', type=int, default=5)
+    args = p.parse_args(argv)
+
+    node = make_node(args.entities, args.claims)
+    if json.loads(legacy(node)) != json.loads(json_io.dumps(node)):
+        raise SystemExit('json_io output differs from the legacy serializer')
+
+    cases = (
+        ('legacy', legacy),
+        ('pretty', json_io.dumps),
+        ('compact', lambda n: json_io.dumps(n, compact=True)),
+        ('compact+gzip', compact_gzip),
+    )
+    backend = 'orjson' if json_io.HAS_ORJSON else 'json'
+    print(f'{args.entities} entities x {args.claims} claims, backend={backend}')
+    print(f"{'mode':<14}{'ms':>10}{'KB':>10}")
+    base = None
+    for name, fn in cases:
+        seconds, size = timed(fn, node, args.rounds)
+        base = base or seconds
+        print(f"{name:<14}{seconds * 1000:>10.1f}{size / 1024:>10.0f}   {base / seconds:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
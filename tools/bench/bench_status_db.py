@@ -0,0 +1,76 @@
+"""Benchmark status updates per second from a pool of writer threads.
+
+Compares the previous status_db pattern (connect, CREATE TABLE IF NOT EXISTS,
+write, commit and close on every call, rollback journal) with the current
+thread-local WAL connections, against a temporary database.
+
+Usage: python -m tools.bench.bench_status_db [--updates 2000] [--threads 4]
+"""
+import argparse
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tools.orchestrate import status_db  # noqa: E402
+
+
+def legacy_set_status(path, run_id, status):
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS runs (run_id TEXT PRIMARY KEY, status TEXT, results_path TEXT, updated_at INTEGER)"
+    )
+    conn.commit()
+    conn.execute(
+        "INSERT OR REPLACE INTO runs (run_id, status, results_path, updated_at) VALUES (?, ?, ?, ?)",
+        (run_id, status, None, int(time.time())),
+    )
+    conn.commit()
+    conn.close()
+
+
+def timed(set_status, updates, threads):
+    per_thread = updates // threads
+    errors = []
+
+    def worker(n):
+        try:
+            for i in range(per_thread):
+                set_status(f'run-{n}-{i % 50}', 'running')
+        except sqlite3.OperationalError as e:
+            errors.append(e)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    return per_thread * threads / (time.perf_counter() - start), len(errors)
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument('--updates', type=int, default=2000)
+    p.add_argument('--threads', type=int, default=4)
+    args = p.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / 'legacy.db'
+        legacy = timed(lambda r, s: legacy_set_status(legacy_path, r, s), args.updates, args.threads)
+        status_db.DB_PATH = Path(tmp) / 'status.db'
+        current = timed(status_db.set_status, args.updates, args.threads)
+        status_db.close()
+
+    print(f"{'store':<10}{'updates/s':>12}{'errors':>8}")
+    for name, (rate, errors) in (('legacy', legacy), ('status_db', current)):
+        print(f"{name:<10}{rate:>12.0f}{errors:>8}")
+    print(f"speedup: {current[0] / legacy[0]:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
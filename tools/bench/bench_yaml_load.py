@@ -0,0 +1,76 @@
+"""Benchmark YAML parse throughput on the intake/ corpus.
+
+Parses every ``*.yml`` / ``*.yaml`` file and the front-matter of every
+Markdown file under intake/ with PyYAML's pure-Python ``SafeLoader`` and with
+``tools.yaml_io`` (``CSafeLoader`` when libyaml is available), checks both give
+the same data, and reports MB/s.
+
+Usage: python -m tools.bench.bench_yaml_load [--rounds 20] [--root intake]
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from tools import yaml_io  # noqa: E402
+from tools.front_matter import _scan  # noqa: E402
+
+REPO = Path(__file__).resolve().parents[2]
+
+
+def corpus(root):
+    docs = []
+    for path in sorted(root.rglob('*')):
+        if path.suffix in ('.yml', '.yaml'):
+            docs.append(path.read_text(encoding='utf-8'))
+        elif path.suffix == '.md':
+            scanned = _scan(path)
+            if scanned is not None:
+                docs.append(scanned[0])
+    # keep only documents both loaders accept
+    usable = []
+    for text in docs:
+        try:
+            yaml.load(text, Loader=yaml.SafeLoader)
+        except yaml.YAMLError:
+            continue
+        usable.append(text)
+    return usable
+
+
+def timed(load, docs, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for text in docs:
+            load(text)
+    return time.perf_counter() - start
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument('--rounds', type=int, default=20)
+    p.add_argument('--root', type=Path, default=REPO / 'intake')
+    args = p.parse_args(argv)
+
+    docs = corpus(args.root)
+    mismatched = sum(yaml.load(t, Loader=yaml.SafeLoader) != yaml_io.safe_load(t) for t in docs)
+    if mismatched:
+        raise SystemExit(f'{mismatched} documents parse differently with {yaml_io.Loader.__name__}')
+    mb = sum(len(t.encode('utf-8')) for t in docs) * args.rounds / 1e6
+
+    pure = timed(lambda t: yaml.load(t, Loader=yaml.SafeLoader), docs, args.rounds)
+    fast = timed(yaml_io.safe_load, docs, args.rounds)
+
+    print(f'{len(docs)} documents, {mb / args.rounds:.2f} MB per round, {args.rounds} rounds')
+    print(f"{'loader':<14}{'total s':>10}{'MB/s':>10}")
+    for name, seconds in (('SafeLoader', pure), (yaml_io.Loader.__name__, fast)):
+        print(f"{name:<14}{seconds:>10.3f}{mb / seconds:>10.2f}")
+    print(f"speedup: {pure / fast:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
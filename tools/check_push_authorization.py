@@ -11,9 +11,11 @@ Usage: python tools/check_push_authorization.py <file1> [file2 ...]
 Exits with 0 when checks pass, non-zero when missing authorization.
 """
 import sys
-import yaml
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools import yaml_io  # noqa: E402
+
 CONTRACT_PATH = Path('intake/agent_operational_contract.yaml')
 
 
@@ -21,7 +23,7 @@ def load_contract():
     if not CONTRACT_PATH.exists():
         print(f"Contract not found at {CONTRACT_PATH}")
         sys.exit(1)
-    return yaml.safe_load(CONTRACT_PATH.read_text())
+    return yaml_io.safe_load(CONTRACT_PATH.read_text())
 
 
 def find_meta_files():
@@ -44,7 +46,7 @@ def find_meta_files():
 
 def check_meta_for_authorization(meta_path: Path, field_name: str):
     try:
-        data = yaml.safe_load(meta_path.read_text())
+        data = yaml_io.safe_load(meta_path.read_text())
         if not isinstance(data, dict):
             return False
         return field_name in data and data[field_name]
@@ -0,0 +1,107 @@
+"""Convergence tracking shared by the debate orchestrators.
+
+After each round, every expert's position is compared with its previous one:
+
+- overlap: Jaccard similarity of the expert's stated items (recommendations,
+  concerns, agreements, disagreements, compromises), case/whitespace-folded
+- confidence delta: absolute change in the reported confidence
+
+An expert whose overlap is at least ``overlap_threshold`` and whose confidence
+moved by at most ``confidence_tolerance`` for ``stable_rounds`` consecutive
+rounds is *stable*. Positions that carry no signal (failed calls, fallback
+parses of non-JSON answers, or no stated items) never count as stable and
+reset the expert's streak.
+
+Orchestrators skip a stable expert in later rounds, carrying its last
+position forward, and stop the debate once every expert is stable.
+"""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+POSITION_KEYS = ("recommendations", "key_concerns", "agreements", "disagreements", "compromises")
+
+
+def position_items(position: Dict[str, Any]) -> Set[str]:
+    items: Set[str] = set()
+    for key in POSITION_KEYS:
+        values = position.get(key) or []
+        if isinstance(values, str):
+            values = [values]
+        for value in values:
+            folded = " ".join(str(value).lower().split())
+            if folded:
+                items.add(f"{key}:{folded}")
+    return items
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def _confidence(position: Dict[str, Any]) -> Optional[float]:
+    try:
+        return float(position.get("confidence"))
+    except (TypeError, ValueError):
+        return None
+
+
+def _informative(position: Any) -> bool:
+    if not isinstance(position, dict) or position.get("status") in ("error", "timeout"):
+        return False
+    if position.get("parse_status", "success") != "success":
+        return False
+    return bool(position_items(position))
+
+
+class ConvergenceTracker:
+    def __init__(
+        self,
+        overlap_threshold: float = 0.8,
+        confidence_tolerance: float = 0.05,
+        stable_rounds: int = 1,
+    ) -> None:
+        self.overlap_threshold = overlap_threshold
+        self.confidence_tolerance = confidence_tolerance
+        self.stable_rounds = stable_rounds
+        self._last: Dict[str, Dict[str, Any]] = {}
+        self._streak: Dict[str, int] = {}
+        self.history: List[Dict[str, Any]] = []
+
+    def update(self, round_number: int, positions: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        """Record a round's positions (only the experts that ran) and return their drift."""
+        drift: Dict[str, Dict[str, Any]] = {}
+        for name, position in positions.items():
+            if not _informative(position):
+                # failed calls and unparsed answers say nothing about convergence
+                self._streak[name] = 0
+                drift[name] = {"overlap": None, "confidence_delta": None, "stable": False}
+                continue
+            previous = self._last.get(name)
+            overlap = delta = None
+            stable = False
+            if previous is not None:
+                overlap = jaccard(position_items(previous), position_items(position))
+                before, after = _confidence(previous), _confidence(position)
+                delta = abs(after - before) if before is not None and after is not None else None
+                stable = overlap >= self.overlap_threshold and (delta or 0.0) <= self.confidence_tolerance
+            self._streak[name] = self._streak.get(name, 0) + 1 if stable else 0
+            self._last[name] = position
+            drift[name] = {"overlap": overlap, "confidence_delta": delta, "stable": self.is_stable(name)}
+        self.history.append({"round": round_number, "drift": drift})
+        return drift
+
+    def is_stable(self, name: str) -> bool:
+        return self._streak.get(name, 0) >= self.stable_rounds
+
+    def active(self, names: Iterable[str]) -> List[str]:
+        """Names that still need to run next round."""
+        return [name for name in names if not self.is_stable(name)]
+
+    def converged(self, names: Iterable[str]) -> bool:
+        names = list(names)
+        return bool(names) and all(self.is_stable(name) for name in names)
+
+    def last_position(self, name: str) -> Optional[Dict[str, Any]]:
+        return self._last.get(name)
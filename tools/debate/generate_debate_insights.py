@@ -6,16 +6,22 @@ It writes `debate_insights.json` and also writes a short `debate_digest.txt` wit
 
 Added robustness:
 - Loads the prompt template from `tools/debate/debate_insights.prompt` if present.
-- Attempts to extract the first balanced JSON object from the LLM response if there is surrounding text.
+- Extracts the first balanced JSON object from the LLM response if there is surrounding text
+  (single pass, brace- and string-aware).
 - Retries the adapter call once with a stricter prompt if parsing fails.
 """
 from __future__ import annotations
 import json
 import re
 import sys
-from typing import Any, Dict, Optional
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-import requests
+# allow running as a script from any directory
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from tools import adapter_client, llm_cache  # noqa: E402
+
+ADAPTER_URL = 'http://127.0.0.1:3001/api/llm/explainChange'
 
 
 DEFAULT_PROMPT = (
@@ -33,38 +39,70 @@ def load_prompt(path: str = 'tools/debate/debate_insights.prompt') -> str:
         return DEFAULT_PROMPT
 
 
-_JSON_OBJ_RE = re.compile(r"\{.*?\}", re.DOTALL)
+# inside braces: a complete (or unterminated) JSON string, or a brace
+_BRACE_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"?|[{}]')
+_DECODER = json.JSONDecoder()
 
 
-def extract_first_json(s: str) -> Optional[str]:
-    """Try to extract the first balanced JSON object from a string.
+def _balanced_spans(s: str) -> List[Tuple[int, int]]:
+    """Return (start, end) of every balanced {...} span, ordered by start.
 
-    This uses a conservative regex that may fail on deeply nested braces but covers common LLM artifacts
-    like surrounding prose or code fences. If no object is found, return None.
+    One pass over the text: prose between top-level objects is skipped with
+    str.find, and braces inside JSON strings are ignored once a span is open.
+    """
+    spans: List[Tuple[int, int]] = []
+    pos = 0
+    while True:
+        pos = s.find('{', pos)
+        if pos == -1:
+            break
+        stack: List[int] = []
+        for m in _BRACE_TOKEN_RE.finditer(s, pos):
+            tok = m.group()
+            if tok == '{':
+                stack.append(m.start())
+            elif tok == '}':
+                spans.append((stack.pop(), m.end()))
+                if not stack:
+                    break
+        else:
+            # unbalanced to the end of the text: keep what was matched, give up on the rest
+            break
+        pos = m.end()
+    spans.sort()
+    return spans
+
+
+def iter_json_objects(s: str) -> Iterator[str]:
+    """Yield each top-level JSON object embedded in ``s``, in order.
+
+    Balanced brace spans are validated with ``JSONDecoder.raw_decode``; when a
+    span is not valid JSON (e.g. prose in braces), objects nested inside it are
+    still found.
     """
     if not s:
-        return None
-    # First, try a simple approach: find first occurrence of '{' and attempt incremental parse.
-    start = s.find('{')
-    if start == -1:
-        return None
-    for end in range(start + 1, len(s) + 1):
-        try:
-            candidate = s[start:end]
-            obj = json.loads(candidate)
-            # success
-            return candidate
-        except Exception:
+        return
+    covered = 0
+    for start, end in _balanced_spans(s):
+        if start < covered:
             continue
-    # fallback: regex that attempts to grab a braced block (may be imperfect)
-    m = _JSON_OBJ_RE.search(s)
-    if m:
         try:
-            json.loads(m.group(0))
-            return m.group(0)
-        except Exception:
-            return None
-    return None
+            obj, stop = _DECODER.raw_decode(s, start)
+        except ValueError:
+            continue
+        if stop == end and isinstance(obj, dict):
+            covered = end
+            yield s[start:end]
+
+
+def extract_json_objects(s: str) -> List[str]:
+    """Return every top-level JSON object embedded in ``s``."""
+    return list(iter_json_objects(s))
+
+
+def extract_first_json(s: str) -> Optional[str]:
+    """Return the first JSON object embedded in ``s`` (e.g. surrounded by prose or code fences), or None."""
+    return next(iter_json_objects(s), None)
 
 
 def call_adapter(summary: str, prompt: str, timeout: int = 20) -> Dict[str, Any]:
@@ -73,9 +111,17 @@ def call_adapter(summary: str, prompt: str, timeout: int = 20) -> Dict[str, Any]
         'diff_text': summary,
         'goal': prompt,
     }
-    resp = requests.post('http://127.0.0.1:3001/api/llm/explainChange', json=payload, timeout=timeout)
-    resp.raise_for_status()
-    return resp.json()
+
+    def call() -> Dict[str, Any]:
+        resp = adapter_client.post(ADAPTER_URL, json=payload, timeout=timeout)
+        resp.raise_for_status()
+        return resp.json()
+
+    def usable(data: Dict[str, Any]) -> None:
+        validate_insights(parse_insights_from_adapter_response(data))
+
+    # only answers that parse and validate are cached; a bad one is retried next run
+    return llm_cache.cached_call(ADAPTER_URL, prompt, call, validate=usable, diff_text=summary)
 
 
 def parse_insights_from_adapter_response(data: Dict[str, Any]) -> Dict[str, Any]:
@@ -224,6 +270,7 @@ def main() -> int:
         f.write(digest)
 
     print('Wrote', out_json)
+    print('LLM cache:', llm_cache.stats())
     return 0
 
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Any, Dict, Optional
-import requests
+
+from tools import adapter_client
 
 
 class LLMAgent:
@@ -21,7 +22,7 @@ class LLMAgent:
             url = f"{self.adapter_url}/api/llm/explainChange"
 
         try:
-            resp = requests.post(url, json=payload, timeout=10)
+            resp = adapter_client.post(url, json=payload, timeout=10)
         except Exception as e:
             return {"text": f"(LLM error: {e})", "meta": None}
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
-from typing import List, Protocol, Any
+import asyncio
+import inspect
+from typing import Any, AsyncIterator, Dict, List, Optional, Protocol
 
 
 class Agent(Protocol):
@@ -9,6 +11,13 @@ class Agent(Protocol):
         ...
 
 
+class AsyncAgent(Protocol):
+    name: str
+
+    async def propose(self, context: Any) -> str:
+        ...
+
+
 class DebateManager:
     def __init__(self) -> None:
         self.agents: List[Agent] = []
@@ -29,3 +38,42 @@ class DebateManager:
                 round_responses.append(f"{agent.name}: {resp}")
             history.append(round_responses)
         return history
+
+    async def async_run_rounds(
+        self, context: Any, rounds: int = 1, concurrency: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Run rounds with agents proposing concurrently, streaming results.
+
+        Agents may implement ``propose`` as a coroutine or a plain method (run in
+        a worker thread). At most ``concurrency`` proposals run at once
+        (default: all agents). Yields, in completion order,
+        ``{"type": "response", "round", "index", "agent", "entry"}`` for each
+        agent and then ``{"type": "round", "round", "responses"}`` with the
+        round's entries in registration order, matching ``run_rounds``.
+        """
+        if rounds < 1:
+            raise ValueError("rounds must be >= 1")
+        if concurrency is not None and concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
+        semaphore = asyncio.BoundedSemaphore(concurrency or max(1, len(self.agents)))
+
+        async def propose(index: int, agent: Agent):
+            async with semaphore:
+                if inspect.iscoroutinefunction(agent.propose):
+                    resp = await agent.propose(context)
+                else:
+                    resp = await asyncio.to_thread(agent.propose, context)
+            return index, agent, f"{agent.name}: {resp}"
+
+        for r in range(1, rounds + 1):
+            tasks = [asyncio.ensure_future(propose(i, a)) for i, a in enumerate(self.agents)]
+            round_responses: List[Optional[str]] = [None] * len(tasks)
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    index, agent, entry = await next_done
+                    round_responses[index] = entry
+                    yield {"type": "response", "round": r, "index": index, "agent": agent.name, "entry": entry}
+            finally:
+                for task in tasks:
+                    task.cancel()
+            yield {"type": "round", "round": r, "responses": round_responses}
@@ -16,6 +16,9 @@ from pathlib import Path
 
 
 ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT))
+# every case answers the same prompt differently, so cached responses must not leak between them
+os.environ.setdefault('RAILWEB_LLM_CACHE', 'off')
 GEN_PATH = ROOT / 'tools' / 'debate' / 'generate_debate_insights.py'
 
 
@@ -49,16 +52,16 @@ def run_case(name, response_text, expect_return, expect_score=None, expect_calls
     # write debate_summary.md
     (tmp / 'debate_summary.md').write_text('mock debate summary')
 
-    # monkeypatch requests.post by assigning into requests at runtime
-    import requests
+    # monkeypatch the shared adapter client's post at runtime
+    from tools import adapter_client
 
     def fake_post(url, json=None, timeout=None):
         fake_post.calls += 1
         return make_resp(response_text)
 
     fake_post.calls = 0
-    requests_post_orig = requests.post
-    requests.post = fake_post
+    post_orig = adapter_client.post
+    adapter_client.post = fake_post
 
     cwd = os.getcwd()
     try:
@@ -75,7 +78,7 @@ def run_case(name, response_text, expect_return, expect_score=None, expect_calls
         print('PASS' if ok else 'FAIL')
     finally:
         # restore
-        requests.post = requests_post_orig
+        adapter_client.post = post_orig
         os.chdir(cwd)
 
 
@@ -85,7 +88,7 @@ def main():
     run_case('noisy_response', messy, expect_return=0, expect_score=0.9, expect_calls=1)
 
     # Case 2: first fails then second succeeds
-    # We emulate by swapping requests.post inside run_case, so simulate by running
+    # We emulate by swapping adapter_client.post inside run_case, so simulate by running
     # a small wrapper: first call returns non-json, second returns valid json.
     print('\n=== retry_case')
     tmp = ROOT / '.local_test_tmp' / 'retry_case'
@@ -94,7 +97,7 @@ def main():
     tmp.mkdir(parents=True)
     (tmp / 'debate_summary.md').write_text('mock debate summary')
 
-    import requests as _requests
+    from tools import adapter_client
 
     def fake_post_retry(url, json=None, timeout=None):
         fake_post_retry.calls += 1
@@ -103,8 +106,8 @@ def main():
         return make_resp('{"summary": "OK", "score": 0.5, "actions": ["Do B"]}')
 
     fake_post_retry.calls = 0
-    orig = _requests.post
-    _requests.post = fake_post_retry
+    orig = adapter_client.post
+    adapter_client.post = fake_post_retry
     cwd = os.getcwd()
     try:
         os.chdir(tmp)
@@ -117,7 +120,7 @@ def main():
             ok = ok and abs(j.get('score', 0) - 0.5) < 1e-6
         print('PASS' if ok else 'FAIL')
     finally:
-        _requests.post = orig
+        adapter_client.post = orig
         os.chdir(cwd)
 
     # Case 3: invalid score -> returns 4 and no file
@@ -2,16 +2,30 @@
 
 This file provides run_real_debate() which the tests import. It uses the
 existing DebateManager and LLMAgent that posts to the mock adapter.
+
+The orchestrator calls it in-process (see tools/orchestrate/debate_runner.py)
+or, for isolation, as ``python -m tools.debate.run_real_debate``. The adapter
+URL can be overridden with ``RAILWEB_DEBATE_ADAPTER_URL``.
 """
-from pathlib import Path
-import time
+import asyncio
+import os
+import sys
+from typing import Any, List, Optional, TextIO
+
 from .manager import DebateManager
 from .llm_agent import LLMAgent
 
+DEFAULT_ADAPTER_URL = 'http://127.0.0.1:3001'
+
+
+def run_real_debate(out: Optional[TextIO] = None, adapter_url: Optional[str] = None) -> List[Any]:
+    """Run the example debate, printing a summary to ``out`` (stdout by default).
 
-def run_real_debate():
+    Returns the round history (a list of per-round response lists).
+    """
+    out = out if out is not None else sys.stdout
     # configure an LLMAgent to point at the local mock adapter (port 3001)
-    adapter_url = 'http://127.0.0.1:3001'
+    adapter_url = adapter_url or os.environ.get('RAILWEB_DEBATE_ADAPTER_URL', DEFAULT_ADAPTER_URL)
     agent = LLMAgent(name='mock-agent', adapter_url=adapter_url)
 
     manager = DebateManager()
@@ -20,15 +34,22 @@ def run_real_debate():
     # simple context used by tests/demo
     context = {'topic': 'Example debate run'}
 
-    history = manager.run_rounds(context, rounds=1)
-    # Print a short human-friendly summary for tests to assert
-    for i, round_out in enumerate(history, start=1):
-        print(f"Round {i}")
-        for entry in round_out:
-            if isinstance(entry, dict):
-                print(entry.get('text', str(entry)))
-            else:
-                print(entry)
+    # Print a short human-friendly summary for tests to assert, streaming each
+    # response as soon as its agent finishes
+    async def stream():
+        history = []
+        current = None
+        async for event in manager.async_run_rounds(context, rounds=1):
+            if event['type'] == 'round':
+                history.append(event['responses'])
+                continue
+            if event['round'] != current:
+                current = event['round']
+                print(f"Round {current}", file=out)
+            print(event['entry'], file=out)
+        return history
+
+    return asyncio.run(stream())
 
 
 if __name__ == '__main__':
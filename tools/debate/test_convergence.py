@@ -0,0 +1,51 @@
+from tools.debate.convergence import ConvergenceTracker, jaccard, position_items
+
+
+def pos(recs, confidence=0.8):
+    return {"recommendations": recs, "confidence": confidence}
+
+
+def test_position_items_fold_case_and_whitespace():
+    assert position_items(pos(["Add  Tests", "add tests"])) == {"recommendations:add tests"}
+    assert jaccard(set(), set()) == 1.0
+
+
+def test_expert_becomes_stable_when_positions_stop_drifting():
+    tracker = ConvergenceTracker(overlap_threshold=0.8, confidence_tolerance=0.05)
+    tracker.update(1, {"A": pos(["x", "y"]), "B": pos(["p"], 0.5)})
+    assert tracker.active(["A", "B"]) == ["A", "B"]
+
+    drift = tracker.update(2, {"A": pos(["X", "y"], 0.82), "B": pos(["q"], 0.9)})
+    assert drift["A"]["overlap"] == 1.0 and drift["A"]["stable"]
+    assert not drift["B"]["stable"]
+    assert tracker.active(["A", "B"]) == ["B"]
+    assert not tracker.converged(["A", "B"])
+
+    tracker.update(3, {"B": pos(["q"], 0.88)})
+    assert tracker.converged(["A", "B"])
+    assert tracker.last_position("A")["confidence"] == 0.82
+
+
+def test_errors_reset_stability():
+    tracker = ConvergenceTracker(stable_rounds=2)
+    tracker.update(1, {"A": pos(["x"])})
+    tracker.update(2, {"A": pos(["x"])})
+    assert not tracker.is_stable("A")
+    tracker.update(3, {"A": {"status": "error"}})
+    tracker.update(4, {"A": pos(["x"])})
+    assert not tracker.is_stable("A")
+    tracker.update(5, {"A": pos(["x"])})
+    assert tracker.is_stable("A")
+
+
+def test_fallback_and_empty_positions_never_count_as_stable():
+    tracker = ConvergenceTracker()
+    fallback = {"analysis": "prose", "key_concerns": [], "recommendations": [], "confidence": 0.5,
+                "parse_status": "fallback"}
+    tracker.update(1, {"A": fallback, "B": pos([])})
+    drift = tracker.update(2, {"A": dict(fallback, analysis="other prose"), "B": pos([])})
+    assert not drift["A"]["stable"] and not drift["B"]["stable"]
+    assert not tracker.converged(["A", "B"])
+    # a parsed position after fallbacks compares with the last parsed one
+    tracker.update(3, {"A": pos(["x"])})
+    assert tracker.update(4, {"A": pos(["x"])})["A"]["stable"]
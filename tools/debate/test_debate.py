@@ -1,3 +1,6 @@
+import asyncio
+import time
+
 import pytest
 
 from tools.debate.manager import DebateManager
@@ -31,3 +34,54 @@ def test_invalid_rounds():
     dm.register(a)
     with pytest.raises(ValueError):
         dm.run_rounds("ctx", rounds=0)
+
+
+def _collect(dm, *args, **kwargs):
+    async def run():
+        return [event async for event in dm.async_run_rounds(*args, **kwargs)]
+    return asyncio.run(run())
+
+
+class SleepyAgent:
+    def __init__(self, name, delay):
+        self.name = name
+        self.delay = delay
+
+    async def propose(self, context):
+        await asyncio.sleep(self.delay)
+        return f"{self.name}->{context}"
+
+
+def test_async_run_rounds_streams_in_completion_order():
+    dm = DebateManager()
+    dm.register(SleepyAgent("slow", 0.1))
+    dm.register(EchoAgent("sync", prefix="S->"))
+    events = _collect(dm, "ctx", rounds=2)
+    responses = [e for e in events if e["type"] == "response"]
+    rounds = [e for e in events if e["type"] == "round"]
+    assert [e["agent"] for e in responses[:2]] == ["sync", "slow"]
+    # round results keep registration order, like run_rounds
+    assert [r["responses"] for r in rounds] == [["slow: slow->ctx", "sync: S->ctx"]] * 2
+    assert events[2]["type"] == "round" and events[2]["round"] == 1
+
+
+def test_async_run_rounds_respects_concurrency():
+    dm = DebateManager()
+    for name in "ABCD":
+        dm.register(SleepyAgent(name, 0.1))
+    start = time.monotonic()
+    _collect(dm, "ctx", concurrency=4)
+    parallel = time.monotonic() - start
+    start = time.monotonic()
+    _collect(dm, "ctx", concurrency=1)
+    serial = time.monotonic() - start
+    assert parallel < 0.3 <= serial
+
+
+def test_async_run_rounds_invalid_args():
+    dm = DebateManager()
+    dm.register(EchoAgent("A"))
+    with pytest.raises(ValueError):
+        _collect(dm, "ctx", rounds=0)
+    with pytest.raises(ValueError):
+        _collect(dm, "ctx", concurrency=0)
@@ -17,12 +17,12 @@ class DummyResp:
 
 
 def test_llm_agent_propose_monkeypatch(monkeypatch):
-    # Simulate requests.post returning a successful JSON payload
+    # Simulate the adapter client returning a successful JSON payload
     def fake_post(url, json=None, timeout=None):
         assert "/api/llm/summarizeRun" in url
         return DummyResp(200, {"ok": True, "text": "SIMULATED SUMMARY"})
 
-    monkeypatch.setattr("requests.post", fake_post)
+    monkeypatch.setattr("tools.adapter_client.post", fake_post)
 
     agent = LLMAgent("LLMTest", adapter_url="http://localhost:3001", mode="summarize")
     ctx = {"run_id": "r1", "artifacts": [], "intent": "test"}
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Persistent SQLite-backed cache for network lookups.
+
+Used by ``qid_discovery`` and ``enrich_adapter`` so repeated Wikidata lookups
+for the same names/QIDs are served from disk instead of the network.
+
+Features:
+- TTL-based expiry (separate TTL for negative entries, i.e. cached misses)
+- size-bounded LRU eviction (least recently read entries go first)
+- hit/miss counters per cache instance
+
+The cache lives under ``$RAILWEB_CACHE_DIR`` (default ``~/.cache/railweb``).
+Set ``RAILWEB_WIKIDATA_CACHE=off`` to bypass it.
+
+Usage: python tools/disk_cache.py [stats|clear]
+"""
+import json
+import os
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Returned by DiskCache.get() when a key is absent or expired. A cached miss
+# (negative entry) returns None instead.
+MISS = object()
+
+WIKIDATA_TTL = 7 * 24 * 3600
+WIKIDATA_NEGATIVE_TTL = 24 * 3600
+WIKIDATA_MAX_ENTRIES = 50000
+
+
+def _json_default(obj):
+    # dates from YAML/Wikidata helpers are stored the way the JSON-LD sidecars write them
+    return obj.isoformat() if hasattr(obj, 'isoformat') else str(obj)
+
+
+def default_cache_dir() -> Path:
+    return Path(os.environ.get('RAILWEB_CACHE_DIR') or Path.home() / '.cache' / 'railweb')
+
+
+class DiskCache:
+    """Key/value cache of JSON-serializable values stored in one SQLite file."""
+
+    def __init__(self, path, ttl: Optional[float] = None, negative_ttl: Optional[float] = None,
+                 max_entries: int = 10000):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl if negative_ttl is not None else ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.negative_hits = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT, negative INTEGER, "
+            "expires_at REAL, accessed_at REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Any:
+        """Return the cached value, None for a cached miss, or MISS."""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, negative, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or (row[2] is not None and row[2] <= now):
+                if row is not None:
+                    self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                    self._conn.commit()
+                self.misses += 1
+                return MISS
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            if row[1]:
+                self.negative_hits += 1
+                return None
+            self.hits += 1
+            return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._put(key, json.dumps(value, default=_json_default), False, ttl if ttl is not None else self.ttl)
+
+    def set_miss(self, key: str, ttl: Optional[float] = None) -> None:
+        """Record that a lookup found nothing, so it is not retried until expiry."""
+        self._put(key, None, True, ttl if ttl is not None else self.negative_ttl)
+
+    def _put(self, key: str, value: Optional[str], negative: bool, ttl: Optional[float]) -> None:
+        now = time.time()
+        expires_at = now + ttl if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, negative, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, value, int(negative), expires_at, now),
+            )
+            count = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            if count > self.max_entries:
+                excess = count - self.max_entries
+                self._conn.execute(
+                    "DELETE FROM entries WHERE key IN (SELECT key FROM entries ORDER BY accessed_at LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'hits': self.hits,
+            'negative_hits': self.negative_hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self),
+        }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+_INSTANCES: Dict[Path, DiskCache] = {}
+_INSTANCES_LOCK = threading.Lock()
+
+
+def wikidata_cache() -> Optional[DiskCache]:
+    """Return the shared Wikidata lookup cache, or None when disabled."""
+    if os.environ.get('RAILWEB_WIKIDATA_CACHE', '').lower() in ('0', 'off', 'false', 'no'):
+        return None
+    path = default_cache_dir() / 'wikidata.sqlite'
+    with _INSTANCES_LOCK:
+        cache = _INSTANCES.get(path)
+        if cache is None:
+            cache = DiskCache(path, ttl=WIKIDATA_TTL, negative_ttl=WIKIDATA_NEGATIVE_TTL,
+                              max_entries=WIKIDATA_MAX_ENTRIES)
+            _INSTANCES[path] = cache
+        return cache
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    cache = wikidata_cache()
+    if cache is None:
+        print('Wikidata cache disabled (RAILWEB_WIKIDATA_CACHE)')
+        return
+    if command == 'clear':
+        cache.clear()
+        print(f'Cleared {cache.path}')
+    elif command == 'stats':
+        print(f'{cache.path}: {len(cache)} entries')
+    else:
+        print(f'Unknown command: {command}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,22 +5,34 @@ This module provides a simplified interface to the chronograph-vault
 Wikidata enrichment functions for use in the railweb intake pipeline.
 """
 import sys
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional
 
+try:
+    import requests
+except ImportError:
+    requests = None
+
 # Add chronograph-vault scripts to path
 VAULT_SCRIPTS = Path(__file__).resolve().parent / 'external' / 'chronograph-vault' / '_scripts'
 VAULT_ROOT = Path(__file__).resolve().parent / 'external' / 'chronograph-vault'
 sys.path.insert(0, str(VAULT_SCRIPTS))
 sys.path.insert(0, str(VAULT_ROOT))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from disk_cache import MISS, wikidata_cache
+import json_io
 
 try:
     from emit_from_wikidata_qid import fetch_label_birth_death, fetch_spouses_with_qualifiers, fetch_children_for_pair
     from repair_family_links import fetch_entity
     from generate_enriched_profile import fetch_claims, resolve_labels, generate_markdown, send_event_prompt_to_perplexity
+    VAULT_AVAILABLE = True
 except ImportError as e:
     print(f"Warning: Could not import chronograph-vault functions: {e}", file=sys.stderr)
+    # Stub results are never written to the Wikidata cache
+    VAULT_AVAILABLE = False
     # Provide stub functions for testing
     def fetch_label_birth_death(qid: str):
         return {"label": f"STUB-{qid}", "birth": None, "death": None}
@@ -44,7 +56,15 @@ def enrich_with_wikidata(qid: str) -> Dict:
     """Fetch enrichment data for a single Wikidata QID.
     
     Returns a dict with normalized properties suitable for JSON-LD.
+    Successful lookups are served from the on-disk Wikidata cache when present.
     """
+    cache = wikidata_cache() if VAULT_AVAILABLE else None
+    cache_key = f"entity:{qid}"
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not MISS and cached is not None:
+            return cached
+
     try:
         # Fetch basic person data
         person_data = fetch_label_birth_death(qid)
@@ -63,7 +83,9 @@ def enrich_with_wikidata(qid: str) -> Dict:
         # Add raw entity properties for advanced use
         if "claims" in entity_data:
             enrichment["properties"] = entity_data["claims"]
-            
+
+        if cache is not None:
+            cache.set(cache_key, enrichment)
         return enrichment
         
     except Exception as e:
@@ -75,6 +97,103 @@ def enrich_with_wikidata(qid: str) -> Dict:
         }
 
 
+WIKIDATA_API_URL = "https://www.wikidata.org/w/api.php"
+WBGETENTITIES_MAX_IDS = 50  # API limit for anonymous clients
+# batch results are shaped by normalize_wikidata_entity, not like enrich_with_wikidata's
+# "entity:" entries, so the two paths cache under different keys
+BATCH_CACHE_PREFIX = "wbgetentities:"
+
+
+def fetch_entities_batch(qids: List[str], timeout: int = 20) -> Dict[str, Dict]:
+    """Fetch labels and claims for up to 50 QIDs with a single wbgetentities call."""
+    params = {
+        "action": "wbgetentities",
+        "format": "json",
+        "ids": "|".join(qids),
+        "props": "labels|claims",
+        "languages": "en",
+    }
+    response = requests.get(WIKIDATA_API_URL, params=params, timeout=timeout)
+    response.raise_for_status()
+    return response.json().get("entities", {})
+
+
+def _first_time_value(claims: Dict, prop: str) -> str:
+    for stmt in claims.get(prop, []):
+        value = stmt.get("mainsnak", {}).get("datavalue", {}).get("value")
+        if isinstance(value, dict) and value.get("time"):
+            return value["time"].lstrip("+").split("T")[0]
+    return ""
+
+
+def normalize_wikidata_entity(qid: str, entity: Dict) -> Dict:
+    """Shape a raw wbgetentities entity like enrich_with_wikidata's output."""
+    if not entity or "missing" in entity:
+        return {
+            "qid": qid,
+            "error": "entity not found",
+            "wikidata_url": f"https://www.wikidata.org/wiki/{qid}"
+        }
+    claims = entity.get("claims", {})
+    return {
+        "qid": qid,
+        "label": entity.get("labels", {}).get("en", {}).get("value", ""),
+        "birth_date": _first_time_value(claims, "P569"),
+        "death_date": _first_time_value(claims, "P570"),
+        "wikidata_url": f"https://www.wikidata.org/wiki/{qid}",
+        "properties": claims
+    }
+
+
+def enrich_with_wikidata_batch(qids: List[str], max_workers: int = 4) -> Dict[str, Dict]:
+    """Enrich many QIDs with one wbgetentities request per 50 identifiers.
+
+    Cached entities are not re-fetched; the remaining QIDs are grouped into
+    chunks that are fetched concurrently. A chunk whose request fails falls
+    back to per-QID ``enrich_with_wikidata``. Without chronograph-vault
+    (stub/offline mode) every QID goes through ``enrich_with_wikidata`` and
+    nothing is fetched. Returns {qid: enrichment} in input order.
+    """
+    unique = list(dict.fromkeys(qids))
+    if not VAULT_AVAILABLE:
+        return {qid: enrich_with_wikidata(qid) for qid in unique}
+    results: Dict[str, Dict] = {}
+    cache = wikidata_cache()
+    pending = []
+    for qid in unique:
+        cached = cache.get(BATCH_CACHE_PREFIX + qid) if cache is not None else MISS
+        if cached is not MISS and cached is not None:
+            results[qid] = cached
+        else:
+            pending.append(qid)
+
+    chunks = [pending[i:i + WBGETENTITIES_MAX_IDS] for i in range(0, len(pending), WBGETENTITIES_MAX_IDS)]
+    if chunks and requests is None:
+        print("Warning: requests library not available, enriching QIDs one at a time", file=sys.stderr)
+        results.update({qid: enrich_with_wikidata(qid) for qid in pending})
+        chunks = []
+
+    if chunks:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(chunks)))) as pool:
+            futures = {pool.submit(fetch_entities_batch, chunk): chunk for chunk in chunks}
+            for future in as_completed(futures):
+                chunk = futures[future]
+                try:
+                    entities = future.result()
+                except Exception as e:
+                    print(f"Warning: batch Wikidata fetch failed ({e}), enriching {len(chunk)} QIDs one at a time",
+                          file=sys.stderr)
+                    results.update({qid: enrich_with_wikidata(qid) for qid in chunk})
+                    continue
+                for qid in chunk:
+                    enrichment = normalize_wikidata_entity(qid, entities.get(qid))
+                    if cache is not None and "error" not in enrichment:
+                        cache.set(BATCH_CACHE_PREFIX + qid, enrichment)
+                    results[qid] = enrichment
+
+    return {qid: results[qid] for qid in unique}
+
+
 def enrich_with_perplexity_profile(qid: str) -> Dict:
     """Generate a comprehensive enriched profile using both Wikidata and Perplexity.
     
@@ -132,7 +251,9 @@ def enrich_with_perplexity_profile(qid: str) -> Dict:
         }
 
 
-def enrich_with_wikidata_and_perplexity(artifact_path: str, use_perplexity_profile: bool = False) -> str:
+def enrich_with_wikidata_and_perplexity(artifact_path: str, use_perplexity_profile: bool = False,
+                                        context_mode: str = 'inline', context_url: Optional[str] = None,
+                                        compact: bool = False, compress: bool = False) -> str:
     """Main entrypoint: enrich an intake artifact with Wikidata + optional Perplexity data.
     
     Handles both real Wikidata QIDs and synthetic railweb identifiers (RW_xxxxxxxx).
@@ -140,6 +261,10 @@ def enrich_with_wikidata_and_perplexity(artifact_path: str, use_perplexity_profi
     Args:
         artifact_path: Path to Markdown file with YAML front-matter
         use_perplexity_profile: If True, use enhanced Perplexity profile generation
+        context_mode: How the sidecar carries @context (see artifact_to_jsonld.CONTEXT_MODES)
+        context_url: Context URL for context_mode='url'
+        compact: Write the sidecar without indentation
+        compress: Gzip the sidecar (written as .jsonld.gz)
         
     Returns:
         Path to enriched JSON-LD sidecar file
@@ -147,15 +272,17 @@ def enrich_with_wikidata_and_perplexity(artifact_path: str, use_perplexity_profi
     # Import here to avoid circular imports
     import sys
     sys.path.insert(0, str(Path(__file__).parent))
-    from artifact_to_jsonld import load_front_matter, to_jsonld
+    from artifact_to_jsonld import context_reference, load_artifact, to_jsonld
     from qid_discovery import process_mixed_identifiers
     
     artifact = Path(artifact_path)
     if not artifact.exists():
         raise FileNotFoundError(f"Artifact not found: {artifact_path}")
     
-    # Load front-matter
-    fm, body = load_front_matter(artifact)
+    # Load front-matter (cached); the body is only read if to_jsonld needs it
+    doc = load_artifact(artifact)
+    fm, body = doc.data, doc.read_body
+    context = context_reference(context_mode, artifact.parent, context_url)
     
     # Check for identifiers to enrich (QIDs or synthetic IDs)
     identifiers = fm.get("wikidata_qids", [])
@@ -164,17 +291,23 @@ def enrich_with_wikidata_and_perplexity(artifact_path: str, use_perplexity_profi
     if not identifiers:
         print(f"No identifiers found in {artifact_path}, skipping enrichment")
         # Still create JSON-LD without enrichment
-        node = to_jsonld(fm, body)
+        node = to_jsonld(fm, body, context=context)
     else:
         # Enrich with mixed identifiers (QIDs + synthetic)
         enrichments = {}
+        batched = {}
+        if not use_perplexity_profile:
+            # Fetch every real QID up front in as few wbgetentities calls as possible
+            batched = enrich_with_wikidata_batch(
+                [id for id in identifiers if id.startswith('Q') and id[1:].isdigit()]
+            )
         for identifier in identifiers:
             if identifier.startswith('Q') and identifier[1:].isdigit():
                 # Real Wikidata QID
                 if use_perplexity_profile:
                     enrichments[identifier] = enrich_with_perplexity_profile(identifier)
                 else:
-                    enrichments[identifier] = enrich_with_wikidata(identifier)
+                    enrichments[identifier] = batched[identifier]
             elif identifier.startswith('RW_'):
                 # Synthetic railweb identifier
                 from qid_discovery import enrich_synthetic_entity
@@ -193,7 +326,7 @@ def enrich_with_wikidata_and_perplexity(artifact_path: str, use_perplexity_profi
                     enrichments[identifier] = enrich_with_wikidata(discovered_id)
         
         # Create enriched JSON-LD
-        node = to_jsonld(fm, body)
+        node = to_jsonld(fm, body, context=context)
         node["enrichment_data"] = enrichments
         
         # Add sameAs links for real QIDs only
@@ -208,22 +341,8 @@ def enrich_with_wikidata_and_perplexity(artifact_path: str, use_perplexity_profi
         if synthetic_ids:
             node["synthetic_entities"] = {id: entity_metadata.get(id, {}) for id in synthetic_ids}
     
-    # Write enriched JSON-LD sidecar
-    sidecar_path = artifact.with_suffix('.jsonld')
-    
-    # Ensure all values are JSON serializable
-    def clean_for_json(obj):
-        if hasattr(obj, 'isoformat'):  # datetime objects
-            return obj.isoformat()
-        elif isinstance(obj, dict):
-            return {k: clean_for_json(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [clean_for_json(v) for v in obj]
-        else:
-            return obj
-    
-    clean_node = clean_for_json(node)
-    sidecar_path.write_text(json.dumps(clean_node, indent=2, default=str), encoding='utf8')
+    # Write enriched JSON-LD sidecar (datetimes are converted during serialization)
+    sidecar_path = json_io.write_json(artifact.with_suffix('.jsonld'), node, compact=compact, compress=compress)
     
     print(f"Enriched artifact written to {sidecar_path}")
     return str(sidecar_path)
@@ -231,13 +350,26 @@ def enrich_with_wikidata_and_perplexity(artifact_path: str, use_perplexity_profi
 
 def main():
     if len(sys.argv) < 2:
-        print("Usage: enrich_adapter.py path/to/artifact.md [--perplexity]")
+        print("Usage: enrich_adapter.py path/to/artifact.md [--perplexity] "
+              "[--context inline|url|relative|shared] [--context-url URL] [--compact] [--gzip]")
         sys.exit(2)
     
     artifact_path = sys.argv[1]
     use_perplexity = "--perplexity" in sys.argv
     
-    sidecar_path = enrich_with_wikidata_and_perplexity(artifact_path, use_perplexity_profile=use_perplexity)
+    def option(name, default=None):
+        if name in sys.argv and sys.argv.index(name) + 1 < len(sys.argv):
+            return sys.argv[sys.argv.index(name) + 1]
+        return default
+    
+    sidecar_path = enrich_with_wikidata_and_perplexity(
+        artifact_path,
+        use_perplexity_profile=use_perplexity,
+        context_mode=option("--context", "inline"),
+        context_url=option("--context-url"),
+        compact="--compact" in sys.argv,
+        compress="--gzip" in sys.argv,
+    )
     print(f"Enriched sidecar: {sidecar_path}")
 
 
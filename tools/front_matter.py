@@ -0,0 +1,105 @@
+"""Header-only reader for Markdown YAML front-matter.
+
+``read_front_matter`` reads an artifact line by line only up to the closing
+``---`` delimiter and parses that YAML. The body is read from disk on first
+access of ``FrontMatter.body``, so callers that only need metadata never
+load it.
+
+Parsed front-matter is cached per file, keyed by path, mtime and size. A
+pipeline that runs several stages (discovery, enrichment, validation) over
+the same artifact parses its YAML once; editing the file invalidates the
+entry. Each call returns a fresh copy of the data, so callers may mutate it.
+"""
+import copy
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional, Tuple
+
+from tools import yaml_io
+
+DELIMITER = '---'
+MAX_ENTRIES = 512
+
+_CACHE: 'OrderedDict[str, Tuple[Tuple[int, int], Any, int]]' = OrderedDict()
+_LOCK = threading.Lock()
+_STATS = {'hits': 0, 'misses': 0}
+
+
+class FrontMatter:
+    """Parsed front-matter of one file plus lazy access to its body."""
+
+    def __init__(self, path: Path, data: Any, body_offset: Optional[int] = None) -> None:
+        self.path = Path(path)
+        self.data = data
+        # byte offset just past the closing delimiter; None means there is no body
+        self.body_offset = body_offset
+        self._body: Optional[str] = None
+
+    def read_body(self) -> str:
+        if self._body is None:
+            if self.body_offset is None:
+                self._body = ''
+            else:
+                with self.path.open('rb') as fh:
+                    fh.seek(self.body_offset)
+                    self._body = fh.read().decode('utf8').strip()
+        return self._body
+
+    @property
+    def body(self) -> str:
+        return self.read_body()
+
+
+def _scan(path: Path) -> Optional[Tuple[str, int]]:
+    """Return the front-matter YAML text and the body offset, or None if there is no block."""
+    with path.open('rb') as fh:
+        first = fh.readline()
+        if not first.startswith(DELIMITER.encode()):
+            return None
+        lines = [first[len(DELIMITER):]]
+        for line in fh:
+            if line.strip() == DELIMITER.encode():
+                return b''.join(lines).decode('utf8'), fh.tell()
+            lines.append(line)
+    return None
+
+
+def read_front_matter(path) -> Optional[FrontMatter]:
+    """Return the file's front-matter, or None if it does not start with a ``---`` block.
+
+    YAML errors propagate and are not cached.
+    """
+    path = Path(path)
+    st = path.stat()
+    key = str(path.resolve())
+    stamp = (st.st_mtime_ns, st.st_size)
+    with _LOCK:
+        entry = _CACHE.get(key)
+        if entry is not None and entry[0] == stamp:
+            _CACHE.move_to_end(key)
+            _STATS['hits'] += 1
+            return FrontMatter(path, copy.deepcopy(entry[1]), entry[2])
+        _STATS['misses'] += 1
+    scanned = _scan(path)
+    if scanned is None:
+        return None
+    text, offset = scanned
+    data = yaml_io.safe_load(text)
+    with _LOCK:
+        _CACHE[key] = (stamp, data, offset)
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > MAX_ENTRIES:
+            _CACHE.popitem(last=False)
+    return FrontMatter(path, copy.deepcopy(data), offset)
+
+
+def cache_info() -> dict:
+    with _LOCK:
+        return dict(_STATS, entries=len(_CACHE))
+
+
+def clear_cache() -> None:
+    with _LOCK:
+        _CACHE.clear()
+        _STATS.update(hits=0, misses=0)
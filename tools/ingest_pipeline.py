@@ -2,21 +2,35 @@
 
 Discover intake/*.yaml or *.yml files, validate against schema, and emit artifacts.
 Provides a dry-run mode and simple audit logging.
+
+Large intake trees can be processed with ``--incremental`` (only files whose
+content hash changed since the previous run are re-validated and re-emitted;
+a different or edited schema re-processes everything)
+and ``--jobs N`` (schema validation fans out over a process pool).
 """
 from __future__ import annotations
 
 import argparse
 import glob
+import hashlib
 import json
 import logging
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
+
+from jsonschema import ValidationError
 
-from jsonschema import validate, ValidationError
+# allow running as `python tools/ingest_pipeline.py` as well as `-m tools.ingest_pipeline`
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+from tools import schema_registry, yaml_io  # noqa: E402
 
 LOG = logging.getLogger("ingest")
 
+MANIFEST_NAME = "ingest-manifest.json"
+
 
 def discover_intake(path="."):
     pattern = os.path.join(path, "intake", "**", "*.yml")
@@ -27,10 +41,7 @@ def discover_intake(path="."):
 
 
 def load_json_schema(schema_name: str):
-    base = os.path.join(os.path.dirname(__file__), "..", "schema")
-    path = os.path.abspath(os.path.join(base, schema_name))
-    with open(path, "r", encoding="utf-8") as fh:
-        return json.load(fh)
+    return schema_registry.load_schema(schema_name)
 
 
 def read_file(path: str):
@@ -38,17 +49,89 @@ def read_file(path: str):
         return fh.read()
 
 
-def validate_intake(path: str, schema: dict):
-    import yaml
-
-    content = yaml.safe_load(read_file(path))
+def validate_intake(path: str, schema):
+    """Validate one intake file; ``schema`` is a schema dict or a name under schema/."""
+    content = yaml_io.safe_load(read_file(path))
     try:
-        validate(instance=content, schema=schema)
+        schema_registry.validate(content, schema)
         return True, content
     except ValidationError as e:
         return False, str(e)
 
 
+def file_sha256(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def schema_fingerprint(schema_name: str) -> dict:
+    """Identify the schema a run validated against: its resolved path and content hash."""
+    path = schema_registry.resolve_schema_path(schema_name)
+    return {"path": str(path), "sha256": file_sha256(str(path))}
+
+
+def load_manifest(path: str, schema: dict | None = None) -> dict:
+    """Return the {intake path: {"sha256", "emitted"}} manifest of a previous run.
+
+    If ``schema`` (a ``schema_fingerprint``) differs from the one the manifest
+    was written with, the manifest is ignored so every file is validated again.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    if schema is not None and data.get("schema") != schema:
+        LOG.info("Incremental: schema changed since the last run, re-processing all files")
+        return {}
+    return data.get("files", {})
+
+
+def save_manifest(path: str, files: dict, run_id: str, schema: dict | None = None):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as fh:
+        json.dump({"run_id": run_id, "schema": schema, "files": files}, fh, indent=2, sort_keys=True)
+    os.replace(tmp, path)
+
+
+def select_changed(files, manifest: dict):
+    """Split files into changed and unchanged lists against a previous manifest.
+
+    Also returns a {path: sha256} map for every file so the caller can record
+    the new hashes once the changed files are processed.
+    A file is only considered unchanged if its hash matches and the artifact it
+    emitted last time is still on disk.
+    """
+    hashes = {p: file_sha256(p) for p in files}
+    changed, unchanged = [], []
+    for p in files:
+        prev = manifest.get(p)
+        if prev and prev.get("sha256") == hashes[p] and os.path.exists(prev.get("emitted") or ""):
+            unchanged.append(p)
+        else:
+            changed.append(p)
+    return changed, unchanged, hashes
+
+
+def validate_many(files, schema, jobs: int = 1):
+    """Validate files, optionally across a process pool. Results keep input order.
+
+    Pass the schema by name when using ``jobs > 1`` so each worker compiles it
+    once from the registry instead of unpickling a fresh dict per chunk.
+    """
+    if jobs <= 1 or len(files) < 2:
+        return [validate_intake(p, schema) for p in files]
+    chunksize = max(1, len(files) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(validate_intake, files, repeat(schema), chunksize=chunksize))
+
+
 def emit_artifact(out_dir: str, basename: str, content: dict):
     os.makedirs(out_dir, exist_ok=True)
     path = os.path.join(out_dir, f"{basename}.json")
@@ -73,6 +156,11 @@ def main(argv=None):
     parser.add_argument("--out", default="exports")
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("--incremental", action="store_true",
+                        help="skip files whose content hash matches the previous run's manifest")
+    parser.add_argument("--manifest", default=None,
+                        help=f"manifest path for --incremental (default: <out>/{MANIFEST_NAME})")
+    parser.add_argument("--jobs", type=int, default=1, help="worker processes for schema validation")
     args = parser.parse_args(argv)
 
     logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
@@ -80,15 +168,27 @@ def main(argv=None):
     files = discover_intake(args.path)
     LOG.info("Discovered %d intake files", len(files))
 
-    schema = load_json_schema(args.schema)
+    # fail fast on a missing or invalid schema before spawning any workers
+    schema_registry.get_validator(args.schema)
 
     run_id = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
     provenance = make_provenance(run_id)
 
     audit = {"run_id": run_id, "files": [], "errors": []}
 
-    for p in files:
-        ok, result = validate_intake(p, schema)
+    manifest_path = args.manifest or os.path.join(args.out, MANIFEST_NAME)
+    schema = schema_fingerprint(args.schema) if args.incremental else None
+    manifest = load_manifest(manifest_path, schema) if args.incremental else {}
+    if args.incremental:
+        todo, unchanged, hashes = select_changed(files, manifest)
+        LOG.info("Incremental: %d changed, %d unchanged", len(todo), len(unchanged))
+    else:
+        todo, unchanged, hashes = files, [], {}
+
+    for p in unchanged:
+        audit["files"].append({"path": p, "ok": True, "unchanged": True, "emitted": manifest[p]["emitted"]})
+
+    for p, (ok, result) in zip(todo, validate_many(todo, args.schema, args.jobs)):
         entry = {"path": p, "ok": bool(ok)}
         if ok:
             entry["summary"] = {"title": result.get("title", "")}
@@ -96,15 +196,21 @@ def main(argv=None):
                 basename = os.path.splitext(os.path.basename(p))[0]
                 outpath = emit_artifact(args.out, basename, {"intake": result, "provenance": provenance})
                 entry["emitted"] = outpath
+                if args.incremental:
+                    manifest[p] = {"sha256": hashes[p], "emitted": outpath}
         else:
             entry["error"] = result
             audit["errors"].append({"path": p, "error": result})
+            manifest.pop(p, None)
         audit["files"].append(entry)
 
     # always emit audit in dry-run and normal
     if not args.dry_run:
         emit_artifact(args.out, f"audit-{run_id}", audit)
         emit_artifact(args.out, f"provenance-{run_id}", provenance)
+        if args.incremental:
+            # drop entries for intake files that no longer exist
+            save_manifest(manifest_path, {p: manifest[p] for p in files if p in manifest}, run_id, schema)
     else:
         LOG.info("Dry-run: audit summary: %s", json.dumps(audit, indent=2)[:1000])
 
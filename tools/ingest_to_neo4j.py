@@ -1,38 +1,261 @@
 #!/usr/bin/env python3
 """Simple ingestion helper: reads JSON-LD and upserts nodes into Neo4j.
 
-Usage: tools/ingest_to_neo4j.py artifact.jsonld
+Usage:
+    tools/ingest_to_neo4j.py artifact.jsonld
+    tools/ingest_to_neo4j.py --bulk exports/ [--batch-size 1000]   # *.jsonld and *.jsonld.gz
+    tools/ingest_to_neo4j.py --bulk nodes.jsonl     # one JSON-LD node per line ('-' for stdin)
+
+Bulk mode sends nodes as `UNWIND $rows AS row MERGE ...` batches over a
+single session of one pooled driver, after creating the Artifact.id
+uniqueness constraint, and reports rows/sec.
+
+With --entities, the `enrichment_data`, `sameAs` and `synthetic_entities`
+computed by enrich_adapter are stored as (:Artifact)-[:REFERENCES]->(:Entity)
+edges. All writes are MERGEs, so re-ingesting the same export is idempotent.
 """
-import sys
+import argparse
 import json
+import sys
+import time
+from itertools import islice
 from pathlib import Path
 
-from neo4j import GraphDatabase
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools import json_io  # noqa: E402
+
+try:
+    from neo4j import GraphDatabase
+except ImportError:
+    GraphDatabase = None
 
 NEO_URL = 'bolt://localhost:7687'
 NEO_USER = 'neo4j'
 NEO_PASSWORD = 'test'
 
+DEFAULT_BATCH_SIZE = 1000
+DEFAULT_POOL_SIZE = 10
+
+# The uniqueness constraint also creates the index MERGE uses to find Artifact.id
+SCHEMA_STATEMENTS = [
+    'CREATE CONSTRAINT artifact_id IF NOT EXISTS FOR (n:Artifact) REQUIRE n.id IS UNIQUE',
+]
+ENTITY_SCHEMA_STATEMENTS = [
+    'CREATE CONSTRAINT entity_id IF NOT EXISTS FOR (e:Entity) REQUIRE e.id IS UNIQUE',
+]
+
+BULK_UPSERT = '''
+UNWIND $rows AS row
+MERGE (n:Artifact {id: row.id})
+SET n.title = row.title, n.description = row.description, n.tags = row.tags, n.provenance = row.provenance, n.type = row.type
+'''
+
+BULK_REFERENCES = '''
+UNWIND $rows AS row
+MATCH (a:Artifact {id: row.artifact_id})
+MERGE (e:Entity {id: row.id})
+SET e.label = coalesce(row.label, e.label), e.type = coalesce(row.type, e.type),
+    e.is_synthetic = row.is_synthetic, e.wikidata_url = coalesce(row.wikidata_url, e.wikidata_url)
+MERGE (a)-[:REFERENCES]->(e)
+'''
+
 
 def upsert_node(tx, node):
+    # same properties as the bulk path (see node_to_row), so both store provenance alike
     q = '''
     MERGE (n:Artifact {id: $id})
-    SET n.title = $title, n.description = $description, n.tags = $tags, n.provenance = $prov, n.type = $type
+    SET n.title = $title, n.description = $description, n.tags = $tags, n.provenance = $provenance, n.type = $type
     RETURN n
     '''
-    tx.run(q, id=node.get('@id'), title=node.get('title'), description=node.get('description'), tags=node.get('tags'), prov=node.get('provenance'), type=node.get('@type'))
+    tx.run(q, **node_to_row(node))
 
 
-def main():
-    if len(sys.argv) < 2:
-        print('Usage: ingest_to_neo4j.py artifact.jsonld', file=sys.stderr)
-        sys.exit(2)
-    p = Path(sys.argv[1])
-    node = json.loads(p.read_text(encoding='utf8'))
-    driver = GraphDatabase.driver(NEO_URL, auth=(NEO_USER, NEO_PASSWORD))
+def node_to_row(node):
+    """Flatten a JSON-LD node into the parameter map used by BULK_UPSERT.
+
+    Neo4j properties cannot hold maps, so provenance is stored as a JSON string.
+    """
+    prov = node.get('provenance')
+    if isinstance(prov, (dict, list)):
+        prov = json.dumps(prov, sort_keys=True, default=str)
+    return {
+        'id': node.get('@id'),
+        'title': node.get('title'),
+        'description': node.get('description'),
+        'tags': node.get('tags') or [],
+        'provenance': prov,
+        'type': node.get('@type'),
+    }
+
+
+def entity_rows(node):
+    """Return one BULK_REFERENCES row per entity an enriched node refers to.
+
+    Entities come from ``enrichment_data`` (keyed by identifier), ``sameAs``
+    Wikidata links and ``synthetic_entities`` metadata; each entity id
+    appears once.
+    """
+    artifact_id = node.get('@id')
+    rows = {}
+
+    def add(entity_id, label=None, entity_type=None, wikidata_url=None):
+        if not entity_id:
+            return
+        row = rows.setdefault(entity_id, {
+            'artifact_id': artifact_id,
+            'id': entity_id,
+            'label': None,
+            'type': None,
+            'is_synthetic': entity_id.startswith('RW_'),
+            'wikidata_url': None,
+        })
+        row['label'] = row['label'] or label
+        row['type'] = row['type'] or entity_type
+        row['wikidata_url'] = row['wikidata_url'] or wikidata_url
+
+    for identifier, data in (node.get('enrichment_data') or {}).items():
+        data = data if isinstance(data, dict) else {}
+        entity_id = data.get('qid') or data.get('id') or identifier
+        url = data.get('wikidata_url') if not entity_id.startswith('RW_') else None
+        add(entity_id, data.get('label') or None, data.get('type'), url)
+
+    same_as = node.get('sameAs') or []
+    for url in [same_as] if isinstance(same_as, str) else same_as:
+        add(url.rstrip('/').rsplit('/', 1)[-1], wikidata_url=url)
+
+    for entity_id, meta in (node.get('synthetic_entities') or {}).items():
+        meta = meta if isinstance(meta, dict) else {}
+        add(entity_id, meta.get('name'), meta.get('type'))
+
+    return list(rows.values())
+
+
+def _iter_lines(fh):
+    for line in fh:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def _sidecars(root: Path):
+    """Sidecar files under ``root``; where both ``x.jsonld`` and ``x.jsonld.gz`` exist, only the newer one."""
+    newest = {}
+    for p in [*root.rglob('*.jsonld'), *root.rglob('*.jsonld' + json_io.GZIP_SUFFIX)]:
+        key = p.with_name(p.name.removesuffix(json_io.GZIP_SUFFIX))
+        if key not in newest or p.stat().st_mtime_ns > newest[key].stat().st_mtime_ns:
+            newest[key] = p
+    return [newest[key] for key in sorted(newest)]
+
+
+def iter_nodes(source):
+    """Yield JSON-LD nodes from a directory of *.jsonld(.gz) files, a JSONL file or '-' (stdin)."""
+    if source == '-':
+        yield from _iter_lines(sys.stdin)
+        return
+    path = Path(source)
+    if path.is_dir():
+        for p in _sidecars(path):
+            yield json_io.read_json(p)
+    elif path.suffix in ('.jsonl', '.ndjson'):
+        with path.open('r', encoding='utf8') as fh:
+            yield from _iter_lines(fh)
+    else:
+        yield json_io.read_json(path)
+
+
+def batched(iterable, size):
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+def ensure_schema(session, with_entities=False):
+    for statement in SCHEMA_STATEMENTS + (ENTITY_SCHEMA_STATEMENTS if with_entities else []):
+        session.run(statement)
+
+
+def _write_batch(tx, rows):
+    tx.run(BULK_UPSERT, rows=rows)
+
+
+def _write_references(tx, rows):
+    tx.run(BULK_REFERENCES, rows=rows)
+
+
+def bulk_ingest(driver, nodes, batch_size=DEFAULT_BATCH_SIZE, with_entities=False):
+    """Upsert nodes in UNWIND batches over one session; return throughput stats.
+
+    With ``with_entities`` each artifact batch is followed by batches of its
+    Entity/REFERENCES rows.
+    """
+    rows = batches = references = 0
+    start = time.perf_counter()
     with driver.session() as s:
-        s.write_transaction(upsert_node, node)
-    print('Ingested', node.get('@id'))
+        ensure_schema(s, with_entities)
+        for batch in batched((n for n in nodes if n.get('@id')), batch_size):
+            s.write_transaction(_write_batch, [node_to_row(n) for n in batch])
+            rows += len(batch)
+            batches += 1
+            if with_entities:
+                for refs in batched((r for n in batch for r in entity_rows(n)), batch_size):
+                    s.write_transaction(_write_references, refs)
+                    references += len(refs)
+    seconds = time.perf_counter() - start
+    return {
+        'rows': rows,
+        'batches': batches,
+        'references': references,
+        'seconds': seconds,
+        'rows_per_sec': rows / seconds if seconds > 0 else 0.0,
+    }
+
+
+def get_driver(uri=NEO_URL, user=NEO_USER, password=NEO_PASSWORD, pool_size=DEFAULT_POOL_SIZE):
+    if GraphDatabase is None:
+        print('neo4j driver not installed; pip install neo4j', file=sys.stderr)
+        sys.exit(2)
+    return GraphDatabase.driver(uri, auth=(user, password), max_connection_pool_size=pool_size)
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description='Upsert JSON-LD artifacts into Neo4j')
+    p.add_argument('source', nargs='?', help='single artifact.jsonld')
+    p.add_argument('--bulk', metavar='DIR|JSONL|-', help='directory of *.jsonld files or a JSONL stream')
+    p.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    p.add_argument('--entities', action='store_true',
+                   help='also store enrichment entities as (:Artifact)-[:REFERENCES]->(:Entity)')
+    p.add_argument('--uri', default=NEO_URL)
+    p.add_argument('--user', default=NEO_USER)
+    p.add_argument('--password', default=NEO_PASSWORD)
+    args = p.parse_args(argv)
+
+    if not args.source and not args.bulk:
+        print('Usage: ingest_to_neo4j.py artifact.jsonld | --bulk DIR|JSONL|-', file=sys.stderr)
+        sys.exit(2)
+
+    driver = get_driver(args.uri, args.user, args.password)
+    try:
+        if args.bulk:
+            stats = bulk_ingest(driver, iter_nodes(args.bulk), args.batch_size, args.entities)
+            print(f"Ingested {stats['rows']} nodes in {stats['batches']} batches "
+                  f"({stats['seconds']:.2f}s, {stats['rows_per_sec']:.0f} rows/sec)")
+            if args.entities:
+                print(f"Linked {stats['references']} entity references")
+        else:
+            node = json_io.read_json(args.source)
+            with driver.session() as s:
+                s.write_transaction(upsert_node, node)
+                if args.entities:
+                    ensure_schema(s, with_entities=True)
+                    refs = entity_rows(node)
+                    if refs:
+                        s.write_transaction(_write_references, refs)
+            print('Ingested', node.get('@id'))
+    finally:
+        driver.close()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,106 @@
+"""JSON serialization for JSON-LD sidecars and exports.
+
+Uses orjson when it is installed and the standard library otherwise. Both
+paths convert datetimes (and anything else with ``isoformat``) to ISO strings
+in a single ``default`` hook while serializing, without copying the tree
+first, and fall back to ``str`` for other unknown values.
+
+Sidecars can be written pretty (indent 2, the default), compact (no
+whitespace) and/or gzip-compressed (``.gz`` appended to the file name);
+``read_json`` reads any of them.
+
+Usage:
+    from tools import json_io
+    json_io.write_json(path, node, compact=True, compress=True)
+"""
+import gzip
+import json
+import re
+from pathlib import Path
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:  # optional dependency
+    orjson = None
+    HAS_ORJSON = False
+
+GZIP_SUFFIX = '.gz'
+# zlib's default level: most of level 9's ratio at a fraction of the time
+GZIP_LEVEL = 6
+
+# integer literals orjson may not hold in 64 bits (it would return them as floats);
+# a match inside a string only costs a slower stdlib parse
+_BIG_INT = re.compile(r'(?<![\d.eE])-?\d{19,}(?![\d.eE])')
+_BIG_INT_BYTES = re.compile(_BIG_INT.pattern.encode())
+
+
+def _default(obj):
+    if hasattr(obj, 'isoformat'):  # datetime/date/time
+        return obj.isoformat()
+    return str(obj)
+
+
+def _dumps_std(obj, compact: bool) -> bytes:
+    if compact:
+        text = json.dumps(obj, separators=(',', ':'), ensure_ascii=False, default=_default)
+    else:
+        text = json.dumps(obj, indent=2, ensure_ascii=False, default=_default)
+    return text.encode('utf8')
+
+
+def dumps(obj, compact: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes (indent 2 unless ``compact``)."""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS | (0 if compact else orjson.OPT_INDENT_2)
+        try:
+            return orjson.dumps(obj, default=_default, option=option)
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib handles them
+            pass
+    return _dumps_std(obj, compact)
+
+
+def loads(data):
+    """Parse JSON text or bytes.
+
+    Integers beyond 64 bits and the ``NaN``/``Infinity`` literals that
+    ``_dumps_std`` may write are parsed by the stdlib, which keeps them exact.
+    """
+    if HAS_ORJSON:
+        pattern = _BIG_INT_BYTES if isinstance(data, (bytes, bytearray, memoryview)) else _BIG_INT
+        if not pattern.search(data):
+            try:
+                return orjson.loads(data)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(data)
+
+
+def write_json(path, obj, compact: bool = False, compress: bool = False) -> Path:
+    """Write ``obj`` to ``path`` (``path.gz`` when ``compress``) and return the path written.
+
+    The other variant of the same file is removed, so switching between plain
+    and compressed output never leaves a stale sidecar behind.
+    """
+    path = Path(path)
+    data = dumps(obj, compact=compact)
+    gz_path = path.with_name(path.name + GZIP_SUFFIX)
+    if compress:
+        with gzip.open(gz_path, 'wb', compresslevel=GZIP_LEVEL) as fh:
+            fh.write(data)
+        path, stale = gz_path, path
+    else:
+        path.write_bytes(data)
+        stale = gz_path
+    stale.unlink(missing_ok=True)
+    return path
+
+
+def read_json(path):
+    """Read a JSON file written by ``write_json`` (plain or ``.gz``)."""
+    path = Path(path)
+    if path.name.endswith(GZIP_SUFFIX):
+        with gzip.open(path, 'rb') as fh:
+            return loads(fh.read())
+    return loads(path.read_bytes())
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Content-addressed cache of LLM responses.
+
+Debate reruns send the same prompts again (unchanged artifact, CI retry).
+Responses are stored in a size-bounded SQLite cache (see ``disk_cache``) keyed
+by a SHA-256 of the model, the prompt and the call parameters, so a rerun on
+unchanged input is served from disk.
+
+Modes (``RAILWEB_LLM_CACHE``):
+- ``on`` (default): serve hits, call the model and store on a miss
+- ``off``: always call the model
+- ``replay``: serve hits only; a miss raises ``LLMCacheMiss`` instead of
+  calling the model (for CI runs that must not spend tokens)
+
+Only responses the caller accepts are stored: ``cached_call`` takes a
+``validate`` callback (e.g. "the answer parses as the expected JSON"), so a
+malformed answer is retried on the next run instead of being replayed. A
+cached entry that no longer validates is treated as a miss.
+
+Entries live in ``$RAILWEB_CACHE_DIR/llm.sqlite``, expire after
+``RAILWEB_LLM_CACHE_TTL`` seconds (default 7 days) and are evicted least
+recently used first beyond ``RAILWEB_LLM_CACHE_MAX_ENTRIES`` (default 10000).
+
+Usage: python tools/llm_cache.py [stats|clear]
+"""
+import hashlib
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools.disk_cache import MISS, DiskCache, default_cache_dir  # noqa: E402
+
+MODES = ('on', 'off', 'replay')
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_TTL = 7 * 24 * 3600
+
+
+class LLMCacheMiss(RuntimeError):
+    """Raised in replay mode when a prompt has no cached response."""
+
+
+_INSTANCES: Dict[Path, DiskCache] = {}
+_LOCK = threading.Lock()
+_STATS = {'hits': 0, 'misses': 0}
+
+
+def cache_mode() -> str:
+    mode = os.environ.get('RAILWEB_LLM_CACHE', 'on').lower()
+    if mode in ('0', 'false', 'no'):
+        return 'off'
+    return mode if mode in MODES else 'on'
+
+
+def _env_number(name: str, default, cast):
+    try:
+        return cast(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def get_cache() -> DiskCache:
+    path = default_cache_dir() / 'llm.sqlite'
+    with _LOCK:
+        cache = _INSTANCES.get(path)
+        if cache is None:
+            max_entries = _env_number('RAILWEB_LLM_CACHE_MAX_ENTRIES', DEFAULT_MAX_ENTRIES, int)
+            ttl = _env_number('RAILWEB_LLM_CACHE_TTL', DEFAULT_TTL, float)
+            cache = DiskCache(path, ttl=ttl if ttl > 0 else None, max_entries=max_entries)
+            _INSTANCES[path] = cache
+        return cache
+
+
+def cache_key(model: str, prompt: str, **params: Any) -> str:
+    blob = json.dumps({'model': model, 'prompt': prompt, 'params': params}, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()
+
+
+def _accepted(validate: Optional[Callable[[Any], Any]], value: Any) -> bool:
+    if validate is None:
+        return True
+    try:
+        return validate(value) is not False
+    except Exception:
+        return False
+
+
+def cached_call(model: str, prompt: str, call: Callable[[], Any],
+                validate: Optional[Callable[[Any], Any]] = None, **params: Any) -> Any:
+    """Return the cached response for (model, prompt, params), or ``call()`` and store it.
+
+    ``call`` must return a JSON-serializable value; exceptions are not cached.
+    ``validate(value)`` decides whether a response may be cached: returning
+    False or raising keeps it out of the cache (it is still returned).
+    """
+    mode = cache_mode()
+    if mode == 'off':
+        return call()
+    cache = get_cache()
+    key = cache_key(model, prompt, **params)
+    value = cache.get(key)
+    if value is not MISS and value is not None and _accepted(validate, value):
+        with _LOCK:
+            _STATS['hits'] += 1
+        return value
+    with _LOCK:
+        _STATS['misses'] += 1
+    if mode == 'replay':
+        raise LLMCacheMiss(f'no cached response for {model} prompt {key[:12]} (RAILWEB_LLM_CACHE=replay)')
+    value = call()
+    if _accepted(validate, value):
+        cache.set(key, value)
+    return value
+
+
+def stats() -> Dict[str, Any]:
+    """Hit/miss counters for this process, suitable for embedding in run results."""
+    with _LOCK:
+        return dict(_STATS, mode=cache_mode())
+
+
+def stats_since(before: Dict[str, Any]) -> Dict[str, Any]:
+    """Counters accumulated since an earlier ``stats()`` snapshot (one run's worth)."""
+    now = stats()
+    return {'mode': now['mode'], 'hits': now['hits'] - before['hits'], 'misses': now['misses'] - before['misses']}
+
+
+def reset_stats() -> None:
+    with _LOCK:
+        _STATS.update(hits=0, misses=0)
+
+
+def main():
+    command = sys.argv[1] if len(sys.argv) > 1 else 'stats'
+    cache = get_cache()
+    if command == 'clear':
+        cache.clear()
+        print(f'Cleared {cache.path}')
+    elif command == 'stats':
+        print(f'{cache.path}: {len(cache)} entries (mode={cache_mode()})')
+    else:
+        print(f'Unknown command: {command}')
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
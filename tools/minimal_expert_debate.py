@@ -10,6 +10,7 @@ This module provides the core components needed to start expert debates:
 import json
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 import requests
@@ -18,6 +19,14 @@ import requests
 sys.path.insert(0, str(Path(__file__).parent.parent))
 sys.path.insert(0, str(Path(__file__).parent))
 
+from tools import adapter_client, llm_cache  # noqa: E402
+from tools.debate.convergence import ConvergenceTracker  # noqa: E402
+
+
+def _has_json_text(response: Dict) -> bool:
+    return isinstance(json.loads(response.get('text', '')), dict)
+
+
 class ExpertAgent:
     """Individual AI Expert Agent with function calling."""
     
@@ -177,21 +186,25 @@ RESPOND IN JSON FORMAT:
         return "No previous analysis available"
     
     def _call_adapter(self, prompt: str, intent: str) -> Dict:
-        """Call the LLM adapter."""
-        payload = {
-            "run_id": f"expert_debate_{int(time.time())}",
-            "artifacts": [],
-            "intent": intent,
-            "prompt": prompt
-        }
-        
-        response = requests.post(
-            f"{self.adapter_url}/api/llm/summarizeRun",
-            json=payload,
-            timeout=30
-        )
-        response.raise_for_status()
-        return response.json()
+        """Call the LLM adapter (served from the LLM response cache when possible)."""
+        def call():
+            payload = {
+                "run_id": f"expert_debate_{int(time.time())}",
+                "artifacts": [],
+                "intent": intent,
+                "prompt": prompt
+            }
+            
+            response = adapter_client.post(
+                f"{self.adapter_url}/api/llm/summarizeRun",
+                json=payload,
+                timeout=30
+            )
+            response.raise_for_status()
+            return response.json()
+        
+        # cache only answers that parse as JSON; fallback parses are retried next run
+        return llm_cache.cached_call(self.adapter_url, prompt, call, validate=_has_json_text, intent=intent)
     
     def _parse_expert_response(self, response: Dict) -> Dict:
         """Parse expert analysis response."""
@@ -263,10 +276,23 @@ RESPOND IN JSON FORMAT:
 
 
 class MinimalDebateOrchestrator:
-    """Minimal debate orchestrator for AI Expert system."""
+    """Minimal debate orchestrator for AI Expert system.
+
+    Experts within a round run concurrently on a thread pool, so a round takes
+    as long as its slowest expert; an expert that exceeds ``expert_timeout``
+    seconds is recorded with status "timeout". Responses are collected in
+    expert order regardless of completion order.
+
+    With ``convergence`` enabled, experts whose positions stopped drifting
+    (see ``tools.debate.convergence``) are skipped in later rounds and the
+    debate ends once every expert is stable.
+    """
     
-    def __init__(self, adapter_url: str = "http://localhost:3001"):
+    def __init__(self, adapter_url: str = "http://localhost:3001", expert_timeout: float = 60.0,
+                 convergence: bool = True):
         self.adapter_url = adapter_url
+        self.expert_timeout = expert_timeout
+        self.convergence = convergence
         self.experts = {}
         self.debate_history = []
         
@@ -302,27 +328,30 @@ class MinimalDebateOrchestrator:
             "consensus": None,
             "timestamp": time.time()
         }
+        cache_before = llm_cache.stats()
+        tracker = ConvergenceTracker()
         
         # Round 1: Initial expert analyses (parallel)
         print(f"\n📋 Round 1: Initial Expert Analyses")
-        initial_analyses = {}
-        
-        for expert_name, expert in self.experts.items():
-            print(f"  🔍 {expert_name} analyzing...")
-            analysis = expert.analyze(input_artifact)
-            initial_analyses[expert_name] = analysis
-            print(f"     Confidence: {analysis.get('confidence', 'unknown')}")
+        print(f"  🔍 {', '.join(self.experts)} analyzing...")
+        initial_analyses = self._run_experts(lambda expert: expert.analyze(input_artifact), "analysis")
+        for expert_name, analysis in initial_analyses.items():
+            print(f"     {expert_name} confidence: {analysis.get('confidence', 'unknown')}")
         
         debate_result["rounds"].append({
             "round": 1,
             "type": "initial_analysis",
             "responses": initial_analyses
         })
+        tracker.update(1, initial_analyses)
         
         # Rounds 2+: Debate rounds
         expert_positions = list(initial_analyses.values())
         
         for round_num in range(2, max_rounds + 1):
+            active = tracker.active(self.experts) if self.convergence else list(self.experts)
+            if not active:
+                break
             print(f"\n💬 Round {round_num}: Expert Debate")
             
             debate_context = {
@@ -331,17 +360,25 @@ class MinimalDebateOrchestrator:
                 "previous_positions": expert_positions
             }
             
-            round_responses = {}
-            
-            for expert_name, expert in self.experts.items():
-                print(f"  🗣️  {expert_name} responding...")
-                response = expert.debate_respond(debate_context, expert_positions)
-                round_responses[expert_name] = response
+            skipped = [name for name in self.experts if name not in active]
+            print(f"  🗣️  {', '.join(active)} responding...")
+            if skipped:
+                print(f"     Stable, skipped: {', '.join(skipped)}")
+            ran = self._run_experts(
+                lambda expert: expert.debate_respond(debate_context, expert_positions), "response", active
+            )
+            # stable experts keep their last position
+            round_responses = {
+                name: ran[name] if name in ran else tracker.last_position(name) for name in self.experts
+            }
+            drift = tracker.update(round_num, ran)
             
             debate_result["rounds"].append({
                 "round": round_num,
                 "type": "debate_round",
-                "responses": round_responses
+                "responses": round_responses,
+                "skipped": skipped,
+                "drift": drift
             })
             
             # Update positions for next round
@@ -354,15 +391,56 @@ class MinimalDebateOrchestrator:
             if consensus_score > 0.8:
                 print("     ✅ Strong consensus reached!")
                 break
+            if self.convergence and tracker.converged(self.experts):
+                print("     ✅ Positions converged, stopping early")
+                break
         
         # Generate final consensus
         print(f"\n🎯 Generating final consensus...")
         consensus = self._generate_consensus(debate_result)
         debate_result["consensus"] = consensus
+        debate_result["llm_cache"] = llm_cache.stats_since(cache_before)
+        debate_result["convergence"] = tracker.history
         
         self.debate_history.append(debate_result)
         return debate_result
     
+    def _run_experts(self, call, text_key: str, names: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Run ``call(expert)`` for every expert (or those in ``names``) concurrently.
+
+        Results are returned in expert order. All experts share one deadline of
+        ``expert_timeout`` seconds from the start of the round.
+        """
+        names = list(self.experts) if names is None else [n for n in self.experts if n in names]
+        if not names:
+            return {}
+        pool = ThreadPoolExecutor(max_workers=len(names), thread_name_prefix="expert")
+        futures = {name: pool.submit(call, self.experts[name]) for name in names}
+        deadline = time.monotonic() + self.expert_timeout
+        results = {}
+        try:
+            for expert_name, future in futures.items():
+                try:
+                    results[expert_name] = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except FutureTimeout:
+                    results[expert_name] = {
+                        "expert": expert_name,
+                        "status": "timeout",
+                        "error": f"no response within {self.expert_timeout}s",
+                        text_key: f"Expert {expert_name} timed out.",
+                    }
+                except Exception as e:
+                    results[expert_name] = {
+                        "expert": expert_name,
+                        "status": "error",
+                        "error": str(e),
+                        text_key: f"Expert {expert_name} encountered an error.",
+                    }
+        finally:
+            # don't block the round on experts that already timed out
+            pool.shutdown(wait=False, cancel_futures=True)
+        return results
+    
     def _calculate_consensus(self, responses: Dict[str, Dict]) -> float:
         """Calculate consensus score based on expert responses."""
         if not responses:
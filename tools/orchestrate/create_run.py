@@ -1,11 +1,12 @@
 from pathlib import Path
 import shutil
 import uuid
-import subprocess
-import yaml
 import sys
 
 REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO))
+from tools.orchestrate import debate_runner  # noqa: E402
+
 RUNS = REPO / 'runs'
 EXAMPLE = REPO / 'runs' / 'example_run' / 'meta.example.yaml'
 
@@ -20,13 +21,11 @@ def create_run(run_id: str | None = None) -> int:
     else:
         (dest / 'meta.yaml').write_text('run_id: '+run_id)
 
-    # run debate (inproc runner ensures sys.path)
-    runner = REPO / 'tools' / 'debate' / 'run_real_debate_inproc.py'
+    # run debate (in-process unless RAILWEB_RUNNER_MODE=subprocess)
     try:
-        proc = subprocess.run([sys.executable, str(runner)], capture_output=True, text=True, timeout=20)
-        out = proc.stdout + proc.stderr
-        (dest / 'results.txt').write_text(out)
-        return 0
+        result = debate_runner.run_debate()
+        debate_runner.write_results(dest, result)
+        return 0 if result['ok'] else 1
     except Exception as e:
         (dest / 'results.txt').write_text(str(e))
         return 2
@@ -1,16 +1,17 @@
 from pathlib import Path
 import uuid
 import shutil
-import subprocess
 import sys
 import os
-import yaml
-import threading
+import signal
 from flask import Flask, request, jsonify
-from . import status_db
+from . import debate_runner, status_db
+from .job_queue import JobQueue
+from tools import yaml_io
 
 try:
     import jsonschema
+    from tools import schema_registry
     HAS_JSONSCHEMA = True
 except Exception:
     HAS_JSONSCHEMA = False
@@ -20,6 +21,21 @@ REPO = Path(__file__).resolve().parents[2]
 RUNS = REPO / 'runs'
 EXAMPLE = REPO / 'runs' / 'example_run' / 'meta.example.yaml'
 
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+# runner worker threads and how many accepted runs may wait for one
+RUN_WORKERS = _env_int('RAILWEB_RUN_WORKERS', 2)
+RUN_QUEUE_SIZE = _env_int('RAILWEB_RUN_QUEUE_SIZE', 32)
+# seconds to wait for queued/running runs on shutdown before leaving them for recovery
+DRAIN_TIMEOUT = _env_int('RAILWEB_RUN_DRAIN_TIMEOUT', 30)
+RUN_TIMEOUT = _env_int('RAILWEB_RUN_TIMEOUT', debate_runner.DEFAULT_TIMEOUT)
+
 app = Flask(__name__)
 
 # Simple JSON Schema for metadata validation (can be extended)
@@ -57,18 +73,20 @@ def validate_meta_schema(meta: dict) -> tuple[bool, str | None]:
     if not HAS_JSONSCHEMA:
         return False, 'jsonschema package is not installed'
     try:
-        jsonschema.validate(instance=meta, schema=META_SCHEMA)
+        schema_registry.validate(meta, META_SCHEMA)
         return True, None
     except jsonschema.ValidationError as e:
         return False, str(e.message)
 
 
 def _run_runner_and_write(dest: Path):
-    runner = REPO / 'tools' / 'debate' / 'run_real_debate_inproc.py'
     try:
-        proc = subprocess.run([sys.executable, str(runner)], capture_output=True, text=True, timeout=20)
-        out = proc.stdout + proc.stderr
-        (dest / 'results.txt').write_text(out)
+        result = debate_runner.run_debate(timeout=RUN_TIMEOUT)
+        debate_runner.write_results(dest, result)
+        if not result['ok']:
+            # the output (traceback, timeout) is in results.txt; no issue for a failed run
+            status_db.set_status(dest.name, 'error', str(dest / 'results.txt'))
+            return
         # persist status in DB
         status_db.set_status(dest.name, 'completed', str(dest / 'results.txt'))
         # attempt to create a Linear issue if configured
@@ -76,12 +94,10 @@ def _run_runner_and_write(dest: Path):
             from . import linear_integration
 
             # load meta.yaml if present to include provenance
-            import yaml
-
             meta = None
             meta_path = dest / 'meta.yaml'
             if meta_path.exists():
-                meta = yaml.safe_load(meta_path.read_text())
+                meta = yaml_io.safe_load(meta_path.read_text())
             issue_id = linear_integration.create_issue_for_run(dest.name, meta or {})
             if issue_id:
                 # store external id in DB as part of results_path field (quick hack)
@@ -95,6 +111,40 @@ def _run_runner_and_write(dest: Path):
         status_db.set_status(dest.name, 'error', None)
 
 
+def _process_run(dest: Path):
+    status_db.set_status(dest.name, 'running', None)
+    _run_runner_and_write(dest)
+
+
+JOBS = JobQueue(_process_run, workers=RUN_WORKERS, max_queue=RUN_QUEUE_SIZE)
+
+
+def recover_queued_runs() -> list[str]:
+    """Requeue runs left 'queued' or 'running' by a previous process.
+
+    Runs that do not fit in the queue stay 'queued' in the DB for the next start.
+    """
+    recovered = []
+    # interrupted runs first, then the ones that were waiting
+    rows = status_db.list_runs('running') + status_db.list_runs('queued')
+    for row in rows:
+        dest = RUNS / row['run_id']
+        if not dest.is_dir():
+            status_db.set_status(row['run_id'], 'error', None)
+            continue
+        if row['status'] == 'running':
+            status_db.set_status(row['run_id'], 'queued', None)
+        if not JOBS.submit(dest):
+            break
+        recovered.append(row['run_id'])
+    return recovered
+
+
+def shutdown(timeout: float = DRAIN_TIMEOUT) -> bool:
+    """Stop accepting runs and wait for the queue to drain."""
+    return JOBS.drain(timeout)
+
+
 def require_token(req) -> tuple[bool, str | None]:
     token = os.environ.get('RAILWEB_API_TOKEN')
     if not token:
@@ -126,6 +176,11 @@ def create_run_api():
         if not valid:
             return jsonify({'ok': False, 'error': msg}), 400
 
+    if not JOBS.accepting:
+        return jsonify({'ok': False, 'error': 'server is shutting down'}), 503
+    if JOBS.full():
+        return _queue_full()
+
     dest = RUNS / run_id
     try:
         dest.mkdir(parents=True, exist_ok=False)
@@ -134,21 +189,34 @@ def create_run_api():
 
     # write meta.yaml
     if meta is not None:
-        (dest / 'meta.yaml').write_text(yaml.safe_dump(meta, sort_keys=False))
+        (dest / 'meta.yaml').write_text(yaml_io.safe_dump(meta, sort_keys=False))
     else:
         if EXAMPLE.exists():
             shutil.copy(EXAMPLE, dest / 'meta.yaml')
         else:
             (dest / 'meta.yaml').write_text('run_id: ' + run_id)
 
-    # start runner in background thread and return 202
-    # mark running
-    status_db.set_status(run_id, 'running', None)
-    thread = threading.Thread(target=_run_runner_and_write, args=(dest,), daemon=True)
-    thread.start()
+    # persist before enqueueing so a restart can pick the run up again
+    status_db.set_status(run_id, 'queued', None)
+    if not JOBS.submit(dest):
+        # the queue filled up (or started draining) since the check above
+        shutil.rmtree(dest, ignore_errors=True)
+        status_db.set_status(run_id, 'rejected', None)
+        return _queue_full()
     return jsonify({'ok': True, 'run_id': run_id, 'status_url': f"/internal/create_run/{run_id}"}), 202
 
 
+def _queue_full():
+    retry_after = JOBS.retry_after()
+    body = {'ok': False, 'error': 'run queue is full', 'retry_after': retry_after}
+    return jsonify(body), 429, {'Retry-After': str(retry_after)}
+
+
+@app.route('/internal/metrics', methods=['GET'])
+def metrics():
+    return jsonify({'ok': True, 'queue': JOBS.metrics()}), 200
+
+
 @app.route('/internal/create_run/<run_id>', methods=['GET'])
 def create_run_status(run_id: str):
     dest = RUNS / run_id
@@ -161,5 +229,11 @@ def create_run_status(run_id: str):
 
 
 if __name__ == '__main__':
-    # default port chosen to avoid colliding with other dev services
-    app.run(host='127.0.0.1', port=5001)
+    # turn SIGTERM into a normal exit so queued runs are drained below
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    recover_queued_runs()
+    try:
+        # default port chosen to avoid colliding with other dev services
+        app.run(host='127.0.0.1', port=5001)
+    finally:
+        shutdown()
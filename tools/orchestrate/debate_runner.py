@@ -0,0 +1,100 @@
+"""Run the example debate for an orchestrated run.
+
+By default the debate runs in-process: ``tools.debate.run_real_debate`` is
+imported once with the orchestrator and each run executes it on a worker
+thread, with its printed summary captured in memory and the round history
+returned as structured data. That avoids paying interpreter startup and the
+requests/flask/yaml imports on every run.
+
+Set ``RAILWEB_RUNNER_MODE=subprocess`` to run each debate in a fresh
+interpreter (``python -m tools.debate.run_real_debate``) instead, e.g. when a
+run must not share state with the server. Only the text output is available
+in that mode.
+
+An in-process run that exceeds its timeout is reported as failed, but the
+worker thread cannot be killed and finishes in the background; use
+subprocess mode if runs may hang.
+"""
+import io
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+REPO = Path(__file__).resolve().parents[2]
+if str(REPO) not in sys.path:
+    sys.path.insert(0, str(REPO))
+
+from tools.debate.run_real_debate import run_real_debate  # noqa: E402
+
+MODES = ('inproc', 'subprocess')
+DEFAULT_TIMEOUT = 20
+MAX_WORKERS = 4
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_LOCK = threading.Lock()
+
+
+def runner_mode() -> str:
+    mode = os.environ.get('RAILWEB_RUNNER_MODE', 'inproc').lower()
+    return mode if mode in MODES else 'inproc'
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    with _LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix='debate')
+        return _EXECUTOR
+
+
+def _debate_inproc(out: io.StringIO):
+    try:
+        return True, run_real_debate(out=out)
+    except Exception:
+        out.write(traceback.format_exc())
+        return False, None
+
+
+def run_inproc(timeout: float = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+    out = io.StringIO()
+    future = _executor().submit(_debate_inproc, out)
+    try:
+        ok, history = future.result(timeout=timeout)
+    except FutureTimeout:
+        ok, history = False, None
+        out.write(f'debate timed out after {timeout}s\n')
+    return {'mode': 'inproc', 'ok': ok, 'output': out.getvalue(), 'history': history}
+
+
+def run_subprocess(timeout: float = DEFAULT_TIMEOUT) -> Dict[str, Any]:
+    cmd = [sys.executable, '-m', 'tools.debate.run_real_debate']
+    try:
+        proc = subprocess.run(cmd, cwd=REPO, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {'mode': 'subprocess', 'ok': False, 'output': f'debate timed out after {timeout}s\n', 'history': None}
+    return {'mode': 'subprocess', 'ok': proc.returncode == 0, 'output': proc.stdout + proc.stderr, 'history': None}
+
+
+def run_debate(timeout: float = DEFAULT_TIMEOUT, mode: Optional[str] = None) -> Dict[str, Any]:
+    """Run one debate and return ``{'mode', 'ok', 'output', 'history', 'duration_s'}``."""
+    mode = mode or runner_mode()
+    start = time.perf_counter()
+    result = run_subprocess(timeout) if mode == 'subprocess' else run_inproc(timeout)
+    result['duration_s'] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def write_results(dest: Path, result: Dict[str, Any]) -> Path:
+    """Write results.txt (the printed output) and results.json (structured) into ``dest``."""
+    dest = Path(dest)
+    (dest / 'results.txt').write_text(result['output'])
+    summary = {k: result.get(k) for k in ('mode', 'ok', 'duration_s', 'history')}
+    (dest / 'results.json').write_text(json.dumps(summary, indent=2, default=str))
+    return dest / 'results.txt'
@@ -0,0 +1,153 @@
+"""Bounded job queue with a fixed worker pool for the orchestration API.
+
+``create_run_api`` used to start one thread (and one runner subprocess) per
+request. Runs now go through a ``JobQueue``: at most ``max_queue`` jobs wait,
+``workers`` threads execute them, and ``submit`` refuses work when the queue
+is full so the API can answer 429 instead of forking without bound.
+
+Metrics (``metrics()``) report queue depth, in-flight jobs, counters, and
+queue-wait / run latency (count, mean, max).
+"""
+from __future__ import annotations
+
+import math
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+_STOP = object()
+
+
+class _Latency:
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {'count': self.count, 'mean_s': round(self.mean, 4), 'max_s': round(self.max, 4)}
+
+
+class JobQueue:
+    def __init__(self, handler: Callable[..., Any], workers: int = 2, max_queue: int = 32) -> None:
+        if workers < 1 or max_queue < 1:
+            raise ValueError('workers and max_queue must be >= 1')
+        self.handler = handler
+        self.workers = workers
+        self.max_queue = max_queue
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._threads: List[threading.Thread] = []
+        self._accepting = True
+        self._in_flight = 0
+        self._counts = {'submitted': 0, 'rejected': 0, 'completed': 0, 'failed': 0}
+        self._wait = _Latency()
+        self._run = _Latency()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                t = threading.Thread(target=self._worker, name=f'run-worker-{i}', daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    @property
+    def accepting(self) -> bool:
+        return self._accepting
+
+    def full(self) -> bool:
+        return self._queue.full()
+
+    def submit(self, *args: Any) -> bool:
+        """Enqueue ``handler(*args)``; return False when full or draining."""
+        if not self._accepting:
+            with self._lock:
+                self._counts['rejected'] += 1
+            return False
+        self.start()
+        try:
+            self._queue.put_nowait((time.monotonic(), args))
+        except queue.Full:
+            with self._lock:
+                self._counts['rejected'] += 1
+            return False
+        with self._lock:
+            self._counts['submitted'] += 1
+        return True
+
+    def retry_after(self) -> int:
+        """Seconds a rejected client should wait: the expected time to free a queue slot."""
+        with self._lock:
+            mean = self._run.mean or 1.0
+        return max(1, math.ceil(mean * (self._queue.qsize() + 1) / self.workers))
+
+    def _worker(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is _STOP:
+                self._queue.task_done()
+                return
+            enqueued, args = item
+            started = time.monotonic()
+            with self._lock:
+                self._wait.add(started - enqueued)
+                self._in_flight += 1
+            ok = True
+            try:
+                self.handler(*args)
+            except Exception:
+                ok = False
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+                    self._run.add(time.monotonic() - started)
+                    self._counts['completed' if ok else 'failed'] += 1
+                self._queue.task_done()
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                'queue_depth': self._queue.qsize(),
+                'max_queue': self.max_queue,
+                'workers': self.workers,
+                'in_flight': self._in_flight,
+                'accepting': self._accepting,
+                **self._counts,
+                'wait_latency': self._wait.as_dict(),
+                'run_latency': self._run.as_dict(),
+            }
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """Stop accepting jobs and wait for queued and running ones to finish.
+
+        Returns True when everything finished within ``timeout``. Jobs still
+        queued after the timeout are left for the caller to persist/recover.
+        """
+        self._accepting = False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # a job counts as unfinished from put() until its task_done(), including the
+        # moment a worker has dequeued it but not yet started it
+        done = self._queue.all_tasks_done
+        with done:
+            while self._queue.unfinished_tasks:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                done.wait(remaining)
+        for t in self._threads:
+            self._queue.put(_STOP)
+        for t in self._threads:
+            t.join(timeout=1)
+        return True
@@ -1,8 +1,9 @@
 import os
-import requests
 import json
 from typing import Optional
 
+from tools import adapter_client
+
 LINEAR_API_URL = 'https://api.linear.app/graphql'
 
 
@@ -65,7 +66,9 @@ def create_issue_for_run(run_id: str, meta: dict) -> Optional[str]:
     payload = {'query': mutation, 'variables': variables}
 
     try:
-        resp = requests.post(LINEAR_API_URL, headers=headers, data=json.dumps(payload), timeout=10)
+        # issueCreate is not idempotent: a retried 502/504 could file a duplicate issue
+        resp = adapter_client.post(LINEAR_API_URL, headers=headers, data=json.dumps(payload), timeout=10,
+                                   idempotent=False)
         resp.raise_for_status()
         j = resp.json()
         issue = j.get('data', {}).get('issueCreate', {}).get('issue')
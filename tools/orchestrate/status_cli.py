@@ -1,8 +1,8 @@
 """Simple CLI to query run status from the SQLite DB.
 
 Usage:
-  python tools/orchestrate/status_cli.py [run_id]
-If run_id is omitted, prints all runs.
+  python tools/orchestrate/status_cli.py [run_id] [--status STATUS]
+If run_id is omitted, prints all runs (optionally only those with --status).
 """
 import argparse
 from tools.orchestrate import status_db
@@ -17,6 +17,7 @@ def format_row(run_id, info):
 def main():
     p = argparse.ArgumentParser()
     p.add_argument('run_id', nargs='?')
+    p.add_argument('--status', help='only list runs with this status (e.g. queued)')
     args = p.parse_args()
 
     if args.run_id:
@@ -26,15 +27,9 @@ def main():
             return
         print(format_row(args.run_id, info))
     else:
-        # list all runs
-        # brute-force by reading DB directly via status_db._get_conn
-        conn = status_db._get_conn()
-        cur = conn.execute('SELECT run_id, status, results_path, updated_at FROM runs')
-        rows = cur.fetchall()
-        conn.close()
         print('run_id\tstatus\tresults_path\tupdated_at')
-        for r in rows:
-            print(format_row(r[0], {'status': r[1], 'results_path': r[2], 'updated_at': r[3]}))
+        for info in status_db.list_runs(args.status):
+            print(format_row(info['run_id'], info))
 
 
 if __name__ == '__main__':
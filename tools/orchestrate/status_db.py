@@ -1,37 +1,108 @@
+"""SQLite store for orchestrated run status.
+
+Each thread keeps one open connection per database file, so ``set_status`` and
+``get_status`` do not reconnect or re-run DDL on every call. The database uses
+WAL journaling with ``synchronous=NORMAL``: readers do not block the writer
+and concurrent queue workers wait on ``busy_timeout`` instead of failing with
+"database is locked". The schema is migrated once per process (tracked with
+``PRAGMA user_version``).
+"""
 import sqlite3
-from pathlib import Path
+import threading
 import time
+from pathlib import Path
+from typing import Iterable
 
 
 DB_PATH = Path(__file__).resolve().parents[2] / 'runs' / '.runs_status.db'
+BUSY_TIMEOUT_MS = 5000
+
+# each entry upgrades the schema by one version
+MIGRATIONS = (
+    "CREATE TABLE IF NOT EXISTS runs (run_id TEXT PRIMARY KEY, status TEXT, results_path TEXT, updated_at INTEGER)",
+    "CREATE INDEX IF NOT EXISTS runs_status_updated ON runs (status, updated_at);"
+    "CREATE INDEX IF NOT EXISTS runs_updated ON runs (updated_at)",
+)
+
+_local = threading.local()
+_migrated: set = set()
+_migrate_lock = threading.Lock()
 
 
-def _get_conn():
-    DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
-    conn.execute(
-        "CREATE TABLE IF NOT EXISTS runs (run_id TEXT PRIMARY KEY, status TEXT, results_path TEXT, updated_at INTEGER)"
-    )
-    conn.commit()
+def _migrate(conn: sqlite3.Connection):
+    conn.execute("PRAGMA journal_mode=WAL")
+    version = conn.execute("PRAGMA user_version").fetchone()[0]
+    for number, script in enumerate(MIGRATIONS[version:], start=version + 1):
+        conn.executescript(f"BEGIN IMMEDIATE; {script}; PRAGMA user_version = {number}; COMMIT;")
+
+
+def _get_conn() -> sqlite3.Connection:
+    """Return this thread's connection to ``DB_PATH``, opening and migrating it on first use.
+
+    The connection is shared by later calls on the same thread; do not close it.
+    """
+    path = Path(DB_PATH)
+    conns = getattr(_local, 'conns', None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get(path)
+    if conn is None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(path), timeout=BUSY_TIMEOUT_MS / 1000)
+        conn.execute(f"PRAGMA busy_timeout={BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        with _migrate_lock:
+            if path not in _migrated:
+                _migrate(conn)
+                _migrated.add(path)
+        conns[path] = conn
     return conn
 
 
+def close():
+    """Close this thread's connections (the next call reopens them)."""
+    for conn in getattr(_local, 'conns', {}).values():
+        conn.close()
+    _local.conns = {}
+
+
 def set_status(run_id: str, status: str, results_path: str | None = None):
-    conn = _get_conn()
+    set_status_many([(run_id, status, results_path)])
+
+
+def set_status_many(updates: Iterable[tuple]):
+    """Write ``(run_id, status, results_path)`` tuples in a single transaction."""
     now = int(time.time())
-    conn.execute(
-        "INSERT OR REPLACE INTO runs (run_id, status, results_path, updated_at) VALUES (?, ?, ?, ?)",
-        (run_id, status, results_path, now),
-    )
-    conn.commit()
-    conn.close()
+    conn = _get_conn()
+    with conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO runs (run_id, status, results_path, updated_at) VALUES (?, ?, ?, ?)",
+            [(run_id, status, results_path, now) for run_id, status, results_path in updates],
+        )
 
 
 def get_status(run_id: str):
-    conn = _get_conn()
-    cur = conn.execute("SELECT status, results_path, updated_at FROM runs WHERE run_id = ?", (run_id,))
-    row = cur.fetchone()
-    conn.close()
+    row = _get_conn().execute(
+        "SELECT status, results_path, updated_at FROM runs WHERE run_id = ?", (run_id,)
+    ).fetchone()
     if not row:
         return None
     return {'status': row[0], 'results_path': row[1], 'updated_at': row[2]}
+
+
+def list_runs(status: str | None = None, limit: int | None = None):
+    """Return runs as dicts ordered by ``updated_at``, optionally filtered by status.
+
+    Both forms are served by an index (``runs_status_updated`` / ``runs_updated``).
+    """
+    sql = "SELECT run_id, status, results_path, updated_at FROM runs"
+    params: list = []
+    if status is not None:
+        sql += " WHERE status = ?"
+        params.append(status)
+    sql += " ORDER BY updated_at, run_id"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    rows = _get_conn().execute(sql, params).fetchall()
+    return [{'run_id': r[0], 'status': r[1], 'results_path': r[2], 'updated_at': r[3]} for r in rows]
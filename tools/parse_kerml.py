@@ -4,73 +4,294 @@ This is intentionally small and tolerant: it extracts requirement blocks and a b
 (req_id, short_title, source_artifact). It is not a full KerML parser but is good enough for
 hand-off and downstream tooling for the current repo.
 
+The file is read in chunks and requirement blocks are found with a brace tokenizer that skips
+quoted strings, so nested blocks and `}` inside strings are handled and records are yielded one
+at a time. Memory use is bounded by the largest single requirement block, not the file size.
+
 Usage:
-    python tools\parse_kerml.py <kerml_file> --out-dir <out_dir>
+    python tools\\parse_kerml.py <kerml_file> --out-dir <out_dir> [--format json|jsonl]
+    python tools\\parse_kerml.py --batch <dir|glob> --out-dir <out_dir> [--jobs N]
 
 Outputs:
-    - <out_dir>/requirements_<sha>.json  # list of requirement objects
+    - <out_dir>/requirements_<sha>.json  # list of requirement objects (.jsonl with --format jsonl)
     - <out_dir>/requirements_<sha>_trace.csv  # CSV mapping req_id -> source
 
+In batch mode <sha> is the first 12 hex digits of the file's SHA-256, files whose outputs already
+exist are skipped, the rest are parsed across a process pool, and all per-file traces are merged
+into <out_dir>/requirements_trace.csv. Outputs are written to temporary files and renamed into
+place (the CSV first, the JSON last), so an interrupted conversion is redone on the next run.
+
 """
+import argparse
+import glob
+import hashlib
+import os
 import re
 import json
 import csv
-import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-REQ_BLOCK_RE = re.compile(r'requirement\s+([A-Za-z0-9_]+)\s+([A-Za-z0-9_\-]+)\s+id\s*=\s*"([^"]+)"\s*\{([^}]*)\}', re.DOTALL)
-FIELD_RE = re.compile(r'([a-zA-Z_]+)\s*=\s*"([^"]*)";')
+HEADER_RE = re.compile(r'requirement\s+([A-Za-z0-9_]+)\s+([A-Za-z0-9_\-]+)\s+id\s*=\s*"([^"]+)"\s*\{')
+# a complete string, a brace, or an opening quote whose string continues in the next chunk
+BODY_TOKEN_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[{}]|"')
+FIELD_RE = re.compile(r'([a-zA-Z_]+)\s*=\s*"([^"\\]*(?:\\.[^"\\]*)*)"\s*;')
+
+CHUNK_SIZE = 1 << 20
+# longest header kept while waiting for the rest of it from the next chunk
+MAX_HEADER = 4096
+FIELDS = ('text', 'rationale', 'verify', 'source', 'type', 'acceptance', 'measure', 'target')
+
+
+def _make_entry(kind, key, req_id, fields):
+    entry = {'id': req_id, 'kind': kind, 'key': key}
+    for name in FIELDS:
+        entry[name] = fields.get(name, '').strip()
+    return entry
+
+
+def _scan_body(buf, pos, depth, nested, nested_start):
+    """Advance over a block body from ``pos``.
+
+    Returns ``(pos, depth, nested_start, done)``; ``pos`` is where scanning has to resume once
+    more text is available, or just past the closing brace when ``done``. Spans of nested blocks
+    are appended to ``nested`` so fields are only read from the requirement's own level.
+    """
+    for m in BODY_TOKEN_RE.finditer(buf, pos):
+        tok = m.group()
+        if tok == '"':
+            return m.start(), depth, nested_start, False
+        if tok == '{':
+            depth += 1
+            if depth == 2:
+                nested_start = m.start()
+        elif tok == '}':
+            depth -= 1
+            if depth == 1:
+                nested.append((nested_start, m.end()))
+            elif depth == 0:
+                return m.end(), depth, nested_start, True
+    return len(buf), depth, nested_start, False
+
+
+def iter_requirements(chunks):
+    """Yield requirement entries from an iterable of text chunks."""
+    chunks = iter(chunks)
+    buf = ''
+    pos = 0  # everything before pos has been consumed
+
+    def refill():
+        """Append the next chunk, dropping consumed text; return the shift or None at EOF."""
+        nonlocal buf, pos
+        chunk = next(chunks, None)
+        if chunk is None:
+            return None
+        shift = pos
+        buf = buf[pos:] + chunk
+        pos = 0
+        return shift
+
+    while True:
+        header = HEADER_RE.search(buf, pos)
+        if header is None:
+            # keep a possibly incomplete header at the end of the buffer
+            keep = buf.rfind('requirement', max(pos, len(buf) - MAX_HEADER))
+            pos = keep if keep != -1 else max(pos, len(buf) - len('requirement') + 1)
+            if refill() is None:
+                return
+            continue
+        kind, key, req_id = header.groups()
+        pos = scan = header.end()
+        depth, nested_start, nested = 1, 0, []
+        while True:
+            scan, depth, nested_start, done = _scan_body(buf, scan, depth, nested, nested_start)
+            if done:
+                break
+            shift = refill()
+            if shift is None:
+                return  # unterminated block at end of input
+            scan -= shift
+            nested_start -= shift
+            nested = [(a - shift, b - shift) for a, b in nested]
+        body, last = [], pos
+        for a, b in nested:
+            body.append(buf[last:a])
+            last = b
+        body.append(buf[last:scan - 1])
+        yield _make_entry(kind, key, req_id, dict(FIELD_RE.findall(''.join(body))))
+        pos = scan
+
+
+def iter_file_chunks(path, chunk_size=CHUNK_SIZE):
+    with open(path, 'r', encoding='utf-8') as fh:
+        while True:
+            chunk = fh.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def iter_requirements_file(path, chunk_size=CHUNK_SIZE):
+    """Yield requirement entries from a KerML file without loading it whole."""
+    return iter_requirements(iter_file_chunks(path, chunk_size))
 
 
 def parse_requirements(text):
-    results = []
-    for m in REQ_BLOCK_RE.finditer(text):
-        kind = m.group(1)
-        key = m.group(2)
-        req_id = m.group(3)
-        body = m.group(4)
-        fields = dict(FIELD_RE.findall(body))
-        # derive a short title from text or the id
-        short = fields.get('text', '').strip()
-        if len(short) > 120:
-            short = short[:117] + '...'
-        entry = {
-            'id': req_id,
-            'kind': kind,
-            'key': key,
-            'text': fields.get('text','').strip(),
-            'rationale': fields.get('rationale','').strip(),
-            'verify': fields.get('verify','').strip(),
-            'source': fields.get('source','').strip(),
-            'type': fields.get('type','').strip(),
-            'acceptance': fields.get('acceptance','').strip(),
-            'measure': fields.get('measure','').strip(),
-            'target': fields.get('target','').strip(),
-        }
-        results.append(entry)
-    return results
-
-
-def main():
-    if len(sys.argv) < 2:
-        print('Usage: parse_kerml.py <file.kerml> [--out-dir out]')
-        sys.exit(2)
-    path = Path(sys.argv[1])
-    out_dir = Path('intake/exports')
-    if '--out-dir' in sys.argv:
-        out_dir = Path(sys.argv[sys.argv.index('--out-dir')+1])
+    return list(iter_requirements([text]))
+
+
+def write_json_array(fh, entries):
+    """Write entries as json.dumps(list, indent=2) would, one entry at a time."""
+    count = 0
+    for entry in entries:
+        fh.write('[\n' if count == 0 else ',\n')
+        item = json.dumps(entry, indent=2, ensure_ascii=False)
+        fh.write('  ' + item.replace('\n', '\n  '))
+        count += 1
+    fh.write('\n]' if count else '[]')
+    return count
+
+
+def write_jsonl(fh, entries):
+    count = 0
+    for entry in entries:
+        fh.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        count += 1
+    return count
+
+
+def _tee_trace(entries, writer):
+    for r in entries:
+        writer.writerow([r['id'], r['text'][:200], r['source']])
+        yield r
+
+
+def output_paths(out_dir, sha, fmt='json'):
+    out_dir = Path(out_dir)
+    return out_dir / f'requirements_{sha}.{fmt}', out_dir / f'requirements_{sha}_trace.csv'
+
+
+def _tmp_path(path):
+    return path.with_name(f'{path.name}.{os.getpid()}.tmp')
+
+
+def convert_file(path, out_dir, fmt='json', chunk_size=CHUNK_SIZE, sha=None):
+    """Stream one KerML file to the JSON (or JSONL) and trace CSV outputs in a single pass.
+
+    Outputs are named after ``sha``, defaulting to the last ``_`` part of the file stem.
+    """
+    path, out_dir = Path(path), Path(out_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
-    text = path.read_text(encoding='utf-8')
-    reqs = parse_requirements(text)
-    sha = path.stem.split('_')[-1]
-    json_path = out_dir / f'requirements_{sha}.json'
-    csv_path = out_dir / f'requirements_{sha}_trace.csv'
-    json_path.write_text(json.dumps(reqs, indent=2, ensure_ascii=False), encoding='utf-8')
-    with csv_path.open('w', newline='', encoding='utf-8') as fh:
-        writer = csv.writer(fh)
-        writer.writerow(['req_id','short_text','source'])
-        for r in reqs:
-            writer.writerow([r['id'], r['text'][:200], r['source']])
+    sha = sha or path.stem.split('_')[-1]
+    json_path, csv_path = output_paths(out_dir, sha, fmt)
+    write = write_jsonl if fmt == 'jsonl' else write_json_array
+    # write beside the targets and rename on success, so an interrupted run never leaves a
+    # partial output that convert_batch would take as done
+    json_tmp, csv_tmp = _tmp_path(json_path), _tmp_path(csv_path)
+    try:
+        with json_tmp.open('w', encoding='utf-8') as out, csv_tmp.open('w', newline='', encoding='utf-8') as fh:
+            writer = csv.writer(fh)
+            writer.writerow(['req_id','short_text','source'])
+            count = write(out, _tee_trace(iter_requirements_file(path, chunk_size), writer))
+        # the JSON goes last: its presence marks the pair as complete
+        os.replace(csv_tmp, csv_path)
+        os.replace(json_tmp, json_path)
+    finally:
+        json_tmp.unlink(missing_ok=True)
+        csv_tmp.unlink(missing_ok=True)
+    return json_path, csv_path, count
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as fh:
+        for chunk in iter(lambda: fh.read(1 << 16), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def discover_kerml(pattern):
+    """Return the KerML files under a directory (recursively) or matching a glob, sorted."""
+    path = Path(pattern)
+    if path.is_dir():
+        return sorted(path.rglob('*.kerml'))
+    return sorted(Path(p) for p in glob.glob(pattern, recursive=True))
+
+
+def _convert_job(job):
+    path, out_dir, fmt, sha = job
+    return convert_file(path, out_dir, fmt, sha=sha)[2]
+
+
+def merge_traces(entries, out_path):
+    """Concatenate per-file trace CSVs into one, tagging each row with its KerML file."""
+    out_path = Path(out_path)
+    tmp = _tmp_path(out_path)
+    try:
+        with tmp.open('w', newline='', encoding='utf-8') as fh:
+            writer = csv.writer(fh)
+            writer.writerow(['req_id','short_text','source','kerml_file'])
+            for path, csv_path in entries:
+                with csv_path.open('r', newline='', encoding='utf-8') as src:
+                    reader = csv.reader(src)
+                    next(reader, None)
+                    for row in reader:
+                        writer.writerow(row + [path.as_posix()])
+        os.replace(tmp, out_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def convert_batch(files, out_dir, fmt='json', jobs=1):
+    """Convert many KerML files into content-addressed outputs and a merged trace CSV.
+
+    Files whose hash already has both outputs in ``out_dir`` are not parsed again.
+    Returns a summary with the converted/skipped files and the merged trace path.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    traces, todo, skipped, queued = [], [], [], set()
+    for path in files:
+        sha = file_sha256(path)[:12]
+        json_path, csv_path = output_paths(out_dir, sha, fmt)
+        traces.append((Path(path), csv_path))
+        if json_path.exists() and csv_path.exists():
+            skipped.append(path)
+        elif sha not in queued:
+            queued.add(sha)
+            todo.append((path, out_dir, fmt, sha))
+    if jobs > 1 and len(todo) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            counts = list(pool.map(_convert_job, todo))
+    else:
+        counts = [_convert_job(job) for job in todo]
+    trace_path = out_dir / 'requirements_trace.csv'
+    merge_traces(traces, trace_path)
+    return {
+        'converted': [job[0] for job in todo],
+        'skipped': skipped,
+        'requirements': sum(counts),
+        'trace': trace_path,
+    }
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description='Extract requirements and a trace CSV from a KerML export')
+    p.add_argument('kerml_file', nargs='?')
+    p.add_argument('--batch', metavar='DIR|GLOB', help='convert every KerML file in a directory or glob')
+    p.add_argument('--jobs', type=int, default=1, help='worker processes for --batch')
+    p.add_argument('--out-dir', default='intake/exports')
+    p.add_argument('--format', choices=('json', 'jsonl'), default='json',
+                   help='jsonl writes one requirement per line')
+    args = p.parse_args(argv)
+    if args.batch:
+        summary = convert_batch(discover_kerml(args.batch), args.out_dir, args.format, args.jobs)
+        print(f"Converted {len(summary['converted'])} files ({summary['requirements']} requirements), "
+              f"skipped {len(summary['skipped'])} unchanged; wrote {summary['trace']}")
+        return
+    if not args.kerml_file:
+        p.error('a KerML file or --batch is required')
+    json_path, csv_path, _ = convert_file(args.kerml_file, args.out_dir, args.format)
     print('Wrote', json_path, csv_path)
 
 
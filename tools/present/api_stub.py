@@ -1,6 +1,9 @@
+import sys
 from flask import Flask, jsonify
 from pathlib import Path
-import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from tools import yaml_io  # noqa: E402
 
 app = Flask(__name__)
 ROOT = Path(__file__).resolve().parents[2]
@@ -11,7 +14,7 @@ def get_example():
     if not meta.exists():
         return jsonify({'error': 'example meta not found'}), 404
     with open(meta, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+        data = yaml_io.safe_load(f)
     return jsonify(data)
 
 if __name__ == '__main__':
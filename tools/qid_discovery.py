@@ -11,14 +11,20 @@ import hashlib
 import json
 import re
 import sys
+import threading
 import time
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterable, List, Optional, Tuple, Union
 from urllib.parse import quote
 
 # Add chronograph-vault scripts to path for Wikidata search
 VAULT_SCRIPTS = Path(__file__).resolve().parent / 'external' / 'chronograph-vault' / '_scripts'
 sys.path.insert(0, str(VAULT_SCRIPTS))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from disk_cache import MISS, wikidata_cache
 
 try:
     import requests
@@ -43,16 +49,47 @@ def generate_synthetic_qid(entity_name: str, entity_type: str = "unknown", names
     return f"RW_{hash_value.upper()}"
 
 
-def search_wikidata_for_entity(entity_name: str, entity_type: str = None) -> Optional[str]:
+DEFAULT_DISCOVERY_WORKERS = 8
+DEFAULT_SEARCH_RATE = 10.0  # Wikidata search requests per second across all workers
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces calls at least 1/rate seconds apart."""
+
+    def __init__(self, rate_per_second: float):
+        self.interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def search_wikidata_for_entity(entity_name: str, entity_type: str = None,
+                               rate_limiter: Optional[RateLimiter] = None) -> Optional[str]:
     """Search Wikidata for potential QID matches.
     
     Args:
         entity_name: Name to search for
         entity_type: Optional type hint for better matching
+        rate_limiter: Optional limiter shared by concurrent callers
         
     Returns:
         QID if found, None otherwise
     """
+    # Results (including "no match") are cached on disk; see disk_cache.py
+    cache = wikidata_cache()
+    cache_key = f"search:{entity_name.lower().strip()}"
+    if cache is not None:
+        cached = cache.get(cache_key)
+        if cached is not MISS:
+            return cached
+
     if not requests:
         print("Warning: requests library not available, skipping Wikidata search", file=sys.stderr)
         return None
@@ -69,6 +106,8 @@ def search_wikidata_for_entity(entity_name: str, entity_type: str = None) -> Opt
             "limit": 5
         }
         
+        if rate_limiter is not None:
+            rate_limiter.acquire()
         response = requests.get(search_url, params=params, timeout=10)
         response.raise_for_status()
         
@@ -77,7 +116,11 @@ def search_wikidata_for_entity(entity_name: str, entity_type: str = None) -> Opt
         if "search" in data and data["search"]:
             # Return the first match - could be made smarter with type matching
             first_result = data["search"][0]
+            if cache is not None:
+                cache.set(cache_key, first_result["id"])
             return first_result["id"]
+        if cache is not None:
+            cache.set_miss(cache_key)
             
     except Exception as e:
         print(f"Warning: Wikidata search failed for '{entity_name}': {e}", file=sys.stderr)
@@ -86,20 +129,22 @@ def search_wikidata_for_entity(entity_name: str, entity_type: str = None) -> Opt
 
 
 def discover_or_create_identifier(entity_name: str, entity_type: str = "unknown", 
-                                 attempt_discovery: bool = True) -> Tuple[str, bool]:
+                                 attempt_discovery: bool = True,
+                                 rate_limiter: Optional[RateLimiter] = None) -> Tuple[str, bool]:
     """Discover QID or create synthetic identifier for an entity.
     
     Args:
         entity_name: Name of the entity
         entity_type: Type hint for better discovery
         attempt_discovery: Whether to try Wikidata search first
+        rate_limiter: Optional limiter shared by concurrent callers
         
     Returns:
         Tuple of (identifier, is_synthetic) where is_synthetic=True for synthetic IDs
     """
     if attempt_discovery:
         # First try to find it in Wikidata
-        qid = search_wikidata_for_entity(entity_name, entity_type)
+        qid = search_wikidata_for_entity(entity_name, entity_type, rate_limiter=rate_limiter)
         if qid:
             print(f"✓ Discovered QID {qid} for '{entity_name}'")
             return qid, False
@@ -110,6 +155,34 @@ def discover_or_create_identifier(entity_name: str, entity_type: str = "unknown"
     return synthetic_id, True
 
 
+def discover_identifiers_concurrently(entities: List[Dict[str, str]],
+                                      max_workers: int = DEFAULT_DISCOVERY_WORKERS,
+                                      requests_per_second: float = DEFAULT_SEARCH_RATE,
+                                      attempt_discovery: bool = True) -> List[Tuple[str, bool]]:
+    """Resolve many extracted entities at once on a bounded thread pool.
+    
+    Args:
+        entities: Dicts with 'name' and 'type' keys (see smart_entity_extraction)
+        max_workers: Maximum number of lookups in flight
+        requests_per_second: Rate limit shared by all workers
+        attempt_discovery: Whether to try Wikidata search first
+        
+    Returns:
+        (identifier, is_synthetic) tuples in the same order as ``entities``
+    """
+    if not entities:
+        return []
+    limiter = RateLimiter(requests_per_second)
+
+    def resolve(entity: Dict[str, str]) -> Tuple[str, bool]:
+        return discover_or_create_identifier(
+            entity["name"], entity["type"], attempt_discovery=attempt_discovery, rate_limiter=limiter
+        )
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(entities)))) as pool:
+        return list(pool.map(resolve, entities))
+
+
 def enrich_synthetic_entity(synthetic_id: str, entity_name: str, entity_type: str = "unknown") -> Dict:
     """Provide fallback enrichment for synthetic entities.
     
@@ -139,6 +212,166 @@ def enrich_synthetic_entity(synthetic_id: str, entity_name: str, entity_type: st
     }
 
 
+# Entity extraction: one pass over word tokens feeds two small state machines.
+# Compound phrases follow  Cap ((and|&|of|the) Cap)+ (Cap)*  and simple proper
+# nouns are runs of up to three capitalised words. Every word must be separated
+# from the next by whitespace only; anything else breaks the phrase.
+_TOKEN_RE = re.compile(r"\w+|&")
+_CAP_WORD_RE = re.compile(r"[A-Z][a-z]+")
+_CONNECTORS = frozenset({"and", "&", "of", "the"})
+_STOPWORDS = frozenset({"the", "this", "that", "when", "where", "why", "how", "what"})
+_ORGANIZATION_KEYWORDS = re.compile(r"railroad|railway|company|corp")
+_FACILITY_KEYWORDS = re.compile(r"station|depot|yard|bridge")
+_SIMPLE_ORGANIZATION_KEYWORDS = re.compile(r"company|corp|inc")
+
+_CAP, _CONN, _OTHER = 0, 1, 2
+
+
+class EntityExtractor:
+    """Streaming, single-pass proper-noun extractor used by smart_entity_extraction.
+
+    Feed text in chunks of any size and call ``close()`` for the entity list.
+    Memory is bounded by the number of candidate entities, not the text size.
+    Simple names that fall inside a compound phrase's span are dropped using a
+    sorted interval index over the compound spans.
+    """
+
+    def __init__(self):
+        self._buf = ""
+        self._offset = 0          # absolute offset of self._buf[0]
+        self._prev_end = None     # end of the previous token within self._buf
+        # compound phrase state: (start, [parts], end) of the confirmed phrase so far
+        self._c_phase = None      # None, "start", "conn0", "pairs", "conn", "tail"
+        self._c_start = 0
+        self._c_end = 0
+        self._c_parts = []
+        self._c_pending = []
+        # simple proper-noun state
+        self._s_start = 0
+        self._s_end = 0
+        self._s_parts = []
+        self._s_words = 0
+        self._compounds = []      # (start, end, name) in text order
+        self._simples = []
+
+    def feed(self, chunk: str) -> None:
+        self._buf += chunk
+        self._scan(final=False)
+
+    def close(self) -> List[Dict[str, str]]:
+        self._scan(final=True)
+        self._end_compound()
+        self._end_simple()
+        return self._entities()
+
+    def _scan(self, final: bool) -> None:
+        buf = self._buf
+        consumed = None
+        for m in _TOKEN_RE.finditer(buf):
+            if not final and m.end() == len(buf):
+                break  # the token may continue in the next chunk
+            word = m.group()
+            if word in _CONNECTORS:
+                kind = _CONN
+            elif _CAP_WORD_RE.fullmatch(word):
+                kind = _CAP
+            else:
+                kind = _OTHER
+            gap = buf[self._prev_end:m.start()] if self._prev_end is not None else None
+            adjacent = bool(gap) and gap.isspace()
+            start = self._offset + m.start()
+            self._step_compound(kind, word, gap, adjacent, start)
+            self._step_simple(kind, word, gap, adjacent, start)
+            self._prev_end = consumed = m.end()
+        if consumed is not None:
+            self._buf = buf[consumed:]
+            self._offset += consumed
+            self._prev_end = 0
+
+    def _step_compound(self, kind, word, gap, adjacent, start):
+        phase = self._c_phase
+        end = start + len(word)
+        if adjacent and phase is not None:
+            if kind == _CAP:
+                if phase in ("conn0", "conn"):
+                    self._c_parts += self._c_pending + [gap, word]
+                    self._c_pending = []
+                    self._c_end, self._c_phase = end, "pairs"
+                    return
+                if phase in ("pairs", "tail"):
+                    self._c_parts += [gap, word]
+                    self._c_end, self._c_phase = end, "tail"
+                    return
+            elif kind == _CONN and phase in ("start", "pairs"):
+                self._c_pending = [gap, word]
+                self._c_phase = "conn0" if phase == "start" else "conn"
+                return
+        self._end_compound()
+        if kind == _CAP:
+            self._c_phase, self._c_start, self._c_end, self._c_parts = "start", start, end, [word]
+
+    def _end_compound(self):
+        if self._c_phase in ("pairs", "conn", "tail"):
+            self._compounds.append((self._c_start, self._c_end, "".join(self._c_parts)))
+        self._c_phase = None
+        self._c_parts = []
+        self._c_pending = []
+
+    def _step_simple(self, kind, word, gap, adjacent, start):
+        if kind == _CAP and adjacent and 0 < self._s_words < 3:
+            self._s_parts += [gap, word]
+            self._s_end = start + len(word)
+            self._s_words += 1
+            return
+        self._end_simple()
+        if kind == _CAP:
+            self._s_start, self._s_end, self._s_parts, self._s_words = start, start + len(word), [word], 1
+
+    def _end_simple(self):
+        if self._s_words:
+            self._simples.append((self._s_start, self._s_end, "".join(self._s_parts), self._s_words))
+        self._s_parts = []
+        self._s_words = 0
+
+    def _entities(self) -> List[Dict[str, str]]:
+        entities = []
+        for _, _, name in self._compounds:
+            lower = name.lower()
+            entity_type = "organization"
+            if not _ORGANIZATION_KEYWORDS.search(lower) and _FACILITY_KEYWORDS.search(lower):
+                entity_type = "facility"
+            entities.append({"name": name, "type": entity_type})
+
+        # interval index over the (non-overlapping, ordered) compound spans
+        starts = [c[0] for c in self._compounds]
+        ends = [c[1] for c in self._compounds]
+        for start, end, name, words in self._simples:
+            idx = bisect_right(starts, start) - 1
+            if idx >= 0 and end <= ends[idx]:
+                continue  # already captured by a compound phrase
+            lower = name.lower()
+            if lower in _STOPWORDS or len(name) < 3:
+                continue
+            entity_type = "unknown"
+            if _FACILITY_KEYWORDS.search(lower):
+                entity_type = "facility"
+            elif words == 2 and all(len(word) > 2 for word in name.split()):
+                entity_type = "person"  # Two substantial words likely a person
+            elif _SIMPLE_ORGANIZATION_KEYWORDS.search(lower):
+                entity_type = "organization"
+            entities.append({"name": name, "type": entity_type})
+
+        # Remove duplicates and filter
+        seen = set()
+        unique_entities = []
+        for entity in entities:
+            key = entity["name"].lower()
+            if key not in seen and len(entity["name"]) > 2:
+                seen.add(key)
+                unique_entities.append(entity)
+        return unique_entities
+
+
 def smart_entity_extraction(text: str) -> List[Dict[str, str]]:
     """Extract potential entities from text for QID discovery.
     
@@ -148,68 +381,17 @@ def smart_entity_extraction(text: str) -> List[Dict[str, str]]:
     Returns:
         List of dicts with 'name' and 'type' keys
     """
-    entities = []
-    
-    # Multiple extraction strategies
-    
-    # Strategy 1: Multi-word proper noun phrases (organizations, places)
-    # Look for sequences like "Baltimore and Ohio Railroad"
-    compound_pattern = r'\b[A-Z][a-z]+(?:\s+(?:and|&|of|the)\s+[A-Z][a-z]+)+(?:\s+[A-Z][a-z]+)*\b'
-    compounds = re.findall(compound_pattern, text)
-    
-    for match in compounds:
-        match = match.strip()
-        entity_type = "organization"
-        if any(word in match.lower() for word in ['railroad', 'railway', 'company', 'corp']):
-            entity_type = "organization"
-        elif any(word in match.lower() for word in ['station', 'depot', 'yard', 'bridge']):
-            entity_type = "facility"
-        
-        entities.append({"name": match, "type": entity_type})
-    
-    # Strategy 2: Simple proper nouns (2-3 words max)
-    simple_pattern = r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,2}\b'
-    simples = re.findall(simple_pattern, text)
-    
-    for match in simples:
-        match = match.strip()
-        
-        # Skip if already captured by compound pattern
-        if any(match in compound for compound in compounds):
-            continue
-            
-        # Skip common words
-        if match.lower() in ['The', 'This', 'That', 'When', 'Where', 'Why', 'How', 'What']:
-            continue
-        if len(match) < 3:
-            continue
-            
-        # Type detection for simple patterns
-        entity_type = "unknown"
-        match_lower = match.lower()
-        words = match.split()
-        
-        if any(word in match_lower for word in ['station', 'depot', 'yard', 'bridge']):
-            entity_type = "facility"
-        elif len(words) == 2 and all(len(word) > 2 for word in words):
-            entity_type = "person"  # Two substantial words likely a person
-        elif any(word in match_lower for word in ['company', 'corp', 'inc']):
-            entity_type = "organization"
-        
-        entities.append({"name": match, "type": entity_type})
-    
-    # Remove duplicates and filter
-    seen = set()
-    unique_entities = []
-    
-    for entity in entities:
-        # Normalize for deduplication
-        key = entity["name"].lower().strip()
-        if key not in seen and len(entity["name"]) > 2:
-            seen.add(key)
-            unique_entities.append(entity)
-    
-    return unique_entities
+    extractor = EntityExtractor()
+    extractor.feed(text)
+    return extractor.close()
+
+
+def extract_entities_from_chunks(chunks: Iterable[str]) -> List[Dict[str, str]]:
+    """Streaming variant of smart_entity_extraction for large bodies of text."""
+    extractor = EntityExtractor()
+    for chunk in chunks:
+        extractor.feed(chunk)
+    return extractor.close()
 
 
 def process_mixed_identifiers(identifiers: List[str], entity_data: Dict[str, Dict] = None) -> Dict:
@@ -247,24 +429,28 @@ def process_mixed_identifiers(identifiers: List[str], entity_data: Dict[str, Dic
     return results
 
 
-def enhance_artifact_with_smart_discovery(artifact_path: str, auto_discover: bool = True) -> str:
+def enhance_artifact_with_smart_discovery(artifact_path: str, auto_discover: bool = True,
+                                          max_workers: int = DEFAULT_DISCOVERY_WORKERS) -> str:
     """Enhance an artifact by discovering QIDs and creating synthetic IDs as needed.
     
     Args:
         artifact_path: Path to the artifact file
         auto_discover: Whether to automatically discover entities from text
+        max_workers: Concurrent Wikidata lookups while resolving entities
         
     Returns:
         Path to enhanced artifact with discovered/synthetic identifiers
     """
-    from artifact_to_jsonld import load_front_matter
+    from artifact_to_jsonld import load_artifact
+    from tools import yaml_io
     
     artifact = Path(artifact_path)
     if not artifact.exists():
         raise FileNotFoundError(f"Artifact not found: {artifact_path}")
     
-    # Load current front-matter and body
-    fm, body = load_front_matter(artifact)
+    # Load current front-matter (cached); the body is only read when needed
+    doc = load_artifact(artifact)
+    fm = doc.data
     
     # Get existing QIDs
     existing_qids = fm.get("wikidata_qids", [])
@@ -273,18 +459,15 @@ def enhance_artifact_with_smart_discovery(artifact_path: str, auto_discover: boo
     discovered_entities = []
     if auto_discover:
         # Extract from title, description, and body
-        search_text = f"{fm.get('title', '')} {fm.get('description', '')} {body}"
+        search_text = f"{fm.get('title', '')} {fm.get('description', '')} {doc.body}"
         discovered_entities = smart_entity_extraction(search_text)
     
     # Discover or create identifiers for new entities
     all_identifiers = existing_qids.copy()
     entity_metadata = {}
     
-    for entity in discovered_entities:
-        identifier, is_synthetic = discover_or_create_identifier(
-            entity["name"], entity["type"], attempt_discovery=True
-        )
-        
+    resolved = discover_identifiers_concurrently(discovered_entities, max_workers=max_workers)
+    for entity, (identifier, is_synthetic) in zip(discovered_entities, resolved):
         if identifier not in all_identifiers:
             all_identifiers.append(identifier)
             entity_metadata[identifier] = entity
@@ -302,10 +485,9 @@ def enhance_artifact_with_smart_discovery(artifact_path: str, auto_discover: boo
         
         # Reconstruct file with updated front-matter
         yaml_content = "---\n"
-        import yaml
-        yaml_content += yaml.dump(fm, default_flow_style=False, allow_unicode=True)
+        yaml_content += yaml_io.safe_dump(fm, default_flow_style=False, allow_unicode=True)
         yaml_content += "---\n\n"
-        yaml_content += body
+        yaml_content += doc.body
         
         enhanced_path.write_text(yaml_content, encoding='utf-8')
         print(f"Enhanced artifact written to {enhanced_path}")
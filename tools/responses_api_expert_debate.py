@@ -5,6 +5,12 @@ Enhancements:
 - Centralised model / org / project configuration (override via env vars)
 - Multi-round persona debate with contextual critiques
 - Robust response parsing with code-fence removal and schema normalisation
+- Token-budgeted debate context: each expert's latest position plus what
+  changed in recent rounds, summarised once per round and sized so prompts
+  stay within RESPONSES_PROMPT_MAX_TOKENS (approximated as 4 characters per
+  token); the problem statement and response instructions are never cut
+- Convergence-based early exit: stable experts are skipped and the debate ends
+  once no expert's position is still drifting
 """
 
 from __future__ import annotations
@@ -12,17 +18,25 @@ from __future__ import annotations
 import json
 import os
 import re
+import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools import llm_cache  # noqa: E402
+from tools.debate.convergence import ConvergenceTracker  # noqa: E402
+
 DEFAULT_MODEL = os.getenv("OPENAI_RESPONSES_MODEL", "gpt-4.1-nano-2025-04-14")
 ORGANIZATION_ID = os.getenv("OPENAI_ORG_ID", "org-Wjv8zEw9hES0hFwnpZxOoDEm")
 PROJECT_ID = os.getenv("OPENAI_PROJECT_ID", "proj_zsBBVeSxc1MunoV5yGAVAgih")
 MAX_ROUNDS = max(1, int(os.getenv("RESPONSES_DEBATE_ROUNDS", "3")))
 SUMMARY_MAX_ITEMS = 330
 SUMMARY_MAX_CHARS = 1000
+CHARS_PER_TOKEN = 4
+PROMPT_MAX_TOKENS = int(os.getenv("RESPONSES_PROMPT_MAX_TOKENS", "4000"))
+HISTORY_ROUNDS = 2
 
 REQUIRED_FIELDS = {
     "expert": "",
@@ -146,6 +160,105 @@ def summarise_analysis(analysis: Dict[str, object]) -> str:
     return " | ".join(snippets)
 
 
+def _item_key(item: object) -> str:
+    return " ".join(str(item).lower().split())
+
+
+def _clip(text: str, limit: int) -> str:
+    if len(text) <= limit:
+        return text
+    return text[: max(0, limit - 3)] + "..."
+
+
+def _unique_items(items: List[object]) -> List[object]:
+    seen: set = set()
+    unique = []
+    for item in items:
+        item_key = _item_key(item)
+        if item_key and item_key not in seen:
+            seen.add(item_key)
+            unique.append(item)
+    return unique
+
+
+class DebateContextBuilder:
+    """Incrementally summarised, size-capped debate history for prompts.
+
+    ``add()`` summarises each analysis once into two parts: the expert's
+    current position (all of its concerns and recommendations, with repeats
+    within it removed) and the round's delta (only items the expert had not
+    raised before). ``render()`` shows every expert's latest position and the
+    deltas of the last ``history_rounds`` rounds, cached per budget and
+    trimmed so it never exceeds ``max_chars``; standing concerns therefore
+    stay in the context however long the debate runs.
+    """
+
+    def __init__(self, history_rounds: int = HISTORY_ROUNDS) -> None:
+        self.history_rounds = history_rounds
+        self.positions: Dict[str, str] = {}
+        self.summaries: Dict[str, List[str]] = {}
+        self._seen: Dict[str, set] = {}
+        self._rendered: Dict[int, str] = {}
+
+    @classmethod
+    def from_history(cls, history: Dict[str, List[Dict[str, object]]]) -> "DebateContextBuilder":
+        builder = cls()
+        for name, records in history.items():
+            for record in records:
+                if record.get("status") != "error":
+                    builder.add(name, record)
+        return builder
+
+    def add(self, expert_name: str, analysis: Dict[str, object]) -> str:
+        """Record one round's analysis; returns that round's delta summary."""
+        seen = self._seen.setdefault(expert_name, set())
+        position = dict(analysis)
+        delta = dict(analysis)
+        for key in ("key_concerns", "recommendations"):
+            items = _unique_items(analysis.get(key) or [])
+            position[key] = items
+            delta[key] = [item for item in items if _item_key(item) not in seen]
+            seen.update(_item_key(item) for item in items)
+        self.positions[expert_name] = summarise_analysis(position)
+        if (position["key_concerns"] or position["recommendations"]) and not (
+            delta["key_concerns"] or delta["recommendations"]
+        ):
+            summary = "No new concerns or recommendations."
+        else:
+            summary = summarise_analysis(delta)
+        self.summaries.setdefault(expert_name, []).append(summary)
+        self._rendered.clear()
+        return summary
+
+    def render(self, max_chars: int) -> str:
+        """Return the context lines for the recorded history within ``max_chars``."""
+        cached = self._rendered.get(max_chars)
+        if cached is not None:
+            return cached
+
+        experts = [name for name, summaries in self.summaries.items() if summaries]
+        # blocks are joined by blank lines, which count against the budget too
+        per_expert = max(0, max_chars - 2 * (len(experts) - 1)) // len(experts) if experts else 0
+        blocks: List[str] = []
+        for name in experts:
+            summaries = self.summaries[name]
+            # round 1's delta is the whole position, which is shown anyway
+            start_round = max(2, len(summaries) - self.history_rounds + 1)
+            deltas = [
+                f"Round {idx} changes: {summaries[idx - 1]}" for idx in range(start_round, len(summaries) + 1)
+            ]
+            head = f"- {name}: \n  Position (round {len(summaries)}): {self.positions[name]}"
+            block = "\n  ".join([head] + deltas)
+            # drop older deltas first, then clip what is left (the position comes first)
+            while len(block) > per_expert and deltas:
+                deltas.pop(0)
+                block = "\n  ".join([head] + deltas)
+            blocks.append(_clip(block, per_expert))
+        rendered = "\n\n".join(b for b in blocks if b)
+        self._rendered[max_chars] = rendered
+        return rendered
+
+
 @dataclass
 class ResponsesAPIExpert:
     """Expert agent wrapper for the Responses API debate."""
@@ -154,14 +267,20 @@ class ResponsesAPIExpert:
     role_description: str
     client: object
     model: str
+    max_prompt_chars: int = PROMPT_MAX_TOKENS * CHARS_PER_TOKEN
+    last_prompt_bytes: int = field(default=0, init=False)
 
-    def analyze_problem(
+    def build_prompt(
         self,
         problem_statement: str,
         round_number: int,
-        history: Dict[str, List[Dict[str, object]]],
-    ) -> Dict[str, object]:
-        """Run analysis for the given round and history."""
+        context_builder: DebateContextBuilder,
+    ) -> str:
+        """Assemble the round prompt, fitting the history context into the size cap.
+
+        Only the history block is trimmed to ``max_prompt_chars``; the role,
+        problem statement and response instructions are always sent in full.
+        """
         prompt_parts: List[str] = [
             f"You are {self.role_description}.",
             f"This is round {round_number} of a multi-expert debate.",
@@ -173,34 +292,51 @@ class ResponsesAPIExpert:
             prompt_parts.append(
                 "Initial task: provide a rigorous, implementable analysis covering the requested JSON fields."
             )
-        else:
-            prompt_parts.append("Context from previous rounds (summaries):")
-            for name, records in history.items():
-                if not records:
-                    continue
-                recent_records = records[-2:]
-                start_round = len(records) - len(recent_records) + 1
-                summaries: List[str] = []
-                for idx, record in enumerate(recent_records, start=start_round):
-                    summaries.append(f"Round {idx}: {summarise_analysis(record)}")
-                if summaries:
-                    prompt_parts.append(f"- {name}: \n  " + "\n  ".join(summaries))
+            return "\n\n".join(prompt_parts)
 
-            prompt_parts.append(
-                "In this round you must critique gaps, resolve conflicts, and evolve your position based on the context above. Reference other experts explicitly when agreeing or disagreeing. Suggest improvements for other personas and express requirements as SysML requirement blocks so the Project Manager and Architect can act on them."
-            )
+        prompt_parts.append("Context from previous rounds (summaries):")
+        closing = [
+            "In this round you must critique gaps, resolve conflicts, and evolve your position based on the context above. Reference other experts explicitly when agreeing or disagreeing. Suggest improvements for other personas and express requirements as SysML requirement blocks so the Project Manager and Architect can act on them.",
+            "Respond strictly in JSON with the schema described. Do not include markdown code fences or commentary.",
+        ]
+        fixed = len("\n\n".join(prompt_parts + closing)) + 2
+        context = context_builder.render(max(0, self.max_prompt_chars - fixed))
+        if context:
+            prompt_parts.append(context)
+        return "\n\n".join(prompt_parts + closing)
 
-            prompt_parts.append(
-                "Respond strictly in JSON with the schema described. Do not include markdown code fences or commentary."
-            )
+    def analyze_problem(
+        self,
+        problem_statement: str,
+        round_number: int,
+        history: Dict[str, List[Dict[str, object]]],
+        context_builder: Optional[DebateContextBuilder] = None,
+    ) -> Dict[str, object]:
+        """Run analysis for the given round and history.
 
-        expert_input = "\n\n".join(prompt_parts)
+        Pass the debate's shared ``context_builder`` to reuse summaries across
+        rounds; otherwise one is built from ``history``.
+        """
+        if context_builder is None:
+            context_builder = DebateContextBuilder.from_history(history)
+        expert_input = self.build_prompt(problem_statement, round_number, context_builder)
+        self.last_prompt_bytes = len(expert_input.encode("utf-8"))
 
-        try:
+        def call() -> str:
             response = self.client.responses.create(model=self.model, input=expert_input)
             response_text = getattr(response, "output_text", "") or ""
             if not response_text:
                 raise RuntimeError("Empty response from Responses API")
+            return response_text
+
+        try:
+            response_text = llm_cache.cached_call(
+                self.model,
+                expert_input,
+                call,
+                # fallback parses are not cached, so they are retried next run
+                validate=lambda text: parse_response(self.expert_name, text)["parse_status"] == "success",
+            )
         except Exception as exc:  # pragma: no cover
             return {
                 "expert": self.expert_name,
@@ -212,7 +348,73 @@ class ResponsesAPIExpert:
         return parse_response(self.expert_name, response_text)
 
 
-def run_responses_api_debate(max_rounds: int = MAX_ROUNDS) -> bool:
+def run_debate_rounds(
+    experts: List[ResponsesAPIExpert],
+    problem_statement: str,
+    max_rounds: int = MAX_ROUNDS,
+    early_exit: bool = True,
+) -> Dict[str, object]:
+    """Run up to ``max_rounds`` debate rounds; return rounds, prompt report and convergence.
+
+    With ``early_exit``, experts whose positions stabilised are skipped (their
+    last analysis is carried forward) and the debate stops once all are stable.
+    """
+    analysis_history: Dict[str, List[Dict[str, object]]] = {expert.expert_name: [] for expert in experts}
+    rounds: List[Dict[str, object]] = []
+    context_builder = DebateContextBuilder()
+    tracker = ConvergenceTracker()
+    prompt_report: List[Dict[str, object]] = []
+    names = [expert.expert_name for expert in experts]
+
+    for round_number in range(1, max_rounds + 1):
+        if early_exit and tracker.converged(names):
+            print(f"[INFO] All expert positions stable after round {round_number - 1}; stopping early")
+            break
+        print(f"\n--- Round {round_number} ---")
+        round_payload: Dict[str, Dict[str, object]] = {}
+        prompt_bytes: Dict[str, int] = {}
+        ran: Dict[str, Dict[str, object]] = {}
+        skipped: List[str] = []
+
+        for expert in experts:
+            if early_exit and tracker.is_stable(expert.expert_name):
+                round_payload[expert.expert_name] = tracker.last_position(expert.expert_name)
+                skipped.append(expert.expert_name)
+                print(f"[INFO] {expert.expert_name} stable, skipped")
+                continue
+            analysis = expert.analyze_problem(problem_statement, round_number, analysis_history, context_builder)
+            round_payload[expert.expert_name] = ran[expert.expert_name] = analysis
+            prompt_bytes[expert.expert_name] = expert.last_prompt_bytes
+
+            if analysis.get("status") == "error":
+                print(f"[WARN] {expert.expert_name} error: {analysis.get('error', 'Unknown error')}")
+            else:
+                print(f"[INFO] {expert.expert_name} analysis complete (status={analysis.get('parse_status')})")
+
+            analysis_history[expert.expert_name].append(analysis)
+            if analysis.get("status") != "error":
+                context_builder.add(expert.expert_name, analysis)
+
+        drift = tracker.update(round_number, ran)
+        rounds.append({
+            "round": round_number,
+            "analyses": round_payload,
+            "prompt_bytes": prompt_bytes,
+            "skipped": skipped,
+            "drift": drift,
+        })
+        prompt_report.append({
+            "round": round_number,
+            "total_bytes": sum(prompt_bytes.values()),
+            "max_bytes": max(prompt_bytes.values(), default=0),
+        })
+        print(f"[INFO] Round {round_number} prompt bytes: total={prompt_report[-1]['total_bytes']} "
+              f"max={prompt_report[-1]['max_bytes']}")
+
+    return {"rounds": rounds, "prompt_report": prompt_report, "convergence": tracker.history}
+
+
+def run_responses_api_debate(max_rounds: int = MAX_ROUNDS, early_exit: bool = True) -> bool:
     """Execute a multi-round expert debate using the Responses API."""
     print("=== Expert Debate: Responses API Pattern ===")
 
@@ -279,25 +481,9 @@ def run_responses_api_debate(max_rounds: int = MAX_ROUNDS) -> bool:
     for expert in experts:
         print(f"  - {expert.expert_name}")
 
-    analysis_history: Dict[str, List[Dict[str, object]]] = {expert.expert_name: [] for expert in experts}
-    rounds: List[Dict[str, object]] = []
-
-    for round_number in range(1, max_rounds + 1):
-        print(f"\n--- Round {round_number} ---")
-        round_payload: Dict[str, Dict[str, object]] = {}
-
-        for expert in experts:
-            analysis = expert.analyze_problem(problem_statement, round_number, analysis_history)
-            round_payload[expert.expert_name] = analysis
-
-            if analysis.get("status") == "error":
-                print(f"[WARN] {expert.expert_name} error: {analysis.get('error', 'Unknown error')}")
-            else:
-                print(f"[INFO] {expert.expert_name} analysis complete (status={analysis.get('parse_status')})")
-
-            analysis_history[expert.expert_name].append(analysis)
-
-        rounds.append({"round": round_number, "analyses": round_payload})
+    cache_before = llm_cache.stats()
+    debate = run_debate_rounds(experts, problem_statement, max_rounds, early_exit=early_exit)
+    rounds = debate["rounds"]
 
     final_round_analyses = rounds[-1]["analyses"] if rounds else {}
 
@@ -309,6 +495,9 @@ def run_responses_api_debate(max_rounds: int = MAX_ROUNDS) -> bool:
         "api_type": "responses_api",
         "model_used": DEFAULT_MODEL,
         "max_rounds": max_rounds,
+        "llm_cache": llm_cache.stats_since(cache_before),
+        "prompt_report": debate["prompt_report"],
+        "convergence": debate["convergence"],
     }
 
     results_file = Path("docs/Responses_API_Expert_Debate_Results.json")
@@ -318,6 +507,7 @@ def run_responses_api_debate(max_rounds: int = MAX_ROUNDS) -> bool:
     print("\n=== Debate Summary ===")
     print(f"Rounds: {len(rounds)}")
     print(f"Experts: {len(experts)}")
+    print(f"LLM cache: {results['llm_cache']}")
     print(f"Results file: {results_file}")
 
     return True
@@ -0,0 +1,134 @@
+"""Shared registry of compiled JSON Schema validators.
+
+``jsonschema.validate(instance, schema)`` re-checks the schema and builds a new
+validator on every call. The validation entry points (ingest pipeline,
+provenance/intake validators, metadata validator, create_run API) go through
+this module instead so each schema is loaded, checked and compiled once per
+process and the validator is reused for every instance.
+
+Schemas can be referenced by file name (resolved under ``schema/``), by path,
+or passed as an already-loaded dict. File-backed validators are keyed by
+resolved path and mtime, so editing a schema picks up the new version.
+Inline dicts are keyed by a hash of their canonical JSON in a bounded LRU, so
+equal schemas share a validator and a mutated dict gets a fresh one.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple, Union
+
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+SCHEMA_DIR = Path(__file__).resolve().parents[1] / "schema"
+
+SchemaRef = Union[str, Path, dict]
+
+_LOCK = threading.Lock()
+# resolved path -> (mtime_ns, schema dict, validator)
+_FILE_CACHE: Dict[Path, Tuple[int, dict, Any]] = {}
+INLINE_MAX_ENTRIES = 64
+# sha256 of the schema's canonical JSON -> validator, least recently used first
+_INLINE_CACHE: "OrderedDict[str, Any]" = OrderedDict()
+_STATS = {"builds": 0, "hits": 0}
+
+
+def resolve_schema_path(schema: Union[str, Path]) -> Path:
+    """Resolve a schema reference to an absolute path.
+
+    Absolute paths are used as-is. A relative reference names a file under the
+    repo's ``schema/`` when one exists there, whatever the working directory;
+    otherwise it is taken relative to the working directory.
+    """
+    path = Path(schema)
+    if not path.is_absolute() and (SCHEMA_DIR / path).exists():
+        path = SCHEMA_DIR / path
+    return path.resolve()
+
+
+def _schema_key(schema: dict) -> str:
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _remember_inline(key: str, validator) -> None:
+    """Store an inline validator, evicting the least recently used; hold ``_LOCK``."""
+    _INLINE_CACHE[key] = validator
+    _INLINE_CACHE.move_to_end(key)
+    while len(_INLINE_CACHE) > INLINE_MAX_ENTRIES:
+        _INLINE_CACHE.popitem(last=False)
+
+
+def _compile(schema: dict):
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    _STATS["builds"] += 1
+    return cls(schema)
+
+
+def _file_entry(path: Path) -> Tuple[dict, Any]:
+    mtime = path.stat().st_mtime_ns
+    with _LOCK:
+        cached = _FILE_CACHE.get(path)
+        if cached and cached[0] == mtime:
+            _STATS["hits"] += 1
+            return cached[1], cached[2]
+        schema = json.loads(path.read_text(encoding="utf-8"))
+        validator = _compile(schema)
+        _FILE_CACHE[path] = (mtime, schema, validator)
+        # callers that load_schema() and pass the dict back reuse the same validator
+        _remember_inline(_schema_key(schema), validator)
+        return schema, validator
+
+
+def load_schema(schema: Union[str, Path]) -> dict:
+    """Return the parsed schema for a name or path (cached, do not mutate)."""
+    return _file_entry(resolve_schema_path(schema))[0]
+
+
+def get_validator(schema: SchemaRef):
+    """Return a compiled validator for a schema name, path or dict."""
+    if isinstance(schema, dict):
+        key = _schema_key(schema)
+        with _LOCK:
+            validator = _INLINE_CACHE.get(key)
+            if validator is not None:
+                _INLINE_CACHE.move_to_end(key)
+                _STATS["hits"] += 1
+                return validator
+            validator = _compile(schema)
+            _remember_inline(key, validator)
+            return validator
+    return _file_entry(resolve_schema_path(schema))[1]
+
+
+def iter_errors(instance: Any, schema: SchemaRef) -> Iterator[ValidationError]:
+    return get_validator(schema).iter_errors(instance)
+
+
+def validate(instance: Any, schema: SchemaRef) -> None:
+    """Drop-in for ``jsonschema.validate`` using the cached validator.
+
+    Raises the same best-match ``ValidationError`` jsonschema would.
+    """
+    error = best_match(iter_errors(instance, schema))
+    if error is not None:
+        raise error
+
+
+def cache_info() -> dict:
+    """Return counters: validators built, cache hits and cached schemas."""
+    with _LOCK:
+        return dict(_STATS, files=len(_FILE_CACHE), inline=len(_INLINE_CACHE))
+
+
+def clear_cache() -> None:
+    with _LOCK:
+        _FILE_CACHE.clear()
+        _INLINE_CACHE.clear()
+        _STATS.update(builds=0, hits=0)
@@ -7,15 +7,14 @@ import sys
 import json
 from pathlib import Path
 
-import yaml
-from jsonschema import validate, Draft7Validator
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools import schema_registry, yaml_io  # noqa: E402
 
 SCHEMA_PATH = Path(__file__).resolve().parents[1] / 'schema' / 'intake_artifact.schema.json'
 
 
 def load_schema(path=SCHEMA_PATH):
-    with open(path, 'r', encoding='utf8') as f:
-        return json.load(f)
+    return schema_registry.load_schema(path)
 
 
 def load_artifact(path: Path):
@@ -23,7 +22,7 @@ def load_artifact(path: Path):
         text = f.read()
     # Try YAML first (front-matter + body or full YAML)
     try:
-        doc = yaml.safe_load(text)
+        doc = yaml_io.safe_load(text)
         if isinstance(doc, dict):
             return doc
     except Exception:
@@ -41,8 +40,7 @@ def main():
         sys.exit(2)
     p = Path(sys.argv[1])
     artifact = load_artifact(p)
-    schema = load_schema()
-    validator = Draft7Validator(schema)
+    validator = schema_registry.get_validator(SCHEMA_PATH)
     errors = sorted(validator.iter_errors(artifact), key=lambda e: e.path)
     if errors:
         print('Validation failed:')
@@ -8,37 +8,35 @@ Usage: python tools/validate_provenance.py --schema provenance.schema.json file1
 Exits 0 if all files validate, non-zero otherwise.
 """
 import argparse
-import json
 import sys
 from pathlib import Path
 
-import yaml
-from jsonschema import validate, ValidationError
+from jsonschema import ValidationError
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools import front_matter, schema_registry, yaml_io  # noqa: E402
 
 
 def load_schema(schema_name: str) -> dict:
-    base = Path(__file__).resolve().parents[1] / "schema"
-    path = base / schema_name
+    path = schema_registry.SCHEMA_DIR / schema_name
     if not path.exists():
         raise SystemExit(f"Schema not found: {path}")
-    return json.loads(path.read_text(encoding="utf-8"))
+    return schema_registry.load_schema(path)
 
 
 def extract_candidate_data(path: Path):
-    text = path.read_text(encoding="utf-8")
     if path.suffix in (".yml", ".yaml", ".json"):
         try:
-            return yaml.safe_load(text)
+            return yaml_io.safe_load(path.read_text(encoding="utf-8"))
         except Exception:
             return None
     if path.suffix in (".md", ".markdown"):
-        if text.startswith("---"):
-            parts = text.split("---", 2)
-            if len(parts) >= 3:
-                try:
-                    return yaml.safe_load(parts[1])
-                except Exception:
-                    return None
+        # only the front-matter block is read; the Markdown body is never loaded
+        try:
+            doc = front_matter.read_front_matter(path)
+        except Exception:
+            return None
+        return doc.data if doc is not None else None
     return None
 
 
@@ -47,7 +45,7 @@ def validate_file(path: Path, schema: dict):
     if data is None:
         return False, "no YAML/JSON content found"
     try:
-        validate(instance=data, schema=schema)
+        schema_registry.validate(data, schema)
         return True, None
     except ValidationError as e:
         return False, str(e)
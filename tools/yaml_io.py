@@ -0,0 +1,44 @@
+"""Central YAML loading and dumping.
+
+Uses PyYAML's libyaml bindings (``CSafeLoader`` / ``CSafeDumper``) when PyYAML
+was built with them, and the pure-Python ``SafeLoader`` / ``SafeDumper``
+otherwise. Both are safe loaders, so results match ``yaml.safe_load``; the C
+loader is several times faster on the intake corpus (see
+``python -m tools.bench.bench_yaml_load``).
+
+Usage:
+    from tools import yaml_io
+    data = yaml_io.safe_load(text_or_stream)
+    text = yaml_io.safe_dump(data, sort_keys=False)
+"""
+from pathlib import Path
+
+import yaml
+
+YAMLError = yaml.YAMLError
+
+try:
+    Loader = yaml.CSafeLoader
+    Dumper = yaml.CSafeDumper
+    HAS_LIBYAML = True
+except AttributeError:  # PyYAML built without libyaml
+    Loader = yaml.SafeLoader
+    Dumper = yaml.SafeDumper
+    HAS_LIBYAML = False
+
+
+def safe_load(stream):
+    return yaml.load(stream, Loader=Loader)
+
+
+def safe_load_all(stream):
+    return yaml.load_all(stream, Loader=Loader)
+
+
+def load_file(path, encoding='utf-8'):
+    with Path(path).open('r', encoding=encoding) as fh:
+        return safe_load(fh)
+
+
+def safe_dump(data, stream=None, **kwargs):
+    return yaml.dump(data, stream, Dumper=Dumper, **kwargs)
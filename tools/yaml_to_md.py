@@ -7,7 +7,9 @@ Outputs Markdown to stdout.
 """
 import sys
 from pathlib import Path
-import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+from tools import yaml_io  # noqa: E402
 
 
 def to_md(obj, indent=0):
@@ -45,7 +47,7 @@ def main():
 
     try:
         with path.open('r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml_io.safe_load(f)
     except Exception as e:
         print(f"Error reading YAML: {e}", file=sys.stderr)
         sys.exit(2)